@@ -1,16 +1,30 @@
 import os
-import subprocess
-import tempfile
 import io
-from flask import Flask, render_template, request, send_file, redirect, url_for, flash
+import json
+import time
+import uuid
+from flask import Flask, Response, render_template, request, send_file, redirect, url_for, flash, make_response, stream_with_context
 from flask_login import LoginManager, login_user, logout_user, login_required, current_user
 from google import genai
 from database import create_app, init_db, seed_db
+from celery_app import make_celery
+from services.tailoring_cache import make_tailoring_cache
+from services.pdf_service import make_compile_executor, CompileQueueFull
+from services.latex_sanitizer import LatexSanitizer, sanitize_latex
+from services.latex_sections import section_index
+from services.tailoring_metrics import TailoringMetrics
+from services.metric_counters import make_counters
+from services.job_index_service import JobKeywordIndex
+from services.visa_sponsorship_service import VisaSponsorshipLookup
+from services.corpus_statistics import CorpusStatisticsStore
 from models import db, User
 
 # Create Flask app using factory pattern
 app = create_app()
 
+# Celery instance for background jobs (run workers with `celery -A app.celery worker`)
+celery = make_celery(app)
+
 # Configure Flask-Login
 login_manager = LoginManager()
 login_manager.init_app(app)
@@ -20,153 +34,277 @@ login_manager.login_message_category = 'info'
 
 @login_manager.user_loader
 def load_user(user_id):
-    return User.query.get(int(user_id))
+    # Session.get goes through the identity map, so later lookups of the same
+    # user during this request are answered without another query
+    return db.session.get(User, int(user_id))
 
 # Configure the Gemini client
 client = genai.Client(api_key=app.config['GOOGLE_API_KEY'])
 
-def fix_latex_characters(latex_content):
-    """Fix common LaTeX character escaping issues."""
-    import re
-    
-    # Don't escape ampersands that are already part of LaTeX commands or in tabular environments
-    # Only escape standalone ampersands that appear in regular text
-    
-    # First, protect existing LaTeX commands and table structures
-    protected_patterns = [
-        r'\\&',  # Already escaped ampersands
-        r'&\s*\\\\',  # Table row separators
-        r'&\s*\}',  # Table cell endings
-        r'\{\s*&',  # Table cell beginnings
-        r'\\begin\{tabular\}.*?\\end\{tabular\}',  # Entire tabular environments
-        r'\\begin\{array\}.*?\\end\{array\}',  # Array environments
-    ]
-    
-    # Temporarily replace protected patterns with placeholders
-    placeholders = {}
-    for i, pattern in enumerate(protected_patterns):
-        placeholder = f"__PROTECTED_{i}__"
-        matches = re.findall(pattern, latex_content, re.DOTALL)
-        for j, match in enumerate(matches):
-            specific_placeholder = f"{placeholder}_{j}"
-            placeholders[specific_placeholder] = match
-            latex_content = latex_content.replace(match, specific_placeholder, 1)
-    
-    # Now escape standalone ampersands in regular text
-    # Look for ampersands that are not part of LaTeX syntax
-    latex_content = re.sub(r'(?<!\\)&(?!\s*\\\\)(?!\s*\})', r'\\&', latex_content)
-    
-    # Restore protected patterns
-    for placeholder, original in placeholders.items():
-        latex_content = latex_content.replace(placeholder, original)
-    
-    # Fix other common LaTeX special characters that might cause issues
-    # Only escape if not already escaped
-    latex_content = re.sub(r'(?<!\\)%(?![^{]*\})', r'\\%', latex_content)  # Percent signs
-    latex_content = re.sub(r'(?<!\\)\$(?![^{]*\})', r'\\$', latex_content)  # Dollar signs (outside math mode)
-    
-    # Fix encoding issues - ensure proper UTF-8 handling
-    try:
-        # Encode to UTF-8 and decode back to ensure proper encoding
-        latex_content = latex_content.encode('utf-8', errors='replace').decode('utf-8')
-    except UnicodeError:
-        # If there are still encoding issues, replace problematic characters
-        latex_content = latex_content.encode('ascii', errors='replace').decode('ascii')
-    
-    return latex_content
-
-def remove_latex_comments(latex_content):
-    """Remove LaTeX comments from the content."""
-    import re
-    
-    # Remove specific comment patterns that appear in LaTeX resumes
-    # Handle both escaped (\%) and unescaped (%) comments
-    
-    # Remove common comment patterns
-    comment_patterns = [
-        r'\\?%\s*Clear all header and footer fields',
-        r'\\?%\s*Adjust margins',
-        r'\\?%\s*Sections formatting',
-        r'\\?%\s*Ensure that generate PDF is machine readable/ATS parsable',
-        r'\\?%\s*Custom commands',
-        r'\\?%\s*CV STARTS HERE',
-        r'\\?%\s*HEADING',
-        r'\\?%\s*SUMMARY',
-        r'\\?%\s*EDUCATION',
-        r'\\?%\s*EXPERIENCE',
-        r'\\?%\s*PROJECTS',
-        r'\\?%\s*SKILLS',
-        r'\\?%\s*[-\-]+.*?[-\-]+',  # Decorative comment lines
-        r'\\?%\s*[A-Za-z\s\-]+\s*\\',  # Comments followed by backslash
-    ]
-    
-    # Apply all comment removal patterns
-    for pattern in comment_patterns:
-        latex_content = re.sub(pattern, '', latex_content, flags=re.IGNORECASE)
-    
-    # Remove lines that are purely comments (start with % or \% after optional whitespace)
-    lines = latex_content.split('\n')
-    cleaned_lines = []
-    
-    for line in lines:
-        # Skip lines that are purely comments
-        if re.match(r'^\s*\\?%', line):
-            continue
-        
-        # Remove any remaining inline comments at the end of lines
-        line = re.sub(r'\\?%[^}]*$', '', line)
-        
-        # Keep the line (even if it's now empty, to preserve structure)
-        cleaned_lines.append(line.rstrip())
+GEMINI_MODEL = 'models/gemini-2.0-flash'
+
+# Bump whenever the tailoring prompt or post-processing changes to invalidate cached results
+TAILORING_PROMPT_VERSION = 2
+
+# Cache of tailored LaTeX keyed by model, prompt version, resume and job description
+tailoring_cache = make_tailoring_cache(app.config)
+
+# Token and latency totals per tailoring mode, shared with the Celery worker
+tailoring_metrics = TailoringMetrics(make_counters(app.config['TAILORING_METRICS_BACKEND'], 'tailoring',
+                                                  app.config['TAILORING_METRICS_REDIS_URL']))
+
+# Bounded pdflatex pool that serves identical documents from the compiled-PDF cache
+pdf_executor = make_compile_executor(app.config)
+
+# In-memory keyword bitmaps over job postings, reloaded from job_posting_keywords when stale
+job_keyword_index = JobKeywordIndex(refresh_seconds=app.config['JOB_KEYWORD_INDEX_REFRESH'])
+
+# Sponsorship history by normalized company name, reloaded when visa_sponsorship_data changes
+visa_sponsorship_lookup = VisaSponsorshipLookup(
+    refresh_seconds=app.config['VISA_SPONSORSHIP_REFRESH'],
+    min_similarity=app.config['VISA_SPONSORSHIP_MIN_SIMILARITY']
+)
+
+# IDF weights from job posting document frequencies, for weighted compatibility scores
+corpus_statistics = CorpusStatisticsStore(refresh_seconds=app.config['CORPUS_STATISTICS_REFRESH'])
+
+def extract_projects_section(latex_content):
+    """Extract the Projects section from LaTeX content."""
+    return section_index(latex_content).extract('Projects')
+
+def replace_projects_section(original_latex, new_projects_section):
+    """Replace the Projects section in the original LaTeX with the new one."""
+    return section_index(original_latex).replace('Projects', new_projects_section)
+
+def build_document_prompt(resume, job_description):
+    """Prompt that sends the whole resume and asks for the whole resume back."""
+    return f"""
+You are an expert career coach and professional resume writer specializing in LaTeX resumes. Your task is to edit ONLY the \\section{{Projects}} content in the provided LaTeX resume to make it more ATS-friendly for the given job description.
+
+**CRITICAL INSTRUCTIONS:**
+
+1.  **ONLY EDIT PROJECTS SECTION:** You MUST ONLY modify the content within the \\section{{Projects}} section. Do NOT change ANY other part of the resume including headers, formatting, other sections, LaTeX commands, packages, or document structure.
+
+2.  **Preserve ALL Formatting:** Keep the exact same LaTeX formatting, commands, and structure. Do NOT change \\resumeSubItem, \\resumeSubHeadingListStart, or any other LaTeX commands.
+
+3.  **Projects Content Only:** Only modify the project descriptions and titles within the Projects section to:
+    *   Add relevant keywords from the job description
+    *   Use strong action verbs (Engineered, Developed, Implemented, etc.)
+    *   Include quantifiable metrics where possible
+    *   Make descriptions more ATS-friendly
+
+4.  **Keep Everything Else Identical:** Do NOT modify:
+    *   Document class or packages
+    *   Any other sections (Summary, Education, Experience, Skills, etc.)
+    *   LaTeX formatting or commands
+    *   Document structure or spacing
+
+5.  **LaTeX Character Handling:** Be careful with special LaTeX characters. Use \\& for ampersands in regular text, \\% for percent signs, and \\$ for dollar signs outside math mode.
+
+6.  **No Comments:** Do NOT add any LaTeX comments. Keep the code clean without any comments.
+
+7.  **Output:** Your response must ONLY be the complete, raw LaTeX code with ONLY the Projects section content modified. Everything else must remain exactly the same.
+
+**Job Description:**
+---
+{job_description}
+---
+
+**Original LaTeX Resume:**
+---
+{resume}
+---
+"""
+
+def build_section_prompt(projects_section, job_description, skills_section=None):
+    """Prompt that sends only the Projects section and asks for only that section back."""
+    context = f"""
+**Candidate's Skills Section (context only, do not return it):**
+---
+{skills_section}
+---
+""" if skills_section else ""
+    
+    return f"""
+You are an expert career coach and professional resume writer specializing in LaTeX resumes. Your task is to rewrite the \\section{{Projects}} section of a LaTeX resume to make it more ATS-friendly for the given job description.
+
+**CRITICAL INSTRUCTIONS:**
+
+1.  **Preserve ALL Formatting:** Keep the exact same LaTeX formatting, commands, and structure. Do NOT change \\resumeSubItem, \\resumeSubHeadingListStart, or any other LaTeX commands.
+
+2.  **Projects Content Only:** Only modify the project descriptions and titles to:
+    *   Add relevant keywords from the job description
+    *   Use strong action verbs (Engineered, Developed, Implemented, etc.)
+    *   Include quantifiable metrics where possible
+    *   Make descriptions more ATS-friendly
+
+3.  **LaTeX Character Handling:** Be careful with special LaTeX characters. Use \\& for ampersands in regular text, \\% for percent signs, and \\$ for dollar signs outside math mode.
+
+4.  **No Comments:** Do NOT add any LaTeX comments. Keep the code clean without any comments.
+
+5.  **Output:** Your response must ONLY be the raw LaTeX of the Projects section, starting with its \\section heading. Do NOT return any other part of the resume.
+
+**Job Description:**
+---
+{job_description}
+---
+{context}
+**Original Projects Section:**
+---
+{projects_section}
+---
+"""
+
+def strip_code_fences(text):
+    """Remove a surrounding markdown code block from a model response."""
+    if text.startswith('```'):
+        lines = text.split('\n')
+        if lines[0].strip().startswith('```'):
+            lines = lines[1:]  # Remove first line
+        if lines and lines[-1].strip() == '```':
+            lines = lines[:-1]  # Remove last line
+        text = '\n'.join(lines)
+    
+    return text.strip()
+
+def prepare_tailoring(resume, job_description, mode=None):
+    """Choose the tailoring mode and build its prompt and cache key.
+    
+    In 'section' mode only the Projects section (plus the Skills section as
+    context) is sent and returned; 'document' mode round-trips the whole resume.
+    Returns (mode, prompt, cache_key, projects_section).
+    """
+    mode = mode or app.config['TAILORING_MODE']
+    resume_sections = section_index(resume)
+    projects_section = resume_sections.extract('Projects')
+    if mode == 'section' and projects_section is None:
+        # Nothing to scope to; let the model find the section in the full document
+        mode = 'document'
+    
+    cache_key = None
+    if tailoring_cache is not None:
+        cache_key = tailoring_cache.make_key(GEMINI_MODEL, f'{TAILORING_PROMPT_VERSION}/{mode}',
+                                             resume, job_description)
+    
+    if mode == 'section':
+        prompt = build_section_prompt(projects_section, job_description, resume_sections.extract('Skills'))
+    else:
+        prompt = build_document_prompt(resume, job_description)
     
-    # Join lines back together
-    cleaned_content = '\n'.join(cleaned_lines)
+    return mode, prompt, cache_key, projects_section
+
+def record_tailoring_usage(mode, usage_metadata, started):
+    """Record token counts and latency for one tailoring call."""
+    usage = tailoring_metrics.record(mode, usage_metadata, time.monotonic() - started)
+    app.logger.info('Tailoring call (%s mode): %d prompt tokens, %d output tokens, %.2fs',
+                    mode, usage['prompt_tokens'], usage['output_tokens'], usage['latency'])
+
+def finish_tailoring(resume, modified_latex, mode, projects_section, cache_key):
+    """Splice the sanitized model output into the original resume and cache it."""
+    # Extract only the Projects section from the AI-generated content
+    new_projects_section = extract_projects_section(modified_latex)
+    if new_projects_section is None and mode == 'section' and modified_latex:
+        # The model returned the section body without its heading
+        heading_end = projects_section.index('}') + 1
+        new_projects_section = projects_section[:heading_end] + '\n' + modified_latex
     
-    # Remove excessive empty lines (more than 2 consecutive empty lines)
-    cleaned_content = re.sub(r'\n\s*\n\s*\n+', '\n\n', cleaned_content)
+    if new_projects_section:
+        # Replace the Projects section in the original resume
+        final_latex = replace_projects_section(resume, new_projects_section)
+    else:
+        # If extraction failed, use the original resume
+        final_latex = resume
     
-    # Clean up any remaining whitespace issues
-    cleaned_content = cleaned_content.strip()
+    if cache_key is not None:
+        tailoring_cache.set(cache_key, final_latex)
     
-    return cleaned_content
+    return final_latex
 
-def extract_projects_section(latex_content):
-    """Extract the Projects section from LaTeX content."""
-    import re
+def tailor_latex(resume, job_description, mode=None):
+    """Ask Gemini to tailor the Projects section of a LaTeX resume."""
+    mode, prompt, cache_key, projects_section = prepare_tailoring(resume, job_description, mode)
     
-    # Pattern to match the entire Projects section
-    # From \section{Projects} to the next \section or end of document
-    pattern = r'(\\section\{Projects\}.*?)(?=\\section\{[^}]+\}|\\end\{document\}|$)'
+    if cache_key is not None:
+        cached_latex = tailoring_cache.get(cache_key)
+        if cached_latex is not None:
+            return cached_latex
     
-    match = re.search(pattern, latex_content, re.DOTALL | re.IGNORECASE)
-    if match:
-        return match.group(1).strip()
-    return None
+    started = time.monotonic()
+    response = client.models.generate_content(
+        model=GEMINI_MODEL,
+        contents=prompt
+    )
+    record_tailoring_usage(mode, response.usage_metadata, started)
+    
+    # Remove markdown code blocks, then strip any comments the model added
+    # and escape stray special characters
+    modified_latex = sanitize_latex(strip_code_fences(response.text))
+    
+    return finish_tailoring(resume, modified_latex, mode, projects_section, cache_key)
 
-def replace_projects_section(original_latex, new_projects_section):
-    """Replace the Projects section in the original LaTeX with the new one."""
-    import re
+def sse_event(event, data):
+    """Format one server-sent event with a JSON payload."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+def tailor_latex_stream(resume, job_description, mode=None):
+    """Stream tailoring as server-sent events.
+    
+    Emits 'chunk' events with sanitized LaTeX for each complete line the
+    model has produced, then a 'done' event with the final spliced resume.
+    """
+    mode, prompt, cache_key, projects_section = prepare_tailoring(resume, job_description, mode)
     
-    if not new_projects_section:
-        return original_latex
+    if cache_key is not None:
+        cached_latex = tailoring_cache.get(cache_key)
+        if cached_latex is not None:
+            yield sse_event('done', {'latex_content': cached_latex, 'cached': True})
+            return
     
-    # Pattern to match the entire Projects section in the original
-    pattern = r'(\\section\{Projects\}.*?)(?=\\section\{[^}]+\}|\\end\{document\}|$)'
+    sanitizer = LatexSanitizer()
+    pending = ''
+    sanitized_parts = []
+    usage_metadata = None
+    started = time.monotonic()
     
-    # Find the match in the original
-    match = re.search(pattern, original_latex, flags=re.DOTALL | re.IGNORECASE)
+    def sanitize_lines(lines):
+        # Markdown code fences are never valid LaTeX, so drop them wherever they appear
+        text = ''.join(line for line in lines if not line.lstrip().startswith('```'))
+        return sanitizer.feed(text)
     
-    if match:
-        # Get the start and end positions of the match
-        start_pos = match.start(1)
-        end_pos = match.end(1)
+    try:
+        for chunk in client.models.generate_content_stream(model=GEMINI_MODEL, contents=prompt):
+            usage_metadata = getattr(chunk, 'usage_metadata', None) or usage_metadata
+            pending += chunk.text or ''
+            lines = pending.splitlines(keepends=True)
+            pending = lines.pop() if lines and not lines[-1].endswith('\n') else ''
+            sanitized = sanitize_lines(lines)
+            if sanitized:
+                sanitized_parts.append(sanitized)
+                yield sse_event('chunk', {'latex': sanitized})
         
-        # Replace by reconstructing the string
-        result = original_latex[:start_pos] + new_projects_section + original_latex[end_pos:]
-        return result
-    else:
-        # If no Projects section found, return original
-        return original_latex
+        sanitized = sanitize_lines([pending]) + sanitizer.close()
+        if sanitized:
+            sanitized_parts.append(sanitized)
+            yield sse_event('chunk', {'latex': sanitized})
+    except Exception as e:
+        yield sse_event('error', {'error': str(e)})
+        return
+    
+    record_tailoring_usage(mode, usage_metadata, started)
+    final_latex = finish_tailoring(resume, ''.join(sanitized_parts), mode, projects_section, cache_key)
+    yield sse_event('done', {'latex_content': final_latex, 'cached': False})
+
+@celery.task(name='tailor_resume')
+def tailor_resume_task(user_id, resume, job_description):
+    """Background task wrapping tailor_latex."""
+    return {'user_id': user_id, 'latex_content': tailor_latex(resume, job_description)}
+
+def tailor_job_id(user_id):
+    """Task id for a user's tailoring job; it starts with the owner's id."""
+    return f'{user_id}-{uuid.uuid4().hex}'
+
+def owns_tailor_job(job_id, user_id):
+    return job_id.partition('-')[0] == str(user_id)
 
 @app.route('/')
 def index():
@@ -264,8 +402,9 @@ def tailor():
     tailoring_service = ResumeTailoringService()
     
     if request.method == 'GET':
-        # Show the tailoring form with resume version selection
-        resume_versions = current_user.resume_versions.all()
+        # Show the tailoring form with resume version selection; the page
+        # fetches a version's LaTeX only when it is picked for preview
+        resume_versions = tailoring_service.list_resume_versions(current_user.id)
         return render_template('tailor_form.html', resume_versions=resume_versions)
     
     # Handle POST request
@@ -298,106 +437,93 @@ def tailor():
             selected_version = suggested_version
             compatibility = tailoring_service.analyze_compatibility(resume, job_description)
 
-    prompt = f"""
-You are an expert career coach and professional resume writer specializing in LaTeX resumes. Your task is to edit ONLY the \\section{{Projects}} content in the provided LaTeX resume to make it more ATS-friendly for the given job description.
-
-**CRITICAL INSTRUCTIONS:**
-
-1.  **ONLY EDIT PROJECTS SECTION:** You MUST ONLY modify the content within the \\section{{Projects}} section. Do NOT change ANY other part of the resume including headers, formatting, other sections, LaTeX commands, packages, or document structure.
-
-2.  **Preserve ALL Formatting:** Keep the exact same LaTeX formatting, commands, and structure. Do NOT change \\resumeSubItem, \\resumeSubHeadingListStart, or any other LaTeX commands.
-
-3.  **Projects Content Only:** Only modify the project descriptions and titles within the Projects section to:
-    *   Add relevant keywords from the job description
-    *   Use strong action verbs (Engineered, Developed, Implemented, etc.)
-    *   Include quantifiable metrics where possible
-    *   Make descriptions more ATS-friendly
-
-4.  **Keep Everything Else Identical:** Do NOT modify:
-    *   Document class or packages
-    *   Any other sections (Summary, Education, Experience, Skills, etc.)
-    *   LaTeX formatting or commands
-    *   Document structure or spacing
-
-5.  **LaTeX Character Handling:** Be careful with special LaTeX characters. Use \\& for ampersands in regular text, \\% for percent signs, and \\$ for dollar signs outside math mode.
-
-6.  **No Comments:** Do NOT add any LaTeX comments. Keep the code clean without any comments.
-
-7.  **Output:** Your response must ONLY be the complete, raw LaTeX code with ONLY the Projects section content modified. Everything else must remain exactly the same.
-
-**Job Description:**
----
-{job_description}
----
-
-**Original LaTeX Resume:**
----
-{resume}
----
-"""
+    if app.config['TAILORING_STREAMING'] and request.accept_mimetypes.best != 'application/json':
+        # Let the preview page stream the model output as it is generated
+        return render_template('latex_preview.html', 
+                             latex_content='',
+                             stream_url=url_for('tailor_stream'),
+                             job_description=job_description,
+                             original_resume=resume,
+                             compatibility=compatibility,
+                             selected_version=selected_version,
+                             suggested_version=suggested_version)
 
-    response = client.models.generate_content(
-        model='models/gemini-2.0-flash',
-        contents=prompt
-    )
+    # Generate the tailored LaTeX in the background and let the preview poll for it
+    job = tailor_resume_task.apply_async((current_user.id, resume, job_description),
+                                         task_id=tailor_job_id(current_user.id))
+    
+    if request.accept_mimetypes.best == 'application/json':
+        return {'job_id': job.id, 'status_url': url_for('tailor_job_status', job_id=job.id)}, 202
+    
+    return render_template('latex_preview.html', 
+                         latex_content='',
+                         job_id=job.id,
+                         original_resume=resume,
+                         compatibility=compatibility,
+                         selected_version=selected_version,
+                         suggested_version=suggested_version)
 
-    modified_latex = response.text
+@app.route('/tailor/stream', methods=['POST'])
+@login_required
+def tailor_stream():
+    """Stream tailored LaTeX to the browser as server-sent events."""
+    from models.resume_version import ResumeVersion
     
-    # Clean up the response - remove markdown code blocks if present
-    if modified_latex.startswith('```latex'):
-        # Remove the opening ```latex and closing ```
-        lines = modified_latex.split('\n')
-        if lines[0].strip() == '```latex' or lines[0].strip().startswith('```latex'):
-            lines = lines[1:]  # Remove first line
-        if lines and lines[-1].strip() == '```':
-            lines = lines[:-1]  # Remove last line
-        modified_latex = '\n'.join(lines)
-    elif modified_latex.startswith('```'):
-        # Handle generic code blocks
-        lines = modified_latex.split('\n')
-        if lines[0].strip().startswith('```'):
-            lines = lines[1:]  # Remove first line
-        if lines and lines[-1].strip() == '```':
-            lines = lines[:-1]  # Remove last line
-        modified_latex = '\n'.join(lines)
+    job_description = request.form.get('job_description', '')
+    resume_version_id = request.form.get('resume_version_id')
     
-    # Remove any leading/trailing whitespace
-    modified_latex = modified_latex.strip()
+    if resume_version_id:
+        resume = ResumeVersion.query.filter_by(
+            id=resume_version_id,
+            user_id=current_user.id
+        ).first_or_404().latex_content
+    else:
+        resume = request.form.get('resume', '')
     
-    # Remove any LaTeX comments that might have been added FIRST
-    modified_latex = remove_latex_comments(modified_latex)
+    if not resume or not job_description:
+        return {'error': 'Resume and job description are required'}, 400
     
-    # Then fix LaTeX character escaping issues
-    modified_latex = fix_latex_characters(modified_latex)
+    return Response(
+        stream_with_context(tailor_latex_stream(resume, job_description)),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
 
-    # Extract only the Projects section from the AI-generated content
-    new_projects_section = extract_projects_section(modified_latex)
+@app.route('/tailor/jobs/<job_id>')
+@login_required
+def tailor_job_status(job_id):
+    """Report the status of a background tailoring job."""
+    # Checked before the result is read, so other users learn nothing about the job
+    if not owns_tailor_job(job_id, current_user.id):
+        return {'error': 'Job not found'}, 404
     
-    if new_projects_section:
-        # Clean the extracted projects section only
-        new_projects_section = remove_latex_comments(new_projects_section)
-        new_projects_section = fix_latex_characters(new_projects_section)
-        
-        # Replace the Projects section in the original resume
-        final_latex = replace_projects_section(resume, new_projects_section)
-    else:
-        # If extraction failed, use the original resume
-        final_latex = resume
+    result = tailor_resume_task.AsyncResult(job_id)
     
-    # Return the LaTeX content for review instead of immediately generating PDF
-    return render_template('latex_preview.html', 
-                         latex_content=final_latex,
-                         original_resume=resume,
-                         compatibility=compatibility,
-                         selected_version=selected_version,
-                         suggested_version=suggested_version)
+    if result.successful():
+        return {'status': 'SUCCESS', 'latex_content': result.result['latex_content']}
+    
+    if result.failed():
+        return {'status': 'FAILURE', 'error': str(result.result)}
+    
+    return {'status': result.state}
 
 @app.route('/resume-versions')
 @login_required
 def resume_versions():
-    """Display all resume versions for the current user."""
-    versions = current_user.resume_versions.order_by(db.desc(db.text('created_at'))).all()
-    return render_template('resume_versions.html', versions=versions)
+    """Display the current user's resume versions, one page at a time."""
+    from services.resume_service import ResumeTailoringService
+    
+    per_page = app.config['RESUME_VERSIONS_PER_PAGE']
+    before = request.args.get('before', type=int)
+    
+    # Fetch one extra row to learn whether an older page exists
+    versions = ResumeTailoringService().list_resume_versions(current_user.id, limit=per_page + 1, before=before)
+    next_cursor = versions[per_page - 1].id if len(versions) > per_page else None
+    
+    return render_template('resume_versions.html',
+                         versions=versions[:per_page],
+                         next_cursor=next_cursor,
+                         paginated=before is not None)
 
 @app.route('/resume-versions/new', methods=['GET', 'POST'])
 @login_required
@@ -405,6 +531,7 @@ def new_resume_version():
     """Create a new resume version."""
     from forms import ResumeVersionForm
     from models.resume_version import ResumeVersion
+    from services.resume_service import ResumeTailoringService
     
     form = ResumeVersionForm()
     
@@ -425,6 +552,7 @@ def new_resume_version():
             category=form.category.data,
             latex_content=form.latex_content.data
         )
+        ResumeTailoringService().update_fingerprint(version)
         
         db.session.add(version)
         db.session.commit()
@@ -453,6 +581,7 @@ def edit_resume_version(version_id):
     """Edit an existing resume version."""
     from forms import ResumeVersionForm
     from models.resume_version import ResumeVersion
+    from services.resume_service import ResumeTailoringService
     
     version = ResumeVersion.query.filter_by(
         id=version_id,
@@ -475,6 +604,7 @@ def edit_resume_version(version_id):
         version.name = form.name.data
         version.category = form.category.data
         version.latex_content = form.latex_content.data
+        ResumeTailoringService().update_fingerprint(version, force=True)
         
         db.session.commit()
         
@@ -531,8 +661,11 @@ def duplicate_resume_version(version_id):
         user_id=current_user.id,
         name=duplicate_name,
         category=original.category,
-        latex_content=original.latex_content
+        keyword_fingerprint=original.keyword_fingerprint,
+        keyword_taxonomy_version=original.keyword_taxonomy_version
     )
+    # Reference the original's content chunks instead of copying the body
+    duplicate.share_content(original)
     
     db.session.add(duplicate)
     db.session.commit()
@@ -572,7 +705,8 @@ def analyze_compatibility():
     
     # Analyze compatibility
     tailoring_service = ResumeTailoringService()
-    compatibility = tailoring_service.analyze_compatibility(resume_content, job_description)
+    compatibility = tailoring_service.analyze_compatibility(resume_content, job_description,
+                                                            corpus_statistics.statistics())
     
     # Get suggested version
     suggested_version = tailoring_service.suggest_resume_version(current_user.id, job_description)
@@ -580,6 +714,7 @@ def analyze_compatibility():
     return {
         'compatibility': {
             'score': compatibility.score,
+            'weighted_score': compatibility.weighted_score,
             'matched_keywords': compatibility.matched_keywords,
             'missing_keywords': compatibility.missing_keywords,
             'suggestions': compatibility.suggestions
@@ -591,6 +726,102 @@ def analyze_compatibility():
         } if suggested_version else None
     }
 
+@app.route('/api/analyze-compatibility/batch', methods=['POST'])
+@login_required
+def analyze_compatibility_batch():
+    """API endpoint scoring many job descriptions against several resume versions at once.
+    
+    Returns an N (jobs) × M (versions) score matrix. Clients that accept
+    application/x-ndjson get a header line followed by one line per job,
+    flushed block by block so the first scores arrive before the last jobs
+    are scored.
+    """
+    from sqlalchemy.orm import load_only
+    from services.job_matching_service import JobMatchingService
+    from services.resume_service import ResumeTailoringService
+    from services.taxonomy import skill_taxonomy
+    from models.resume_version import ResumeVersion
+    
+    data = request.get_json(silent=True)
+    if not data:
+        return {'error': 'No data provided'}, 400
+    if not isinstance(data, dict):
+        return {'error': 'Request body must be a JSON object'}, 400
+    
+    jobs = data.get('job_descriptions')
+    if not isinstance(jobs, list) or not jobs:
+        return {'error': 'job_descriptions must be a non-empty list'}, 400
+    if len(jobs) > app.config['BATCH_COMPATIBILITY_MAX_JOBS']:
+        return {'error': f"At most {app.config['BATCH_COMPATIBILITY_MAX_JOBS']} job descriptions per request"}, 400
+    # Each job is a string or an object with an optional client id and its text
+    job_ids = [job.get('id') if isinstance(job, dict) else None for job in jobs]
+    job_texts = [job.get('text') if isinstance(job, dict) else job for job in jobs]
+    if not all(isinstance(text, str) for text in job_texts):
+        return {'error': 'Each job description must be a string or an object with a text field'}, 400
+    
+    resume_content = data.get('resume_content')
+    if resume_content is not None and not isinstance(resume_content, str):
+        return {'error': 'resume_content must be a string'}, 400
+    
+    version_ids = data.get('resume_version_ids')
+    query = ResumeVersion.query.options(
+        load_only(ResumeVersion.id, ResumeVersion.name, ResumeVersion.keyword_fingerprint,
+                  ResumeVersion.keyword_taxonomy_version)
+    ).filter_by(user_id=current_user.id)
+    if version_ids is not None:
+        # bool is an int subclass, but true is not a version id
+        if not isinstance(version_ids, list) or not all(
+                isinstance(version_id, int) and not isinstance(version_id, bool) for version_id in version_ids):
+            return {'error': 'resume_version_ids must be a list of integers'}, 400
+        query = query.filter(ResumeVersion.id.in_(version_ids))
+    versions = query.order_by(ResumeVersion.id).all()
+    if version_ids is not None and len(versions) != len(set(version_ids)):
+        return {'error': 'Resume version not found'}, 404
+    
+    # Resumes and jobs are all read with one taxonomy, even if it is reloaded mid-request
+    taxonomy = skill_taxonomy.current()
+    tailoring_service = ResumeTailoringService()
+    columns = []
+    refreshed = False
+    for version in versions:
+        refreshed |= tailoring_service.update_fingerprint(version, taxonomy=taxonomy)
+        columns.append({'id': version.id, 'name': version.name, 'keywords': version.keyword_fingerprint})
+    if refreshed:
+        db.session.commit()
+    if resume_content:
+        columns.append({'id': None, 'name': 'resume_content',
+                        'keywords': taxonomy.fingerprint(resume_content)})
+    if not columns:
+        return {'error': 'Resume content or versions are required'}, 400
+    
+    matching = JobMatchingService(taxonomy=taxonomy)
+    resume_columns = matching.resume_columns([column['keywords'] for column in columns])
+    
+    def scored_jobs():
+        block_size = app.config['BATCH_COMPATIBILITY_BLOCK_SIZE']
+        for start in range(0, len(job_texts), block_size):
+            texts = job_texts[start:start + block_size]
+            scores = matching.score_matrix([taxonomy.matcher.find(text) for text in texts], resume_columns)
+            for offset, row in enumerate(scores):
+                best = int(row.argmax())
+                yield {
+                    'index': start + offset,
+                    'id': job_ids[start + offset],
+                    'scores': [round(float(score), 4) for score in row],
+                    'best_version_id': columns[best]['id'] if row[best] > 0 else None
+                }
+    
+    header = {'versions': [{'id': column['id'], 'name': column['name']} for column in columns]}
+    
+    if request.accept_mimetypes.best == 'application/x-ndjson':
+        def generate():
+            yield json.dumps(header) + '\n'
+            for job in scored_jobs():
+                yield json.dumps(job) + '\n'
+        return Response(generate(), mimetype='application/x-ndjson')
+    
+    return dict(header, jobs=list(scored_jobs()))
+
 @app.route('/api/resume-versions/<int:version_id>/content')
 @login_required
 def get_resume_version_content(version_id):
@@ -610,53 +841,109 @@ def get_resume_version_content(version_id):
         'created_at': version.created_at.isoformat()
     }
 
+@app.route('/api/resume-versions/<int:version_id>/job-postings')
+@login_required
+def matching_job_postings(version_id):
+    """API endpoint for the job postings sharing the most keywords with a resume version."""
+    from services.resume_service import ResumeTailoringService
+    from models.resume_version import ResumeVersion
+    
+    version = ResumeVersion.query.filter_by(
+        id=version_id,
+        user_id=current_user.id
+    ).first_or_404()
+    
+    if ResumeTailoringService().update_fingerprint(version):
+        db.session.commit()
+    
+    limit = min(request.args.get('limit', 20, type=int), 100)
+    visa_sponsorship = request.args.get('visa_sponsorship')
+    if visa_sponsorship is not None:
+        visa_sponsorship = visa_sponsorship.lower() in ['true', 'on', '1']
+    
+    results = job_keyword_index.search(
+        version.keyword_fingerprint,
+        limit=limit,
+        visa_sponsorship=visa_sponsorship,
+        company=request.args.get('company')
+    )
+    
+    sponsors = visa_sponsorship_lookup.lookup_many(posting.company for posting, _ in results)
+    
+    return {
+        'resume_version_id': version.id,
+        'job_postings': [
+            {
+                'id': posting.id,
+                'title': posting.title,
+                'company': posting.company,
+                'location': posting.location,
+                'visa_sponsorship': posting.visa_sponsorship,
+                'sponsor': sponsor.to_dict() if sponsor else None,
+                'matched_count': overlap
+            }
+            for (posting, overlap), sponsor in zip(results, sponsors)
+        ]
+    }
+
+@app.route('/api/search')
+@login_required
+def search():
+    """API endpoint for full-text search over the user's resumes and job postings."""
+    from services.search_service import FullTextSearch
+    
+    query = request.args.get('q', '').strip()
+    scope = request.args.get('scope', 'all')
+    if not query:
+        return {'error': 'Query is required'}, 400
+    if scope not in ('all', 'resumes', 'jobs'):
+        return {'error': 'Scope must be one of all, resumes or jobs'}, 400
+    
+    limit = min(request.args.get('limit', 20, type=int), 100)
+    full_text_search = FullTextSearch()
+    results = {}
+    if scope in ('all', 'resumes'):
+        results['resume_versions'] = [
+            result._asdict() for result in full_text_search.search_resumes(query, current_user.id, limit)
+        ]
+    if scope in ('all', 'jobs'):
+        results['job_postings'] = [
+            result._asdict() for result in full_text_search.search_job_postings(query, limit)
+        ]
+    
+    return {'query': query, **results}
+
 @app.route('/generate_pdf', methods=['POST'])
 @login_required
 def generate_pdf():
     latex_content = request.form['latex_content']
     
     try:
-        with tempfile.TemporaryDirectory() as temp_dir:
-            tex_filename = "resume.tex"
-            tex_filepath = os.path.join(temp_dir, tex_filename)
-
-            with open(tex_filepath, "w", encoding='utf-8') as f:
-                f.write(latex_content)
-
-            compile_process = subprocess.run(
-                ["pdflatex", "-interaction=nonstopmode", "-output-directory", temp_dir, tex_filepath],
-                capture_output=True,
-                text=True
-            )
-
-            if compile_process.returncode != 0:
-                log_filename = "resume.log"
-                log_filepath = os.path.join(temp_dir, log_filename)
-                with open(log_filepath, "r") as log_file:
-                    log_content = log_file.read()
-                
-                # Return to preview with error message
-                return render_template('latex_preview.html', 
-                                     latex_content=latex_content,
-                                     error_message="PDF Compilation Failed",
-                                     error_log=log_content)
-
-            pdf_filepath = os.path.join(temp_dir, "resume.pdf")
-
-            # Read the generated PDF into a buffer
-            with open(pdf_filepath, 'rb') as f:
-                pdf_buffer = io.BytesIO(f.read())
-
-            # Seek to the beginning of the buffer
-            pdf_buffer.seek(0)
-
-            # Send the buffer as a file download
-            return send_file(
-                pdf_buffer,
-                as_attachment=True,
-                download_name='tailored_resume.pdf',
-                mimetype='application/pdf'
-            )
+        result = pdf_executor.compile(latex_content)
+        
+        if not result.success:
+            # Return to preview with error message
+            return render_template('latex_preview.html', 
+                                 latex_content=latex_content,
+                                 error_message="PDF Compilation Failed",
+                                 error_log=result.log)
+        
+        # Send the PDF as a file download
+        return send_file(
+            io.BytesIO(result.pdf),
+            as_attachment=True,
+            download_name='tailored_resume.pdf',
+            mimetype='application/pdf'
+        )
+
+    except CompileQueueFull as e:
+        # Too many compiles in flight; ask the client to back off
+        response = make_response(render_template('latex_preview.html', 
+                                                 latex_content=latex_content,
+                                                 error_message="The PDF compiler is busy. Please try again in a few seconds.",
+                                                 error_log=str(e)), 503)
+        response.headers['Retry-After'] = str(e.retry_after)
+        return response
 
     except Exception as e:
         return render_template('latex_preview.html', 
@@ -664,6 +951,25 @@ def generate_pdf():
                              error_message="An unexpected error occurred",
                              error_log=str(e))
 
+@app.route('/api/tailoring/metrics')
+@login_required
+def tailoring_metrics_summary():
+    """API endpoint exposing tailoring token usage, latency and cache counters.
+    
+    Totals cover every process that tailors (web and Celery worker) unless
+    TAILORING_METRICS_BACKEND is 'memory'.
+    """
+    return {
+        'modes': tailoring_metrics.snapshot(),
+        'cache': tailoring_cache.stats() if tailoring_cache is not None else None
+    }
+
+@app.route('/api/pdf-compile/metrics')
+@login_required
+def pdf_compile_metrics():
+    """API endpoint exposing PDF compile queue depth and latency."""
+    return pdf_executor.metrics.snapshot()
+
 if __name__ == '__main__':
     # Initialize database on first run
     with app.app_context():
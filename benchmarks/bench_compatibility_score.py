@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""Benchmark: 1M resume/job comparisons with keyword sets vs bitmask CompatibilityScores."""
+import os
+import random
+import sys
+import time
+
+# Add the repository root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.resume_service import CompatibilityScore, compatibility_suggestions
+from services.taxonomy import skill_taxonomy
+
+RESUMES = 1_000
+JOBS = 1_000
+COMPARISONS = RESUMES * JOBS
+
+
+def legacy_compare(resume_keywords, job_keywords):
+    """Set-based scoring, as analyze_compatibility did before bitmasks."""
+    matched_keywords = list(resume_keywords.intersection(job_keywords))
+    missing_keywords = list(job_keywords - resume_keywords)
+    score = len(matched_keywords) / len(job_keywords) if job_keywords else 0.0
+    return score, matched_keywords, missing_keywords, compatibility_suggestions(score, missing_keywords)
+
+
+def main():
+    rng = random.Random(3)
+    matcher = skill_taxonomy.current().matcher
+    vocabulary = list(matcher.vocabulary)
+    resume_sets = [set(rng.sample(vocabulary, rng.randint(5, 25))) for _ in range(RESUMES)]
+    job_sets = [set(rng.sample(vocabulary, rng.randint(3, 15))) for _ in range(JOBS)]
+    resume_masks = [matcher.encode(keywords) for keywords in resume_sets]
+    job_masks = [matcher.encode(keywords) for keywords in job_sets]
+
+    started = time.perf_counter()
+    legacy_total = 0.0
+    for resume in resume_sets:
+        for job in job_sets:
+            legacy_total += legacy_compare(resume, job)[0]
+    legacy_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    mask_total = 0.0
+    for resume in resume_masks:
+        for job in job_masks:
+            mask_total += CompatibilityScore.from_masks(resume, job, matcher).score
+    mask_seconds = time.perf_counter() - started
+
+    assert abs(legacy_total - mask_total) < 1e-6
+
+    # Decoding on demand, e.g. for the best job per resume only
+    started = time.perf_counter()
+    for resume in resume_masks:
+        best = max((CompatibilityScore.from_masks(resume, job, matcher) for job in job_masks), key=lambda s: s.score)
+        best.matched_keywords, best.missing_keywords, best.suggestions
+    decode_seconds = time.perf_counter() - started
+
+    print(f"{COMPARISONS:,} comparisons, vocabulary of {len(vocabulary)} terms")
+    print(f"  sets + lists + suggestions: {legacy_seconds:6.2f}s ({COMPARISONS / legacy_seconds:,.0f}/s)")
+    print(f"  bitmask scores:             {mask_seconds:6.2f}s ({COMPARISONS / mask_seconds:,.0f}/s)")
+    print(f"  bitmask, decode best only:  {decode_seconds:6.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+"""Benchmark: sparse batch matching vs per-pair set scoring at 10k users × 50k postings."""
+import os
+import random
+import sys
+import time
+
+# Add the repository root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.job_matching_service import JobMatchingService
+
+USERS = 10_000
+POSTINGS = 50_000
+TOP_K = 10
+LEGACY_SAMPLE_USERS = 20
+
+
+def random_keyword_sets(vocabulary, count, low, high, rng):
+    return [set(rng.sample(vocabulary, rng.randint(low, high))) for _ in range(count)]
+
+
+def legacy_top_k(user_keywords, posting_keywords, k):
+    """Score every pair with Python sets, as analyze_compatibility does."""
+    results = []
+    for user_row, skills in enumerate(user_keywords):
+        scores = []
+        for posting_row, required in enumerate(posting_keywords):
+            if required:
+                scores.append((len(skills & required) / len(required), posting_row))
+        scores.sort(reverse=True)
+        results.extend((user_row, posting_row, score) for score, posting_row in scores[:k] if score > 0)
+    return results
+
+
+def main():
+    rng = random.Random(42)
+    service = JobMatchingService()
+    vocabulary = service.vocabulary
+
+    user_keywords = random_keyword_sets(vocabulary, USERS, 3, 15, rng)
+    posting_keywords = random_keyword_sets(vocabulary, POSTINGS, 2, 10, rng)
+
+    started = time.perf_counter()
+    user_matrix = service.build_matrix(user_keywords)
+    posting_matrix = service.build_matrix(posting_keywords)
+    build_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    matches = sum(1 for _ in service.top_k(user_matrix, posting_matrix, k=TOP_K))
+    score_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    legacy_top_k(user_keywords[:LEGACY_SAMPLE_USERS], posting_keywords, TOP_K)
+    legacy_seconds = (time.perf_counter() - started) * USERS / LEGACY_SAMPLE_USERS
+
+    print(f"{USERS} users x {POSTINGS} postings, vocabulary of {len(vocabulary)} terms")
+    print(f"  build matrices:   {build_seconds:8.2f}s")
+    print(f"  sparse top-{TOP_K}:     {score_seconds:8.2f}s ({matches} matches)")
+    print(f"  per-pair sets:    {legacy_seconds:8.2f}s (extrapolated from {LEGACY_SAMPLE_USERS} users)")
+    print(f"  speedup:          {legacy_seconds / (build_seconds + score_seconds):8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
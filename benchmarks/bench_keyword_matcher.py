@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+"""Micro-benchmark: compiled KeywordMatcher vs the original extract_keywords."""
+import os
+import re
+import sys
+import timeit
+
+# Add the repository root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.taxonomy import skill_taxonomy
+
+
+def legacy_extract_keywords(text):
+    """The per-call list building and substring scanning implementation."""
+    text = re.sub(r'[^\w\s]', ' ', text.lower())
+    keywords = []
+    prog_languages = [
+        'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'go', 'rust',
+        'php', 'ruby', 'swift', 'kotlin', 'scala', 'matlab'
+    ]
+    single_letter_langs = ['r']
+    frameworks = [
+        'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask',
+        'spring', 'laravel', 'rails', 'tensorflow', 'pytorch', 'pandas', 'numpy'
+    ]
+    tools = [
+        'git', 'docker', 'kubernetes', 'aws', 'azure', 'gcp', 'jenkins', 'jira',
+        'confluence', 'slack', 'figma', 'sketch', 'tableau', 'power bi'
+    ]
+    databases = ['sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch']
+    for keyword in prog_languages + frameworks + tools + databases:
+        if keyword in text:
+            keywords.append(keyword)
+    for lang in single_letter_langs:
+        if re.search(r'\b' + lang + r'\b', text):
+            keywords.append(lang)
+    multi_word_terms = [
+        'machine learning', 'deep learning', 'data science', 'data analysis',
+        'software engineering', 'full stack', 'front end', 'back end',
+        'user experience', 'user interface', 'product management', 'project management',
+        'agile development', 'test driven development', 'continuous integration',
+        'continuous deployment', 'cloud computing', 'artificial intelligence'
+    ]
+    for term in multi_word_terms:
+        if term in text:
+            keywords.append(term)
+    return list(set(keywords))
+
+
+SAMPLE = r"""
+\resumeSubheading{Software Engineer}{Jan 2021 -- Present}{Acme Corp}{San Francisco, CA}
+\resumeItemListStart
+  \resumeItem{Engineered microservices in Python and Go on AWS with Docker \& Kubernetes}
+  \resumeItem{Built React/Node.js dashboards backed by PostgreSQL and Redis, cutting latency 40\%}
+  \resumeItem{Led machine learning experiments with PyTorch, pandas and numpy for growth analytics}
+\resumeItemListEnd
+"""
+
+
+def make_resume(size):
+    """Build a synthetic resume of roughly size bytes."""
+    return (SAMPLE * (size // len(SAMPLE) + 1))[:size]
+
+
+def main():
+    matcher = skill_taxonomy.current().matcher
+    for label, size in (('10 KB', 10 * 1024), ('100 KB', 100 * 1024)):
+        text = make_resume(size)
+        runs = 200 if size <= 10 * 1024 else 20
+        legacy = min(timeit.repeat(lambda: legacy_extract_keywords(text), number=runs, repeat=5)) / runs
+        compiled = min(timeit.repeat(lambda: matcher.find(text), number=runs, repeat=5)) / runs
+        print(f"{label:>6}: legacy {legacy * 1e3:8.3f} ms   matcher {compiled * 1e3:8.3f} ms   "
+              f"speedup {legacy / compiled:5.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+"""Load test: concurrent SQLite writers with default settings vs the tuned pragmas.
+
+Each worker is a separate process, as under gunicorn, with its own engine on
+a shared database file. Workers interleave short write transactions with
+reads, and "database is locked" errors are counted rather than retried.
+"""
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+# Add the repository root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from config import Config
+from database import configure_sqlite, sqlite_pragmas
+
+WORKERS = 8
+SECONDS = 5
+# sqlite3's own busy wait when no pragma overrides it (its default is 5s)
+DEFAULT_TIMEOUT = 1.0
+
+
+def worker(path, tuned, results):
+    engine = create_engine(f'sqlite:///{path}', connect_args={'timeout': DEFAULT_TIMEOUT})
+    if tuned:
+        configure_sqlite(engine, sqlite_pragmas(vars(Config)))
+
+    commits = locked = 0
+    deadline = time.perf_counter() + SECONDS
+    while time.perf_counter() < deadline:
+        try:
+            with engine.begin() as connection:
+                connection.execute(text('SELECT COUNT(*) FROM events WHERE worker = :w'), {'w': os.getpid()})
+                connection.execute(text('INSERT INTO events (worker, payload) VALUES (:w, :p)'),
+                                   {'w': os.getpid(), 'p': 'x' * 512})
+            commits += 1
+        except OperationalError as exc:
+            if 'locked' not in str(exc):
+                raise
+            locked += 1
+    results.put((commits, locked))
+
+
+def run(tuned):
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'load.db')
+        engine = create_engine(f'sqlite:///{path}')
+        with engine.begin() as connection:
+            connection.execute(text('CREATE TABLE events (id INTEGER PRIMARY KEY, worker INTEGER, payload TEXT)'))
+            connection.execute(text('CREATE INDEX ix_events_worker ON events (worker)'))
+        engine.dispose()
+
+        results = multiprocessing.Queue()
+        processes = [multiprocessing.Process(target=worker, args=(path, tuned, results)) for _ in range(WORKERS)]
+        for process in processes:
+            process.start()
+        totals = [results.get() for _ in processes]
+        for process in processes:
+            process.join()
+    return sum(commits for commits, _ in totals), sum(locked for _, locked in totals)
+
+
+def main():
+    print(f"{WORKERS} writer processes for {SECONDS}s each run")
+    for label, tuned in (('default (rollback journal, synchronous=FULL)', False),
+                         ('tuned (WAL, synchronous=NORMAL, busy_timeout)', True)):
+        commits, locked = run(tuned)
+        print(f"  {label}")
+        print(f"    {commits / SECONDS:10.0f} commits/s, {locked} 'database is locked' errors")
+
+
+if __name__ == '__main__':
+    main()
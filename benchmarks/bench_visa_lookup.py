@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+"""Benchmark: sponsorship lookups for posting enrichment against 20k employers."""
+import os
+import random
+import string
+import sys
+import time
+
+# Add the repository root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.visa_sponsorship_service import Sponsor, SponsorDirectory
+
+EMPLOYERS = 20_000
+LOOKUPS = 500_000
+# Distinct company strings seen on postings; most repeat across many postings
+DISTINCT_POSTING_NAMES = 30_000
+SUFFIXES = ['', ' Inc.', ' LLC', ', Inc', ' Corp', ' Corporation', ' Ltd']
+
+
+def random_name(rng):
+    words = rng.randint(1, 3)
+    return ' '.join(''.join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 9))).title()
+                    for _ in range(words))
+
+
+def main():
+    rng = random.Random(7)
+    names = [random_name(rng) for _ in range(EMPLOYERS)]
+
+    started = time.perf_counter()
+    directory = SponsorDirectory(Sponsor(name, ('H1B',), 10, 1, 10 / 11 * 100) for name in names)
+    build_seconds = time.perf_counter() - started
+
+    posting_names = []
+    for _ in range(DISTINCT_POSTING_NAMES):
+        name = rng.choice(names)
+        roll = rng.random()
+        if roll < 0.6:
+            name = name.upper() if rng.random() < 0.3 else name
+            name += rng.choice(SUFFIXES)
+        elif roll < 0.8:
+            name = name[:-1]  # truncated or misspelled
+        else:
+            name = random_name(rng)  # not a known sponsor
+        posting_names.append(name)
+    stream = [rng.choice(posting_names) for _ in range(LOOKUPS)]
+
+    started = time.perf_counter()
+    resolved = sum(1 for name in stream if directory.resolve(name) is not None)
+    lookup_seconds = time.perf_counter() - started
+
+    print(f"{EMPLOYERS} employers, {LOOKUPS} lookups over {DISTINCT_POSTING_NAMES} distinct posting names")
+    print(f"  build directory: {build_seconds:8.2f}s")
+    print(f"  lookups:         {lookup_seconds:8.2f}s ({LOOKUPS / lookup_seconds:,.0f}/s, {resolved} resolved)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,24 @@
+"""Celery integration for background tasks."""
+from celery import Celery
+
+
+def make_celery(app):
+    """Create a Celery instance bound to the Flask application config."""
+    celery = Celery(app.import_name)
+    celery.conf.update(
+        broker_url=app.config['CELERY_BROKER_URL'],
+        result_backend=app.config['CELERY_RESULT_BACKEND'],
+        task_always_eager=app.config.get('CELERY_TASK_ALWAYS_EAGER', False),
+        task_store_eager_result=True,
+        task_track_started=True,
+        result_expires=app.config.get('CELERY_RESULT_EXPIRES', 3600),
+    )
+    
+    class ContextTask(celery.Task):
+        """Run every task inside the Flask application context."""
+        def __call__(self, *args, **kwargs):
+            with app.app_context():
+                return self.run(*args, **kwargs)
+    
+    celery.Task = ContextTask
+    return celery
@@ -1,4 +1,5 @@
 import os
+import tempfile
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -8,6 +9,17 @@ class Config:
     """Base configuration class."""
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key-change-in-production'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    
+    # Connection pool for server databases (PostgreSQL); sized per worker process
+    DATABASE_POOL_SIZE = int(os.environ.get('DATABASE_POOL_SIZE', 5))
+    DATABASE_MAX_OVERFLOW = int(os.environ.get('DATABASE_MAX_OVERFLOW', 10))
+    DATABASE_POOL_TIMEOUT = int(os.environ.get('DATABASE_POOL_TIMEOUT', 30))  # seconds
+    DATABASE_POOL_RECYCLE = int(os.environ.get('DATABASE_POOL_RECYCLE', 1800))  # seconds
+    DATABASE_POOL_PRE_PING = os.environ.get('DATABASE_POOL_PRE_PING', 'true').lower() in ['true', 'on', '1']
+    # Pragmas run on every new SQLite connection; WAL lets readers and a writer work at once
+    SQLITE_JOURNAL_MODE = os.environ.get('SQLITE_JOURNAL_MODE', 'wal')
+    SQLITE_SYNCHRONOUS = os.environ.get('SQLITE_SYNCHRONOUS', 'normal')
+    SQLITE_BUSY_TIMEOUT = int(os.environ.get('SQLITE_BUSY_TIMEOUT', 15000))  # milliseconds
     GOOGLE_API_KEY = os.environ.get('GOOGLE_API_KEY')
     
     # Email configuration
@@ -20,6 +32,59 @@ class Config:
     # Celery configuration
     CELERY_BROKER_URL = os.environ.get('CELERY_BROKER_URL', 'redis://localhost:6379/0')
     CELERY_RESULT_BACKEND = os.environ.get('CELERY_RESULT_BACKEND', 'redis://localhost:6379/0')
+    # Run tasks in-process instead of sending them to the broker (no Redis needed)
+    CELERY_TASK_ALWAYS_EAGER = os.environ.get('CELERY_TASK_ALWAYS_EAGER', 'false').lower() in ['true', 'on', '1']
+    CELERY_RESULT_EXPIRES = int(os.environ.get('CELERY_RESULT_EXPIRES', 3600))
+    
+    # 'section' sends and requests only the Projects section; 'document' round-trips the whole resume
+    TAILORING_MODE = os.environ.get('TAILORING_MODE', 'section')
+    # Stream model output to the preview page over SSE instead of polling a background job
+    TAILORING_STREAMING = os.environ.get('TAILORING_STREAMING', 'false').lower() in ['true', 'on', '1']
+    
+    # Tailoring response cache: 'memory', 'database', 'redis' or 'none'
+    TAILORING_CACHE_BACKEND = os.environ.get('TAILORING_CACHE_BACKEND', 'memory')
+    TAILORING_CACHE_TTL = int(os.environ.get('TAILORING_CACHE_TTL', 86400))
+    TAILORING_CACHE_MAX_ENTRIES = int(os.environ.get('TAILORING_CACHE_MAX_ENTRIES', 1024))
+    TAILORING_CACHE_REDIS_URL = os.environ.get('TAILORING_CACHE_REDIS_URL', 'redis://localhost:6379/1')
+    
+    # Where tailoring token/latency totals are kept: 'database' or 'redis' are shared by the
+    # web and worker processes; 'memory' only sees calls made in the serving process
+    TAILORING_METRICS_BACKEND = os.environ.get('TAILORING_METRICS_BACKEND', 'database')
+    TAILORING_METRICS_REDIS_URL = os.environ.get('TAILORING_METRICS_REDIS_URL', 'redis://localhost:6379/1')
+    
+    # Compiled PDF cache (set PDF_CACHE_DIR to an empty string to disable)
+    PDF_CACHE_DIR = os.environ.get('PDF_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'resume-pdf-cache'))
+    PDF_CACHE_MAX_ENTRIES = int(os.environ.get('PDF_CACHE_MAX_ENTRIES', 500))
+    # Persistent per-template pdflatex work directories (disabled unless set)
+    PDFLATEX_WORK_DIR = os.environ.get('PDFLATEX_WORK_DIR')
+    PDFLATEX_PRECOMPILE_PREAMBLE = os.environ.get('PDFLATEX_PRECOMPILE_PREAMBLE', 'true').lower() in ['true', 'on', '1']
+    # Bounded pdflatex worker pool
+    PDF_COMPILE_WORKERS = int(os.environ.get('PDF_COMPILE_WORKERS', 2))
+    PDF_COMPILE_QUEUE_SIZE = int(os.environ.get('PDF_COMPILE_QUEUE_SIZE', 8))
+    PDF_COMPILE_TIMEOUT = int(os.environ.get('PDF_COMPILE_TIMEOUT', 30))  # seconds
+    PDF_COMPILE_MEMORY_LIMIT_MB = int(os.environ.get('PDF_COMPILE_MEMORY_LIMIT_MB', 512))
+    PDF_COMPILE_RETRY_AFTER = int(os.environ.get('PDF_COMPILE_RETRY_AFTER', 5))  # seconds
+    
+    # Resume versions shown per page on /resume-versions
+    RESUME_VERSIONS_PER_PAGE = int(os.environ.get('RESUME_VERSIONS_PER_PAGE', 24))
+    
+    # Job descriptions accepted per /api/analyze-compatibility/batch call, and scored per streamed block
+    BATCH_COMPATIBILITY_MAX_JOBS = int(os.environ.get('BATCH_COMPATIBILITY_MAX_JOBS', 500))
+    BATCH_COMPATIBILITY_BLOCK_SIZE = int(os.environ.get('BATCH_COMPATIBILITY_BLOCK_SIZE', 25))
+    
+    # Seconds before the in-memory job keyword index reloads postings ingested by other processes
+    JOB_KEYWORD_INDEX_REFRESH = int(os.environ.get('JOB_KEYWORD_INDEX_REFRESH', 300))
+    
+    # Seconds between checks for changed visa sponsorship data, and how close a fuzzy company match must be
+    VISA_SPONSORSHIP_REFRESH = int(os.environ.get('VISA_SPONSORSHIP_REFRESH', 60))
+    VISA_SPONSORSHIP_MIN_SIMILARITY = float(os.environ.get('VISA_SPONSORSHIP_MIN_SIMILARITY', 0.5))
+    
+    # Skill taxonomy file (.json or .yaml; defaults to data/skill_taxonomy.json) and seconds between checks for edits
+    SKILL_TAXONOMY_PATH = os.environ.get('SKILL_TAXONOMY_PATH')
+    SKILL_TAXONOMY_REFRESH = int(os.environ.get('SKILL_TAXONOMY_REFRESH', 30))
+    
+    # Seconds before the in-memory IDF weights reload document frequencies updated by other processes
+    CORPUS_STATISTICS_REFRESH = int(os.environ.get('CORPUS_STATISTICS_REFRESH', 300))
 
 class DevelopmentConfig(Config):
     """Development configuration."""
@@ -32,6 +97,10 @@ class TestingConfig(Config):
     TESTING = True
     SQLALCHEMY_DATABASE_URI = os.environ.get('TEST_DATABASE_URL') or 'sqlite:///:memory:'
     WTF_CSRF_ENABLED = False
+    CELERY_BROKER_URL = 'memory://'
+    CELERY_RESULT_BACKEND = 'cache+memory://'
+    CELERY_TASK_ALWAYS_EAGER = True
+    PDF_CACHE_DIR = None
 
 class ProductionConfig(Config):
     """Production configuration."""
@@ -2,11 +2,48 @@
 import os
 from flask import Flask
 from flask_migrate import Migrate
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
 from models import db
 from config import config
+from services import search_index  # Registers the mapper events that keep full-text search in sync
+from services.taxonomy import DEFAULT_TAXONOMY_PATH, skill_taxonomy
 
 migrate = Migrate()
 
+def engine_options(app_config):
+    """Pool options for the configured database; SQLite keeps SQLAlchemy's defaults."""
+    url = make_url(app_config['SQLALCHEMY_DATABASE_URI'])
+    if url.get_backend_name() == 'sqlite':
+        return {}
+    return {
+        'pool_size': app_config['DATABASE_POOL_SIZE'],
+        'max_overflow': app_config['DATABASE_MAX_OVERFLOW'],
+        'pool_timeout': app_config['DATABASE_POOL_TIMEOUT'],
+        # Connections idle past the server's or a proxy's timeout are replaced, not reused
+        'pool_recycle': app_config['DATABASE_POOL_RECYCLE'],
+        'pool_pre_ping': app_config['DATABASE_POOL_PRE_PING'],
+    }
+
+def sqlite_pragmas(app_config):
+    """PRAGMA statements to run on each new SQLite connection."""
+    return [
+        f"PRAGMA journal_mode={app_config['SQLITE_JOURNAL_MODE']}",
+        f"PRAGMA synchronous={app_config['SQLITE_SYNCHRONOUS']}",
+        f"PRAGMA busy_timeout={int(app_config['SQLITE_BUSY_TIMEOUT'])}",
+    ]
+
+def configure_sqlite(engine, pragmas):
+    """Run pragmas on every connection the engine opens."""
+    @event.listens_for(engine, 'connect')
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
 def create_app(config_name=None):
     """Application factory pattern."""
     if config_name is None:
@@ -14,11 +51,20 @@ def create_app(config_name=None):
     
     app = Flask(__name__)
     app.config.from_object(config[config_name])
+    app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', engine_options(app.config))
     
     # Initialize extensions
     db.init_app(app)
     migrate.init_app(app, db)
     
+    with app.app_context():
+        if db.engine.dialect.name == 'sqlite':
+            configure_sqlite(db.engine, sqlite_pragmas(app.config))
+    
+    # Compile the skill taxonomy at startup; workers then follow edits to the file
+    skill_taxonomy.configure(app.config['SKILL_TAXONOMY_PATH'] or DEFAULT_TAXONOMY_PATH,
+                             app.config['SKILL_TAXONOMY_REFRESH'])
+    
     return app
 
 def init_db(app):
@@ -3,6 +3,7 @@ from wtforms import StringField, PasswordField, SelectField, TextAreaField, Sele
 from wtforms.validators import DataRequired, Email, EqualTo, Length, ValidationError
 from wtforms.widgets import CheckboxInput, ListWidget
 from models import User
+from services.taxonomy import skill_taxonomy
 
 class MultiCheckboxField(SelectMultipleField):
     """Custom field for multiple checkboxes."""
@@ -83,26 +84,14 @@ class ProfileForm(FlaskForm):
         ('Other', 'Other')
     ])
     
-    skills = MultiCheckboxField('Skills', choices=[
-        ('Python', 'Python'),
-        ('JavaScript', 'JavaScript'),
-        ('Java', 'Java'),
-        ('C++', 'C++'),
-        ('React', 'React'),
-        ('Node.js', 'Node.js'),
-        ('SQL', 'SQL'),
-        ('AWS', 'AWS'),
-        ('Docker', 'Docker'),
-        ('Machine Learning', 'Machine Learning'),
-        ('Data Science', 'Data Science'),
-        ('Frontend Development', 'Frontend Development'),
-        ('Backend Development', 'Backend Development'),
-        ('Full Stack Development', 'Full Stack Development'),
-        ('DevOps', 'DevOps'),
-        ('Mobile Development', 'Mobile Development')
-    ])
+    # Choices come from the skill taxonomy, so adding a skill needs no deploy
+    skills = MultiCheckboxField('Skills', choices=[])
     
     submit = SubmitField('Update Profile')
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.skills.choices = [(skill, skill) for skill in skill_taxonomy.current().profile_skills]
 
 class ResumeVersionForm(FlaskForm):
     """Form for creating and editing resume versions."""
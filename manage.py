@@ -60,5 +60,127 @@ def status(env):
         click.echo(f"  Job Postings: {job_count}")
         click.echo(f"  Companies with Visa Data: {company_count}")
 
+@cli.command()
+@click.option('--env', default='development', help='Environment to use (development, testing, production)')
+@click.option('--top-k', default=10, help='Number of matches to keep per user')
+@click.option('--min-score', default=0.0, help='Only keep matches scoring above this (0.0 to 1.0)')
+@click.option('--all', 'rematch_all', is_flag=True, help='Rescore every posting, not just unmatched ones')
+def match(env, top_k, min_score, rematch_all):
+    """Compute job matches for all users against new job postings."""
+    app = create_app(env)
+    with app.app_context():
+        from models.job_posting import JobPosting
+        from services.job_matching_service import JobMatchingService
+        
+        service = JobMatchingService()
+        if rematch_all:
+            job_ids = [job_id for job_id, in db.session.query(JobPosting.id)]
+        else:
+            job_ids = service.unmatched_job_ids()
+        
+        written = service.match_postings(job_ids, k=top_k, min_score=min_score)
+        click.echo(f"Scored {len(job_ids)} job postings; wrote {written} job matches.")
+
+@cli.command()
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--env', default='development', help='Environment to use (development, testing, production)')
+@click.option('--format', 'feed_format', type=click.Choice(['jsonl', 'csv']), help='Feed format (default: from the file extension)')
+@click.option('--source', help='Source to use for records that do not name one')
+@click.option('--chunk-size', default=1000, help='Records upserted per statement')
+def ingest(path, env, feed_format, source, chunk_size):
+    """Load job postings from a JSONL or CSV feed."""
+    app = create_app(env)
+    with app.app_context():
+        from services.job_ingest_service import JobPostingIngester
+        
+        stats = JobPostingIngester(chunk_size=chunk_size, default_source=source).ingest_file(path, feed_format)
+        click.echo(f"Ingested {path}:")
+        for name, value in stats.snapshot().items():
+            click.echo(f"  {name}: {value}")
+
+@cli.command()
+@click.option('--env', default='development', help='Environment to use (development, testing, production)')
+def reindex(env):
+    """Rebuild the job posting keyword index, the full-text search index and the corpus statistics."""
+    app = create_app(env)
+    with app.app_context():
+        from services.corpus_statistics import rebuild_document_frequencies
+        from services.job_index_service import JobKeywordIndex
+        from services.search_service import FullTextSearch
+        
+        written = JobKeywordIndex().rebuild()
+        click.echo(f"Keyword index rebuilt with {written} entries.")
+        FullTextSearch().rebuild()
+        click.echo("Full-text search index rebuilt.")
+        terms = rebuild_document_frequencies()
+        click.echo(f"Corpus statistics rebuilt for {terms} terms.")
+
+@cli.command('import-h1b')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--env', default='development', help='Environment to use (development, testing, production)')
+@click.option('--format', 'file_format', type=click.Choice(['csv', 'xlsx']), help='File format (default: from the file extension)')
+@click.option('--fiscal-year', type=int, help='Fiscal year of every row, for files without a year column')
+@click.option('--flush-every', default=50000, help='Employer-years held in memory before writing')
+def import_h1b(path, env, file_format, fiscal_year, flush_every):
+    """Load an H-1B employer disclosure file, replacing the fiscal years it contains."""
+    app = create_app(env)
+    with app.app_context():
+        from services.h1b_import_service import H1BImporter
+        
+        stats = H1BImporter(flush_every=flush_every, fiscal_year=fiscal_year).import_file(path, file_format)
+        click.echo(f"Imported {path}:")
+        for name, value in stats.snapshot().items():
+            click.echo(f"  {name}: {value}")
+
+@cli.command('migrate-resume-storage')
+@click.option('--env', default='development', help='Environment to use (development, testing, production)')
+@click.option('--batch-size', default=200, help='Resume versions converted per commit')
+@click.option('--gc', is_flag=True, help='Also delete content chunks no version references')
+@click.option('--gc-grace-hours', default=24.0, help='Keep unreferenced chunks written more recently than this')
+def migrate_resume_storage(env, batch_size, gc, gc_grace_hours):
+    """Move inline resume bodies into deduplicated content chunks."""
+    app = create_app(env)
+    with app.app_context():
+        from services.resume_storage import delete_unreferenced_chunks, migrate_resume_versions
+        
+        migrated = migrate_resume_versions(batch_size=batch_size)
+        click.echo(f"Moved {migrated} resume versions to chunked storage.")
+        if gc:
+            deleted = delete_unreferenced_chunks(grace_seconds=gc_grace_hours * 3600)
+            click.echo(f"Deleted {deleted} unreferenced content chunks.")
+
+@cli.command('refresh-fingerprints')
+@click.option('--env', default='development', help='Environment to use (development, testing, production)')
+@click.option('--batch-size', default=500, help='Rows recomputed per commit')
+def refresh_fingerprints(env, batch_size):
+    """Recompute keyword fingerprints computed with an older skill taxonomy, then rebuild what depends on them."""
+    app = create_app(env)
+    with app.app_context():
+        from services.corpus_statistics import rebuild_document_frequencies
+        from services.job_index_service import JobKeywordIndex
+        from services.keyword_fingerprints import refresh_fingerprints as refresh
+        from services.taxonomy import skill_taxonomy
+        
+        versions, postings = refresh(batch_size=batch_size)
+        click.echo(f"Taxonomy {skill_taxonomy.current().version}: refreshed {versions} resume versions "
+                   f"and {postings} job postings.")
+        written = JobKeywordIndex().rebuild()
+        click.echo(f"Keyword index rebuilt with {written} entries.")
+        terms = rebuild_document_frequencies()
+        click.echo(f"Corpus statistics rebuilt for {terms} terms.")
+
+@cli.command('check-taxonomy')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+def check_taxonomy(path):
+    """Validate a skill taxonomy file before deploying it."""
+    from services.taxonomy import InvalidTaxonomy, load_taxonomy
+    
+    try:
+        taxonomy = load_taxonomy(path)
+    except InvalidTaxonomy as e:
+        raise click.ClickException(str(e))
+    click.echo(f"Taxonomy {taxonomy.version}: {len(taxonomy.matcher)} skills, {len(taxonomy.aliases)} aliases, "
+               f"{len(taxonomy.categories)} categories.")
+
 if __name__ == '__main__':
     cli()
\ No newline at end of file
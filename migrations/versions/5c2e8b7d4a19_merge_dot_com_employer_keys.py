@@ -0,0 +1,98 @@
+"""Merge H-1B employer keys ending in 'com'
+
+Revision ID: 5c2e8b7d4a19
+Revises: 3a9d61c0f2b4
+Create Date: 2026-10-17 09:40:02.615390
+
+normalize_company now drops a trailing 'com' ("Amazon.com, Inc." is
+"amazon"), so h1b_employer_years rows keyed "amazon com" move to "amazon",
+adding into any row already there for the same fiscal year, and the
+visa_sponsorship_data totals of the merged employers are recounted.
+Merged rows cannot be told apart again, so downgrading leaves them as is.
+
+"""
+import re
+import unicodedata
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5c2e8b7d4a19'
+down_revision = '3a9d61c0f2b4'
+branch_labels = None
+depends_on = None
+
+
+# services.visa_sponsorship_service.normalize_company as of this revision
+_WORD_RE = re.compile(r'[a-z0-9]+')
+LEGAL_SUFFIXES = frozenset({
+    'inc', 'incorporated', 'llc', 'llp', 'lp', 'ltd', 'limited', 'corp', 'corporation', 'co',
+    'company', 'plc', 'gmbh', 'ag', 'sa', 'nv', 'bv', 'pvt', 'pte', 'holdings', 'group', 'com',
+})
+
+
+def normalize_company(name):
+    text = unicodedata.normalize('NFKD', name or '').encode('ascii', 'ignore').decode('ascii').lower()
+    words = _WORD_RE.findall(text.replace('&', ' and '))
+    stripped = words[1:] if words[:1] == ['the'] else list(words)
+    while stripped and stripped[-1] in LEGAL_SUFFIXES:
+        stripped.pop()
+    return ' '.join(stripped or words)
+
+
+employer_years = sa.table(
+    'h1b_employer_years',
+    sa.column('employer_key', sa.String), sa.column('fiscal_year', sa.Integer),
+    sa.column('employer_name', sa.String), sa.column('approvals', sa.Integer),
+    sa.column('denials', sa.Integer), sa.column('imported_at', sa.DateTime),
+)
+sponsorship_data = sa.table(
+    'visa_sponsorship_data',
+    sa.column('id', sa.Integer), sa.column('company_name', sa.String),
+    sa.column('h1b_approvals', sa.Integer), sa.column('h1b_denials', sa.Integer),
+)
+
+
+def upgrade():
+    connection = op.get_bind()
+    c = employer_years.c
+    rows = connection.execute(sa.select(
+        c.employer_key, c.fiscal_year, c.employer_name, c.approvals, c.denials, c.imported_at
+    ).where(c.employer_key.like('% com'))).all()
+
+    merged = set()
+    for key, year, name, approvals, denials, imported_at in rows:
+        new_key = normalize_company(key)
+        if new_key == key:
+            continue
+        connection.execute(employer_years.delete().where(
+            (c.employer_key == key) & (c.fiscal_year == year)))
+        updated = connection.execute(employer_years.update().where(
+            (c.employer_key == new_key) & (c.fiscal_year == year)
+        ).values(approvals=c.approvals + approvals, denials=c.denials + denials))
+        if not updated.rowcount:
+            connection.execute(employer_years.insert().values(
+                employer_key=new_key, fiscal_year=year, employer_name=name,
+                approvals=approvals, denials=denials, imported_at=imported_at))
+        merged.add(new_key)
+
+    if not merged:
+        return
+    totals = {
+        key: (approvals, denials) for key, approvals, denials in connection.execute(sa.select(
+            c.employer_key, sa.func.sum(c.approvals), sa.func.sum(c.denials)
+        ).where(c.employer_key.in_(sorted(merged))).group_by(c.employer_key))
+    }
+    s = sponsorship_data.c
+    for company_id, company_name in connection.execute(sa.select(s.id, s.company_name)).all():
+        key = normalize_company(company_name)
+        if key in totals:
+            approvals, denials = totals[key]
+            connection.execute(sponsorship_data.update().where(s.id == company_id).values(
+                h1b_approvals=int(approvals or 0), h1b_denials=int(denials or 0)))
+
+
+def downgrade():
+    pass
@@ -0,0 +1,50 @@
+"""Full-text search tables
+
+Revision ID: b607800486fd
+Revises: c11848297c3b
+Create Date: 2026-10-17 02:31:15.011706
+
+The tables are not ORM models; see services/search_index.py. Rows that
+existed before this revision are indexed by `python manage.py reindex`.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b607800486fd'
+down_revision = 'c11848297c3b'
+branch_labels = None
+depends_on = None
+
+
+CREATE = {
+    'sqlite': [
+        "CREATE VIRTUAL TABLE resume_search USING fts5("
+        "title, body, tokenize='porter unicode61')",
+        "CREATE VIRTUAL TABLE job_posting_search USING fts5("
+        "title, body, tokenize='porter unicode61')",
+    ],
+    'postgresql': [
+        "CREATE TABLE resume_search ("
+        "id INTEGER PRIMARY KEY REFERENCES resume_versions (id) ON DELETE CASCADE, "
+        "title TEXT NOT NULL, body TEXT NOT NULL, document TSVECTOR NOT NULL)",
+        "CREATE INDEX ix_resume_search_document ON resume_search USING GIN (document)",
+        "CREATE TABLE job_posting_search ("
+        "id INTEGER PRIMARY KEY REFERENCES job_postings (id) ON DELETE CASCADE, "
+        "title TEXT NOT NULL, body TEXT NOT NULL, document TSVECTOR NOT NULL)",
+        "CREATE INDEX ix_job_posting_search_document ON job_posting_search USING GIN (document)",
+    ],
+}
+
+
+def upgrade():
+    for statement in CREATE.get(op.get_bind().dialect.name, []):
+        op.execute(sa.text(statement))
+
+
+def downgrade():
+    if op.get_bind().dialect.name in CREATE:
+        op.execute(sa.text("DROP TABLE IF EXISTS job_posting_search"))
+        op.execute(sa.text("DROP TABLE IF EXISTS resume_search"))
@@ -1,28 +1,15 @@
-"""Initialize Flask-Migrate for database migrations."""
-import os
-from flask_migrate import init, migrate, upgrade
+"""Apply the Flask-Migrate migrations shipped in migrations/."""
+from flask_migrate import upgrade
 from database import create_app
 
 def setup_migrations():
-    """Set up Flask-Migrate for the application."""
+    """Bring the configured database up to the latest migration."""
     app = create_app()
     
     with app.app_context():
-        # Check if migrations directory exists
-        if not os.path.exists('migrations'):
-            print("Initializing Flask-Migrate...")
-            init()
-            print("Flask-Migrate initialized!")
-        
-        # Create initial migration
-        print("Creating initial migration...")
-        migrate(message='Initial migration')
-        print("Initial migration created!")
-        
-        # Apply migration
-        print("Applying migration...")
+        print("Applying migrations...")
         upgrade()
-        print("Migration applied successfully!")
+        print("Migrations applied successfully!")
 
 if __name__ == '__main__':
-    setup_migrations()
\ No newline at end of file
+    setup_migrations()
@@ -12,4 +12,10 @@ from .job_posting import JobPosting
 from .resume_version import ResumeVersion
 from .job_application import JobApplication
 from .job_match import JobMatch
-from .visa_sponsorship_data import VisaSponsorshipData
\ No newline at end of file
+from .visa_sponsorship_data import VisaSponsorshipData
+from .h1b_employer_year import H1BEmployerYear
+from .tailoring_cache_entry import TailoringCacheEntry
+from .job_posting_keyword import JobPostingKeyword
+from .corpus_term_statistic import CorpusTermStatistic
+from .content_chunk import ContentChunk
+from .metric_counter import MetricCounter
\ No newline at end of file
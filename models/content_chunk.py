@@ -0,0 +1,140 @@
+from . import db
+from datetime import datetime
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+from sqlalchemy import Text, event
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+# A section runs from its \section command up to the next \section, the end
+# of the document body or the end of the text, whichever comes first. Chunks
+# are cut here, and services.latex_sections indexes sections with the same pattern.
+SECTION_BOUNDARY_RE = re.compile(r'\\section\*?\s*\{([^}]*)\}|\\end\{document\}')
+
+class ContentChunk(db.Model):
+    """Immutable piece of resume LaTeX stored once and addressed by its hash."""
+    __tablename__ = 'content_chunks'
+
+    hash = db.Column(db.String(64), primary_key=True)  # SHA-256 of content
+    content = db.Column(Text, nullable=False)
+    # Last time a writer stored this chunk; garbage collection spares recently written chunks
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<ContentChunk {self.hash[:12]} ({len(self.content)} chars)>'
+
+
+def chunk_hash(content: str) -> str:
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def split_chunks(latex: str) -> List[str]:
+    """Cut a document at its section boundaries.
+
+    The first chunk is everything before the first ``\\section`` (preamble and
+    heading); each later chunk runs from one ``\\section`` to the next, and
+    the last one carries the document tail. Joining the chunks gives back the
+    original text exactly.
+    """
+    starts = []
+    for match in SECTION_BOUNDARY_RE.finditer(latex):
+        if match.group(1) is None:
+            break
+        if match.start() > 0:
+            starts.append(match.start())
+    bounds = [0] + starts + [len(latex)]
+    return [latex[begin:end] for begin, end in zip(bounds, bounds[1:]) if end > begin] or ['']
+
+
+class ContentCache:
+    """LRU of reconstructed documents keyed by their chunk-hash list.
+
+    Chunks never change once written, so an entry can never go stale; the
+    cache only needs a size bound.
+    """
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[Tuple[str, ...], str]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, hashes: Tuple[str, ...]) -> Optional[str]:
+        with self._lock:
+            content = self._entries.get(hashes)
+            if content is not None:
+                self._entries.move_to_end(hashes)
+            return content
+
+    def set(self, hashes: Tuple[str, ...], content: str) -> None:
+        with self._lock:
+            self._entries[hashes] = content
+            self._entries.move_to_end(hashes)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+content_cache = ContentCache()
+
+
+def load_content(hashes: Sequence[str]) -> str:
+    """Reassemble a document from its chunk hashes, via the content cache."""
+    key = tuple(hashes)
+    content = content_cache.get(key)
+    if content is None:
+        rows = db.session.query(ContentChunk.hash, ContentChunk.content).filter(
+            ContentChunk.hash.in_(set(key)))
+        chunks = dict(rows.all())
+        missing = [h for h in key if h not in chunks]
+        if missing:
+            raise LookupError(f"Missing content chunks: {', '.join(h[:12] for h in missing)}")
+        content = ''.join(chunks[h] for h in key)
+        content_cache.set(key, content)
+    return content
+
+
+_INSERTS = {
+    'sqlite': sqlite.insert,
+    'postgresql': postgresql.insert,
+}
+
+
+def store_chunks(connection, chunks: Dict[str, str]) -> None:
+    """Write chunks, stamping created_at now on hashes that are already stored.
+
+    The stamp tells delete_unreferenced_chunks that a version about to be
+    committed may point at the chunk, even though no committed row does yet.
+    """
+    if not chunks:
+        return
+    now = datetime.utcnow()
+    rows = [{'hash': h, 'content': content, 'created_at': now} for h, content in chunks.items()]
+    insert = _INSERTS.get(connection.dialect.name)
+    if insert is not None:
+        statement = insert(ContentChunk.__table__)
+        connection.execute(statement.on_conflict_do_update(
+            index_elements=['hash'], set_={'created_at': statement.excluded.created_at}), rows)
+        return
+    table = ContentChunk.__table__
+    existing = {h for h, in connection.execute(db.select(table.c.hash).where(table.c.hash.in_(list(chunks))))}
+    if existing:
+        connection.execute(table.update().where(table.c.hash.in_(existing)).values(created_at=now))
+    rows = [row for row in rows if row['hash'] not in existing]
+    if rows:
+        connection.execute(db.insert(table), rows)
+
+
+@event.listens_for(Session, 'before_flush')
+def _store_pending_chunks(session, flush_context, instances):
+    pending: Dict[str, str] = {}
+    for instance in list(session.new) + list(session.dirty):
+        chunks = instance.__dict__.pop('_pending_chunks', None)
+        if chunks:
+            pending.update(chunks)
+    store_chunks(session.connection(), pending)
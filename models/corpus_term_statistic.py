@@ -0,0 +1,15 @@
+from . import db
+
+class CorpusTermStatistic(db.Model):
+    """Document frequency of a vocabulary term across job posting fingerprints.
+
+    Maintained incrementally by job ingestion and rebuilt by ``manage.py
+    reindex``; services.corpus_statistics turns it into IDF weights.
+    """
+    __tablename__ = 'corpus_term_statistics'
+    
+    term = db.Column(db.String(100), primary_key=True)
+    document_frequency = db.Column(db.Integer, nullable=False, default=0)  # Postings whose fingerprint has the term
+    
+    def __repr__(self):
+        return f'<CorpusTermStatistic {self.term}: {self.document_frequency}>'
@@ -0,0 +1,20 @@
+from . import db
+from datetime import datetime
+
+class H1BEmployerYear(db.Model):
+    """H-1B petition decisions for one employer in one fiscal year.
+
+    Imports replace whole fiscal years here; VisaSponsorshipData holds the
+    totals across years.
+    """
+    __tablename__ = 'h1b_employer_years'
+    
+    employer_key = db.Column(db.String(255), primary_key=True)  # normalize_company() of the employer name
+    fiscal_year = db.Column(db.Integer, primary_key=True, index=True)
+    employer_name = db.Column(db.String(255), nullable=False)  # As written in the disclosure file
+    approvals = db.Column(db.Integer, nullable=False, default=0)
+    denials = db.Column(db.Integer, nullable=False, default=0)
+    imported_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<H1BEmployerYear {self.employer_key} FY{self.fiscal_year}>'
@@ -5,6 +5,10 @@ from sqlalchemy import String, Text, JSON
 class JobPosting(db.Model):
     """Job posting model for storing job opportunities."""
     __tablename__ = 'job_postings'
+    __table_args__ = (
+        # Feeds are re-ingested daily; a posting is identified by where it came from
+        db.Index('uq_job_postings_source_external_id', 'source', 'external_id', unique=True),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(255), nullable=False)
@@ -12,6 +16,8 @@ class JobPosting(db.Model):
     location = db.Column(db.String(255))
     description = db.Column(Text)
     requirements = db.Column(JSON, default=list)
+    keyword_fingerprint = db.Column(JSON)  # Sorted keywords extracted from description and requirements
+    keyword_taxonomy_version = db.Column(db.String(64))  # Skill taxonomy the fingerprint was computed with
     visa_sponsorship = db.Column(db.Boolean, default=False, index=True)
     visa_types = db.Column(JSON, default=list)  # e.g., ['H1B', 'L1', 'O1']
     salary_min = db.Column(db.Integer)
@@ -0,0 +1,12 @@
+from . import db
+
+class JobPostingKeyword(db.Model):
+    """Inverted index entry: a vocabulary term that occurs in a job posting."""
+    __tablename__ = 'job_posting_keywords'
+    
+    # The (term, job_id) primary key doubles as the posting list for each term
+    term = db.Column(db.String(100), primary_key=True)
+    job_id = db.Column(db.Integer, db.ForeignKey('job_postings.id', ondelete='CASCADE'), primary_key=True, index=True)
+    
+    def __repr__(self):
+        return f'<JobPostingKeyword {self.term} -> {self.job_id}>'
@@ -0,0 +1,15 @@
+from . import db
+
+class MetricCounter(db.Model):
+    """A named running total shared by the web and Celery worker processes.
+
+    Written by services.metric_counters; names are namespaced, e.g.
+    ``tailoring.section.prompt_tokens``.
+    """
+    __tablename__ = 'metric_counters'
+    
+    name = db.Column(db.String(200), primary_key=True)
+    value = db.Column(db.Float, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f'<MetricCounter {self.name}: {self.value}>'
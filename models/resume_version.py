@@ -1,19 +1,54 @@
 from . import db
 from datetime import datetime
+from sqlalchemy import JSON
+from .content_chunk import chunk_hash, content_cache, load_content, split_chunks
 
 class ResumeVersion(db.Model):
     """Resume version model for storing multiple resume variations."""
     __tablename__ = 'resume_versions'
+    __table_args__ = (
+        # Also serves lookups by user_id alone, as its leftmost column
+        db.Index('ix_resume_versions_user_id_category', 'user_id', 'category'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
     name = db.Column(db.String(255), nullable=False)  # e.g., "Software Engineer", "Data Scientist"
-    latex_content = db.Column(db.Text, nullable=False)
+    # Inline body of rows saved before chunked storage; empty once the body lives in content_chunks
+    inline_content = db.Column('latex_content', db.Text, nullable=False, default='')
+    chunk_hashes = db.Column(JSON)  # Ordered ContentChunk hashes that make up the LaTeX body
     category = db.Column(db.String(100))  # e.g., "Engineering", "Data Science", "Product"
+    keyword_fingerprint = db.Column(JSON)  # Sorted keywords extracted from latex_content
+    keyword_taxonomy_version = db.Column(db.String(64))  # Skill taxonomy the fingerprint was computed with
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
     # Relationships
     job_applications = db.relationship('JobApplication', backref='resume_version', lazy='dynamic')
     
     def __repr__(self):
-        return f'<ResumeVersion {self.name} for User {self.user_id}>'
\ No newline at end of file
+        return f'<ResumeVersion {self.name} for User {self.user_id}>'
+    
+    @property
+    def latex_content(self):
+        """The full LaTeX body, reassembled from its section chunks."""
+        if self.chunk_hashes is None:
+            return self.inline_content
+        return load_content(self.chunk_hashes)
+    
+    @latex_content.setter
+    def latex_content(self, latex):
+        chunks = split_chunks(latex)
+        hashes = [chunk_hash(chunk) for chunk in chunks]
+        # Chunks are written by a before_flush hook; until then reads are served from the cache
+        self.__dict__.setdefault('_pending_chunks', {}).update(zip(hashes, chunks))
+        content_cache.set(tuple(hashes), latex)
+        self.chunk_hashes = hashes
+        self.inline_content = ''
+    
+    def share_content(self, other):
+        """Point this version at another version's body without copying it."""
+        if other.chunk_hashes is None:
+            self.latex_content = other.latex_content
+        else:
+            self.chunk_hashes = list(other.chunk_hashes)
+            self.inline_content = ''
@@ -0,0 +1,15 @@
+from . import db
+from datetime import datetime
+from sqlalchemy import Text
+
+class TailoringCacheEntry(db.Model):
+    """Cached tailoring result keyed by a hash of its inputs."""
+    __tablename__ = 'tailoring_cache'
+    
+    key = db.Column(db.String(64), primary_key=True)  # SHA-256 of model, prompt version and inputs
+    latex_content = db.Column(Text, nullable=False)
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
+    accessed_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+    
+    def __repr__(self):
+        return f'<TailoringCacheEntry {self.key[:12]}>'
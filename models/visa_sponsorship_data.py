@@ -2,6 +2,13 @@ from . import db
 from datetime import datetime
 from sqlalchemy import String, JSON
 
+def approval_rate(approvals, denials):
+    """H1B approval percentage, or None without any decisions."""
+    total = (approvals or 0) + (denials or 0)
+    if total == 0:
+        return None
+    return ((approvals or 0) / total) * 100
+
 class VisaSponsorshipData(db.Model):
     """Visa sponsorship data model for tracking company visa history."""
     __tablename__ = 'visa_sponsorship_data'
@@ -11,7 +18,7 @@ class VisaSponsorshipData(db.Model):
     visa_types_sponsored = db.Column(JSON, default=list)  # e.g., ['H1B', 'L1', 'O1']
     h1b_approvals = db.Column(db.Integer, default=0)
     h1b_denials = db.Column(db.Integer, default=0)
-    last_updated = db.Column(db.DateTime, default=datetime.utcnow)
+    last_updated = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     def __repr__(self):
         return f'<VisaSponsorshipData {self.company_name}>'
@@ -19,10 +26,7 @@ class VisaSponsorshipData(db.Model):
     @property
     def h1b_approval_rate(self):
         """Calculate H1B approval rate."""
-        total = self.h1b_approvals + self.h1b_denials
-        if total == 0:
-            return None
-        return (self.h1b_approvals / total) * 100
+        return approval_rate(self.h1b_approvals, self.h1b_denials)
     
     @property
     def sponsors_visas(self):
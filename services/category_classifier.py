@@ -0,0 +1,116 @@
+"""Job category classification from a job description's text."""
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+from services.keyword_matcher import KeywordMatcher
+
+# Category returned when no rule or keyword matches
+OTHER = 'Other'
+
+
+def _variants(term: str) -> Set[str]:
+    """A term and its plural, so "developers" counts as "developer"."""
+    if term[-1:].isalpha() and not term.endswith('s'):
+        return {term, term + 's'}
+    return {term}
+
+
+class CategoryClassifier:
+    """Classify job descriptions with one keyword-matcher pass each.
+
+    ``rules`` are (category, role terms) pairs checked in order: the first
+    category with any of its role terms present wins outright. Otherwise the
+    category with the most distinct ``category_keywords`` present wins, ties
+    going to the earlier category. Rule terms and keywords share one
+    KeywordMatcher, so a description is tokenized and scanned once.
+    ``aliases`` of rule terms or keywords count as the term they spell.
+
+    Results are memoized by a digest of the description in a bounded LRU,
+    so postings re-seen across feed runs are not rescanned.
+    """
+
+    def __init__(self, category_keywords: Mapping[str, Iterable[str]],
+                 rules: Sequence[Tuple[str, Iterable[str]]] = (), max_entries: int = 4096,
+                 aliases: Optional[Mapping[str, str]] = None):
+        self.max_entries = max_entries
+        self.categories: List[str] = list(category_keywords)
+
+        # Each matched term maps to the rule tier it decides and the categories it scores for
+        self._rule_tier: Dict[str, int] = {}
+        self._rule_categories: List[str] = []
+        for tier, (category, terms) in enumerate(rules):
+            self._rule_categories.append(category)
+            for term in terms:
+                for variant in _variants(term.lower()):
+                    self._rule_tier.setdefault(variant, tier)
+
+        self._keyword_of: Dict[str, str] = {}
+        self._categories_of: Dict[str, List[int]] = {}
+        for position, keywords in enumerate(category_keywords.values()):
+            for keyword in keywords:
+                keyword = keyword.lower()
+                for variant in _variants(keyword):
+                    self._keyword_of.setdefault(variant, keyword)
+                categories = self._categories_of.setdefault(keyword, [])
+                if position not in categories:
+                    categories.append(position)
+
+        terms = set(self._rule_tier) | set(self._keyword_of)
+        self.matcher = KeywordMatcher(terms, {
+            alias.lower(): target.lower() for alias, target in (aliases or {}).items()
+            if target.lower() in terms
+        })
+        self._cache: 'OrderedDict[bytes, str]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _classify(self, text: str) -> str:
+        found = self.matcher.find(text)
+
+        tiers = [self._rule_tier[term] for term in found if term in self._rule_tier]
+        if tiers:
+            return self._rule_categories[min(tiers)]
+
+        counts = [0] * len(self.categories)
+        for keyword in {self._keyword_of[term] for term in found if term in self._keyword_of}:
+            for position in self._categories_of[keyword]:
+                counts[position] += 1
+        if not counts or max(counts) == 0:
+            return OTHER
+        return self.categories[counts.index(max(counts))]
+
+    @staticmethod
+    def digest(text: str) -> bytes:
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+    def _cached(self, key: bytes) -> Optional[str]:
+        with self._lock:
+            category = self._cache.get(key)
+            if category is not None:
+                self._cache.move_to_end(key)
+            return category
+
+    def _remember(self, key: bytes, category: str) -> None:
+        with self._lock:
+            self._cache[key] = category
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+    def classify(self, text: str) -> str:
+        """Category of one job description."""
+        key = self.digest(text)
+        category = self._cached(key)
+        if category is None:
+            category = self._classify(text)
+            self._remember(key, category)
+        return category
+
+    def classify_many(self, texts: Iterable[str]) -> List[str]:
+        """Categories of many descriptions, e.g. a feed chunk; repeats are classified once."""
+        return [self.classify(text or '') for text in texts]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
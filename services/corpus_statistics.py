@@ -0,0 +1,153 @@
+"""Corpus document frequencies and IDF-weighted compatibility scoring."""
+import math
+import threading
+import time
+from collections import Counter
+from typing import Dict, Iterable, Mapping, Optional, Sequence
+
+from sqlalchemy import func, insert
+from sqlalchemy.dialects import postgresql, sqlite
+
+from models import db
+from models.corpus_term_statistic import CorpusTermStatistic
+from models.job_posting import JobPosting
+from services.keyword_matcher import KeywordMatcher
+from services.taxonomy import Taxonomy, skill_taxonomy
+
+_UPSERT_INSERTS = {
+    'sqlite': sqlite.insert,
+    'postgresql': postgresql.insert,
+}
+
+
+def bm25_idf(document_frequency: int, documents: int) -> float:
+    """BM25 inverse document frequency, kept positive for terms in most documents."""
+    return math.log(1.0 + (documents - document_frequency + 0.5) / (document_frequency + 0.5))
+
+
+def fingerprint_deltas(previous: Iterable[Optional[Sequence[str]]],
+                       current: Iterable[Optional[Sequence[str]]]) -> Dict[str, int]:
+    """Document frequency changes when ``previous`` fingerprints are replaced by ``current`` ones."""
+    deltas: Counter = Counter()
+    for fingerprint in current:
+        deltas.update(set(fingerprint or ()))
+    for fingerprint in previous:
+        deltas.subtract(set(fingerprint or ()))
+    return {term: delta for term, delta in deltas.items() if delta}
+
+
+def update_document_frequencies(deltas: Mapping[str, int]) -> None:
+    """Add per-term deltas to corpus_term_statistics in one statement. Does not commit."""
+    if not deltas:
+        return
+    dialect = db.engine.dialect.name
+    dialect_insert = _UPSERT_INSERTS.get(dialect)
+    if dialect_insert is None:
+        raise ValueError(f"Bulk upsert is not supported on {dialect}")
+
+    table = CorpusTermStatistic.__table__
+    statement = dialect_insert(table)
+    statement = statement.on_conflict_do_update(
+        index_elements=['term'],
+        set_={'document_frequency': table.c.document_frequency + statement.excluded.document_frequency}
+    )
+    db.session.execute(statement, [{'term': term, 'document_frequency': delta}
+                                   for term, delta in sorted(deltas.items())])
+
+
+def rebuild_document_frequencies(batch_size: int = 1000) -> int:
+    """Recount document frequencies from job_postings; returns the number of terms."""
+    counts: Counter = Counter()
+    last_id = 0
+    while True:
+        rows = db.session.query(JobPosting.id, JobPosting.keyword_fingerprint).filter(
+            JobPosting.id > last_id).order_by(JobPosting.id).limit(batch_size).all()
+        if not rows:
+            break
+        for _, fingerprint in rows:
+            counts.update(set(fingerprint or ()))
+        last_id = rows[-1].id
+
+    CorpusTermStatistic.query.delete()
+    if counts:
+        db.session.execute(insert(CorpusTermStatistic), [
+            {'term': term, 'document_frequency': count} for term, count in sorted(counts.items())
+        ])
+    db.session.commit()
+    return len(counts)
+
+
+class CorpusStatistics:
+    """IDF weights for a matcher's vocabulary, indexed like its keyword bits.
+
+    ``idf[i]`` is the weight of ``matcher.vocabulary[i]``, so a score only
+    walks the set bits of two keyword masks: a handful of list lookups and
+    additions, with no database access.
+    """
+
+    def __init__(self, matcher: KeywordMatcher, documents: int, document_frequencies: Mapping[str, int]):
+        self.matcher = matcher
+        self.documents = documents
+        self.idf = [bm25_idf(max(document_frequencies.get(term, 0), 0), documents) for term in matcher.vocabulary]
+
+    @classmethod
+    def load(cls, matcher: KeywordMatcher) -> 'CorpusStatistics':
+        """Read the corpus size and document frequencies for the matcher's vocabulary."""
+        documents = db.session.query(func.count(JobPosting.id)).scalar()
+        frequencies = dict(db.session.query(CorpusTermStatistic.term, CorpusTermStatistic.document_frequency))
+        return cls(matcher, documents, frequencies)
+
+    def weight(self, mask: int) -> float:
+        """Sum of the IDF weights of the terms in a keyword mask."""
+        idf = self.idf
+        total = 0.0
+        while mask:
+            lowest = mask & -mask
+            total += idf[lowest.bit_length() - 1]
+            mask ^= lowest
+        return total
+
+    def score(self, resume_mask: int, job_mask: int) -> float:
+        """Share of the job's keyword weight the resume covers, from 0.0 to 1.0.
+
+        This is BM25 over keyword sets: a term occurs at most once per
+        fingerprint, so term-frequency saturation and length normalization
+        drop out and each matched term counts by its IDF alone. Rare skills
+        such as "kubernetes" outweigh ubiquitous ones such as "git".
+        """
+        total = self.weight(job_mask)
+        return self.weight(resume_mask & job_mask) / total if total else 0.0
+
+
+class CorpusStatisticsStore:
+    """Process-wide IDF snapshot for the current skill taxonomy.
+
+    The snapshot is reloaded from corpus_term_statistics every
+    ``refresh_seconds``, and rebuilt at once when the taxonomy's vocabulary
+    changes, so scores never mix bit positions from two vocabularies.
+    """
+
+    def __init__(self, refresh_seconds: float = 300):
+        self.refresh_seconds = refresh_seconds
+        self._statistics: Optional[CorpusStatistics] = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def statistics(self, taxonomy: Optional[Taxonomy] = None) -> CorpusStatistics:
+        """Return the IDF snapshot for a taxonomy (the current one by default)."""
+        matcher = (taxonomy if taxonomy is not None else skill_taxonomy.current()).matcher
+        statistics = self._statistics
+        if (statistics is not None and statistics.matcher is matcher
+                and time.monotonic() - self._loaded_at <= self.refresh_seconds):
+            return statistics
+        with self._lock:
+            if (self._statistics is None or self._statistics.matcher is not matcher
+                    or time.monotonic() - self._loaded_at > self.refresh_seconds):
+                self._statistics = CorpusStatistics.load(matcher)
+                self._loaded_at = time.monotonic()
+            return self._statistics
+
+    def clear(self) -> None:
+        """Drop the snapshot; the next score reloads it."""
+        with self._lock:
+            self._statistics = None
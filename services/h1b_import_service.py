@@ -0,0 +1,279 @@
+"""Streaming import of public H-1B employer disclosure data."""
+import csv
+import os
+import re
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.dialects import postgresql, sqlite
+
+from models import db
+from models.h1b_employer_year import H1BEmployerYear
+from models.visa_sponsorship_data import VisaSponsorshipData
+from services.job_ingest_service import IngestStats
+from services.visa_sponsorship_service import normalize_company
+
+# Header spellings used by the USCIS H-1B Employer Data Hub and DOL LCA disclosure files
+EMPLOYER_COLUMNS = ('employer', 'employer_petitioner_name', 'employer_name', 'petitioner_name')
+YEAR_COLUMNS = ('fiscal_year', 'fy')
+STATUS_COLUMNS = ('case_status',)
+
+_HEADER_RE = re.compile(r'[^a-z0-9]+')
+
+_UPSERT_INSERTS = {
+    'sqlite': sqlite.insert,
+    'postgresql': postgresql.insert,
+}
+
+
+class InvalidDisclosureFile(ValueError):
+    """Raised for a file without the columns an H-1B import needs."""
+
+
+def normalize_header(name: Any) -> str:
+    return _HEADER_RE.sub('_', str(name or '').strip().lower()).strip('_')
+
+
+def iter_csv_rows(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield one dict per CSV row; the UTF-8 BOM Excel writes is ignored."""
+    with open(path, newline='', encoding='utf-8-sig') as stream:
+        yield from csv.DictReader(stream)
+
+
+def iter_xlsx_rows(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield one dict per row of the first worksheet, reading it as a stream."""
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = next(rows, None) or ()
+        for values in rows:
+            yield dict(zip(header, values))
+    finally:
+        workbook.close()
+
+
+H1B_READERS = {
+    'csv': iter_csv_rows,
+    'xlsx': iter_xlsx_rows,
+}
+
+
+def detect_h1b_format(path: str) -> str:
+    """Pick the reader from the file extension."""
+    extension = os.path.splitext(path)[1].lower().lstrip('.')
+    if extension in H1B_READERS:
+        return extension
+    raise ValueError(f"Cannot detect the format of {path}; pass it explicitly")
+
+
+def _as_count(value) -> int:
+    if value is None or value == '':
+        return 0
+    if isinstance(value, str):
+        value = value.replace(',', '').strip() or 0
+    return int(float(value))
+
+
+class DisclosureColumns:
+    """Where employer, year and decision counts live in one file's header.
+
+    Employer Data Hub files have one row per employer with count columns
+    (every column named ``... Approval(s)`` or ``... Denial(s)`` is summed).
+    LCA disclosure files have one row per case with a ``CASE_STATUS``.
+    """
+
+    def __init__(self, header: Iterable[Any], fiscal_year: Optional[int] = None):
+        columns = {normalize_header(name): name for name in header}
+        self.employer = next((columns[c] for c in EMPLOYER_COLUMNS if c in columns), None)
+        self.year = next((columns[c] for c in YEAR_COLUMNS if c in columns), None)
+        self.status = next((columns[c] for c in STATUS_COLUMNS if c in columns), None)
+        self.approvals = [name for key, name in columns.items() if key.endswith(('approval', 'approvals'))]
+        self.denials = [name for key, name in columns.items() if key.endswith(('denial', 'denials'))]
+        self.fiscal_year = fiscal_year
+
+        if self.employer is None:
+            raise InvalidDisclosureFile('No employer column found')
+        if self.status is None and not (self.approvals or self.denials):
+            raise InvalidDisclosureFile('No approval/denial counts or case status column found')
+        if self.year is None and fiscal_year is None:
+            raise InvalidDisclosureFile('No fiscal year column found; pass the fiscal year explicitly')
+
+    def parse(self, record: Dict[str, Any]) -> Optional[Tuple[str, int, int, int]]:
+        """Return (employer name, fiscal year, approvals, denials), or None to skip the row."""
+        name = str(record.get(self.employer) or '').strip()
+        year = self.fiscal_year if self.fiscal_year is not None else _as_count(record.get(self.year))
+        if not name or not year:
+            return None
+
+        if self.status is not None:
+            status = str(record.get(self.status) or '').strip().lower()
+            if status.startswith('certified'):
+                return name, year, 1, 0
+            if status.startswith('denied'):
+                return name, year, 0, 1
+            return None
+
+        approvals = sum(_as_count(record.get(column)) for column in self.approvals)
+        denials = sum(_as_count(record.get(column)) for column in self.denials)
+        return name, year, approvals, denials
+
+
+class H1BImportStats(IngestStats):
+    """Ingest counters plus what the import touched."""
+
+    def __init__(self):
+        super().__init__()
+        self.fiscal_years: Set[int] = set()
+        self.employers_updated = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        snapshot = super().snapshot()
+        del snapshot['duplicates']
+        snapshot['fiscal_years'] = ', '.join(str(year) for year in sorted(self.fiscal_years))
+        snapshot['employers_updated'] = self.employers_updated
+        return snapshot
+
+
+class H1BImporter:
+    """Load disclosure files into h1b_employer_years and visa_sponsorship_data.
+
+    Rows are summed per (normalized employer, fiscal year) in memory and
+    flushed with an additive upsert every ``flush_every`` distinct pairs, so
+    memory is bounded by employers rather than by rows. The first flush of a
+    fiscal year deletes what an earlier import stored for it; loading a new
+    or corrected yearly file therefore replaces just that year. Finally the
+    totals of every employer touched are recomputed across all years and
+    upserted into visa_sponsorship_data, matching existing companies by
+    normalized name.
+    """
+
+    def __init__(self, flush_every: int = 50_000, fiscal_year: Optional[int] = None):
+        self.flush_every = flush_every
+        self.fiscal_year = fiscal_year
+
+    def _insert(self):
+        dialect = db.engine.dialect.name
+        insert = _UPSERT_INSERTS.get(dialect)
+        if insert is None:
+            raise ValueError(f"Bulk upsert is not supported on {dialect}")
+        return insert
+
+    def import_file(self, path: str, file_format: Optional[str] = None) -> H1BImportStats:
+        """Stream a CSV or XLSX disclosure file into the database."""
+        reader = H1B_READERS[file_format or detect_h1b_format(path)]
+        return self.import_records(reader(path))
+
+    def import_records(self, records: Iterable[Dict[str, Any]]) -> H1BImportStats:
+        """Aggregate and store disclosure rows from any iterable of dicts."""
+        stats = H1BImportStats()
+        insert = self._insert()
+        cleared: Set[int] = set()
+        touched: Set[str] = set()
+        pending: Dict[Tuple[str, int], List] = {}
+        columns = None
+
+        for record in records:
+            stats.rows_read += 1
+            if columns is None:
+                columns = DisclosureColumns(record.keys(), self.fiscal_year)
+            parsed = columns.parse(record)
+            key = normalize_company(parsed[0]) if parsed else ''
+            if not key:
+                stats.rows_skipped += 1
+                continue
+
+            name, year, approvals, denials = parsed
+            entry = pending.get((key, year))
+            if entry is None:
+                pending[(key, year)] = [name, approvals, denials]
+            else:
+                entry[1] += approvals
+                entry[2] += denials
+            if len(pending) >= self.flush_every:
+                self._flush(insert, pending, cleared, touched, stats)
+                pending = {}
+
+        self._flush(insert, pending, cleared, touched, stats)
+        stats.employers_updated = self._update_totals(insert, touched)
+        stats.finished = time.monotonic()
+        return stats
+
+    def _flush(self, insert, pending, cleared: Set[int], touched: Set[str], stats: H1BImportStats) -> None:
+        if not pending:
+            return
+        for year in {year for _, year in pending} - cleared:
+            previous = H1BEmployerYear.query.filter(H1BEmployerYear.fiscal_year == year)
+            touched.update(key for key, in previous.with_entities(H1BEmployerYear.employer_key))
+            previous.delete(synchronize_session=False)
+            cleared.add(year)
+
+        now = datetime.utcnow()
+        rows = [
+            {'employer_key': key, 'fiscal_year': year, 'employer_name': name[:255],
+             'approvals': approvals, 'denials': denials, 'imported_at': now}
+            for (key, year), (name, approvals, denials) in pending.items()
+        ]
+        table = H1BEmployerYear.__table__
+        statement = insert(table)
+        # A pair can span flushes when a year's rows are not grouped in the file
+        statement = statement.on_conflict_do_update(
+            index_elements=['employer_key', 'fiscal_year'],
+            set_={'approvals': table.c.approvals + statement.excluded.approvals,
+                  'denials': table.c.denials + statement.excluded.denials,
+                  'imported_at': statement.excluded.imported_at}
+        )
+        db.session.execute(statement, rows)
+        db.session.commit()
+
+        touched.update(key for key, _ in pending)
+        stats.fiscal_years.update(year for _, year in pending)
+        stats.rows_written += len(rows)
+        stats.chunks += 1
+
+    def _update_totals(self, insert, keys: Set[str], batch_size: int = 500) -> int:
+        if not keys:
+            return 0
+        existing: Dict[str, Tuple[str, List[str]]] = {}
+        for name, visa_types in db.session.query(VisaSponsorshipData.company_name,
+                                                 VisaSponsorshipData.visa_types_sponsored):
+            existing.setdefault(normalize_company(name), (name, list(visa_types or [])))
+
+        table = VisaSponsorshipData.__table__
+        statement = insert(table)
+        statement = statement.on_conflict_do_update(
+            index_elements=['company_name'],
+            set_={column: statement.excluded[column] for column in
+                  ('visa_types_sponsored', 'h1b_approvals', 'h1b_denials', 'last_updated')}
+        )
+
+        updated = 0
+        keys = sorted(keys)
+        now = datetime.utcnow()
+        for start in range(0, len(keys), batch_size):
+            batch = keys[start:start + batch_size]
+            totals = {
+                key: (name, approvals, denials) for key, name, approvals, denials in db.session.query(
+                    H1BEmployerYear.employer_key, func.max(H1BEmployerYear.employer_name),
+                    func.sum(H1BEmployerYear.approvals), func.sum(H1BEmployerYear.denials)
+                ).filter(H1BEmployerYear.employer_key.in_(batch)).group_by(H1BEmployerYear.employer_key)
+            }
+            rows = []
+            for key in batch:
+                name, approvals, denials = totals.get(key, (None, 0, 0))
+                company_name, visa_types = existing.get(key, (name, []))
+                if company_name is None:
+                    continue  # Dropped from a reloaded year and never stored as a company
+                if approvals and 'H1B' not in visa_types:
+                    visa_types = visa_types + ['H1B']
+                rows.append({'company_name': company_name[:255], 'visa_types_sponsored': visa_types,
+                             'h1b_approvals': int(approvals or 0), 'h1b_denials': int(denials or 0),
+                             'last_updated': now})
+            if rows:
+                db.session.execute(statement, rows)
+                updated += len(rows)
+        db.session.commit()
+        return updated
@@ -0,0 +1,208 @@
+"""Inverted keyword index over job postings."""
+import threading
+import time
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import insert
+
+from models import db
+from models.job_posting import JobPosting
+from models.job_posting_keyword import JobPostingKeyword
+from services.taxonomy import skill_taxonomy
+
+
+def bitmap(ids: Iterable[int]) -> int:
+    """Pack ids into an int whose bit ``i`` is set for each id ``i``."""
+    ids = np.fromiter(ids, dtype=np.int64)
+    if ids.size == 0:
+        return 0
+    bits = np.zeros(int(ids.max()) + 1, dtype=np.uint8)
+    bits[ids] = 1
+    return int.from_bytes(np.packbits(bits, bitorder='little').tobytes(), 'little')
+
+
+class KeywordBitmaps:
+    """Posting lists held in memory as bitmaps, one per term.
+
+    Python ints serve as the bitmaps: AND, OR and XOR over them run in C, so
+    ranking postings by overlap costs a few dozen whole-bitmap operations
+    regardless of how many postings match.
+    """
+
+    def __init__(self):
+        self.terms: Dict[str, int] = {}
+        self.sponsored = 0
+        self.indexed = 0
+
+    def update(self, postings: Sequence[Mapping]) -> None:
+        """Replace the entries of the given postings."""
+        chunk = bitmap(posting['id'] for posting in postings)
+        keep = ~chunk
+
+        ids_by_term: Dict[str, List[int]] = {}
+        for posting in postings:
+            for term in posting['keyword_fingerprint'] or ():
+                ids_by_term.setdefault(term, []).append(posting['id'])
+
+        for term in set(self.terms) | set(ids_by_term):
+            self.terms[term] = (self.terms.get(term, 0) & keep) | bitmap(ids_by_term.get(term, ()))
+        self.sponsored = (self.sponsored & keep) | bitmap(
+            posting['id'] for posting in postings if posting['visa_sponsorship'])
+        self.indexed |= chunk
+
+    def top(self, terms: Iterable[str], limit: int, mask: Optional[int] = None) -> List[Tuple[int, int]]:
+        """Return (job_id, overlap) for the postings sharing the most terms.
+
+        Overlap counts are kept bit-sliced: ``counts[i]`` holds bit ``i`` of
+        every posting's count, and adding a term is a ripple-carry addition
+        across the slices. Ties go to the highest (newest) id.
+        """
+        counts: List[int] = []
+        matched = 0
+        for term in set(terms):
+            carry = self.terms.get(term, 0)
+            matched |= carry
+            for i, digit in enumerate(counts):
+                counts[i], carry = digit ^ carry, digit & carry
+                if not carry:
+                    break
+            if carry:
+                counts.append(carry)
+
+        if mask is not None:
+            matched &= mask
+
+        results: List[Tuple[int, int]] = []
+        for overlap in range(2 ** len(counts) - 1, 0, -1):
+            if not matched or len(results) >= limit:
+                break
+            level = matched
+            for i, digit in enumerate(counts):
+                level &= digit if overlap >> i & 1 else ~digit
+            matched &= ~level
+            while level and len(results) < limit:
+                job_id = level.bit_length() - 1
+                results.append((job_id, overlap))
+                level ^= 1 << job_id
+        return results
+
+
+class JobKeywordIndex:
+    """Posting lists from vocabulary terms to job posting ids.
+
+    The lists are stored in the job_posting_keywords table, which ingest
+    updates chunk by chunk and every process can read. Searches run against
+    an in-memory bitmap copy of the table, loaded on first use and reloaded
+    after ``refresh_seconds`` so postings ingested by other processes show
+    up. Postings indexed in this process are applied to the copy right away.
+    """
+
+    def __init__(self, refresh_seconds: float = 300):
+        self.refresh_seconds = refresh_seconds
+        self._bitmaps: Optional[KeywordBitmaps] = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def posting_terms(posting) -> List[str]:
+        """Terms to index for a posting: its fingerprint if current, or a fresh extraction."""
+        taxonomy = skill_taxonomy.current()
+        if taxonomy.is_current(posting.keyword_fingerprint, posting.keyword_taxonomy_version):
+            return posting.keyword_fingerprint
+        return taxonomy.fingerprint(posting.description, ' , '.join(posting.requirements or []))
+
+    def index(self, postings: Sequence[Mapping]) -> int:
+        """Replace the index entries of postings. Does not commit.
+
+        Each posting is a mapping with ``id``, ``keyword_fingerprint`` and
+        ``visa_sponsorship``. Returns the number of entries written.
+        """
+        if not postings:
+            return 0
+        JobPostingKeyword.query.filter(JobPostingKeyword.job_id.in_([p['id'] for p in postings])).delete(
+            synchronize_session=False)
+        rows = [{'term': term, 'job_id': posting['id']}
+                for posting in postings for term in set(posting['keyword_fingerprint'] or ())]
+        if rows:
+            db.session.execute(insert(JobPostingKeyword), rows)
+
+        with self._lock:
+            if self._bitmaps is not None:
+                self._bitmaps.update(postings)
+        return len(rows)
+
+    def index_postings(self, job_ids: Sequence[int]) -> int:
+        """Index postings by id, reading their keywords from the database."""
+        postings = db.session.query(JobPosting.id, JobPosting.description, JobPosting.requirements,
+                                    JobPosting.keyword_fingerprint, JobPosting.keyword_taxonomy_version,
+                                    JobPosting.visa_sponsorship).filter(
+            JobPosting.id.in_(job_ids))
+        return self.index([
+            {'id': posting.id, 'keyword_fingerprint': self.posting_terms(posting),
+             'visa_sponsorship': posting.visa_sponsorship}
+            for posting in postings
+        ])
+
+    def rebuild(self, batch_size: int = 1000) -> int:
+        """Rebuild the whole index from job_postings."""
+        JobPostingKeyword.query.delete()
+        self.clear()
+        written = 0
+        last_id = 0
+        while True:
+            job_ids = [job_id for job_id, in db.session.query(JobPosting.id).filter(
+                JobPosting.id > last_id).order_by(JobPosting.id).limit(batch_size)]
+            if not job_ids:
+                break
+            written += self.index_postings(job_ids)
+            last_id = job_ids[-1]
+        db.session.commit()
+        return written
+
+    def clear(self) -> None:
+        """Drop the in-memory copy; the next search reloads it."""
+        with self._lock:
+            self._bitmaps = None
+
+    def bitmaps(self) -> KeywordBitmaps:
+        """Return the in-memory index, loading it from the database if stale."""
+        with self._lock:
+            if self._bitmaps is None or time.monotonic() - self._loaded_at > self.refresh_seconds:
+                bitmaps = KeywordBitmaps()
+                ids_by_term: Dict[str, List[int]] = {}
+                for term, job_id in db.session.query(JobPostingKeyword.term, JobPostingKeyword.job_id):
+                    ids_by_term.setdefault(term, []).append(job_id)
+                bitmaps.terms = {term: bitmap(ids) for term, ids in ids_by_term.items()}
+                bitmaps.sponsored = bitmap(job_id for job_id, in db.session.query(JobPosting.id).filter(
+                    JobPosting.visa_sponsorship.is_(True)))
+                bitmaps.indexed = bitmap(job_id for job_id, in db.session.query(JobPosting.id))
+                self._bitmaps = bitmaps
+                self._loaded_at = time.monotonic()
+            return self._bitmaps
+
+    def search(self, terms: Iterable[str], limit: int = 20, visa_sponsorship: Optional[bool] = None,
+               company: Optional[str] = None) -> List[Tuple[JobPosting, int]]:
+        """Return up to ``limit`` postings sharing the most terms, with their overlap.
+
+        Ties are broken by newest posting first. The company filter reads the
+        matching ids through the job_postings company index.
+        """
+        if limit <= 0:
+            return []
+
+        bitmaps = self.bitmaps()
+        mask = None
+        if visa_sponsorship is not None:
+            mask = bitmaps.sponsored if visa_sponsorship else bitmaps.indexed & ~bitmaps.sponsored
+        if company:
+            company_ids = bitmap(job_id for job_id, in db.session.query(JobPosting.id).filter(
+                JobPosting.company == company))
+            mask = company_ids if mask is None else mask & company_ids
+
+        ranked = bitmaps.top(terms, limit, mask)
+        if not ranked:
+            return []
+        postings = {posting.id: posting for posting in
+                    JobPosting.query.filter(JobPosting.id.in_([job_id for job_id, _ in ranked]))}
+        return [(postings[job_id], overlap) for job_id, overlap in ranked if job_id in postings]
@@ -0,0 +1,269 @@
+"""Streaming ingestion of job posting feeds."""
+import csv
+import json
+import os
+import resource
+import sys
+import time
+from datetime import datetime
+from itertools import islice
+from typing import Any, Dict, IO, Iterable, Iterator, List, Optional
+
+from sqlalchemy import tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+
+from models import db
+from models.job_posting import JobPosting
+from services.search_index import index_job_postings
+from services.corpus_statistics import fingerprint_deltas, update_document_frequencies
+from services.job_index_service import JobKeywordIndex
+from services.taxonomy import skill_taxonomy
+
+# Columns a feed record may set; everything else in the record is ignored
+FEED_COLUMNS = (
+    'title', 'company', 'location', 'description', 'requirements', 'visa_sponsorship',
+    'visa_types', 'salary_min', 'salary_max', 'posted_date', 'source', 'external_id',
+)
+
+# Columns refreshed when a posting is seen again
+UPDATE_COLUMNS = tuple(column for column in FEED_COLUMNS if column not in ('source', 'external_id')) + (
+    'keyword_fingerprint', 'keyword_taxonomy_version',
+)
+
+# CSV feeds cannot hold lists, so list columns use a separator inside the cell
+CSV_LIST_SEPARATOR = ';'
+
+_UPSERT_INSERTS = {
+    'sqlite': sqlite.insert,
+    'postgresql': postgresql.insert,
+}
+
+
+class InvalidPosting(ValueError):
+    """Raised for a feed record that cannot be stored."""
+
+
+class IngestStats:
+    """Counters and resource usage for one ingest run."""
+
+    def __init__(self):
+        self.rows_read = 0
+        self.rows_written = 0
+        self.rows_skipped = 0
+        self.duplicates = 0
+        self.chunks = 0
+        self.started = time.monotonic()
+        self.finished: Optional[float] = None
+
+    @property
+    def seconds(self) -> float:
+        return (self.finished or time.monotonic()) - self.started
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_read / self.seconds if self.seconds else 0.0
+
+    @staticmethod
+    def peak_memory_mb() -> float:
+        """Peak resident set size of this process so far."""
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in kilobytes on Linux and bytes on macOS
+        return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+    def snapshot(self) -> Dict[str, float]:
+        return {
+            'rows_read': self.rows_read,
+            'rows_written': self.rows_written,
+            'rows_skipped': self.rows_skipped,
+            'duplicates': self.duplicates,
+            'chunks': self.chunks,
+            'seconds': round(self.seconds, 3),
+            'rows_per_second': round(self.rows_per_second, 1),
+            'peak_memory_mb': round(self.peak_memory_mb(), 1),
+        }
+
+
+def iter_jsonl(stream: IO[str]) -> Iterator[Optional[Dict[str, Any]]]:
+    """Yield one record per non-blank line of a JSON Lines feed.
+
+    A line that is not valid JSON yields None, which the ingester counts as
+    skipped, so one corrupt line does not abort the rest of the feed.
+    """
+    for line in stream:
+        line = line.strip()
+        if line:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                yield None
+
+
+def iter_csv(stream: IO[str]) -> Iterator[Dict[str, Any]]:
+    """Yield one record per row of a CSV feed with a header row."""
+    yield from csv.DictReader(stream)
+
+
+FEED_READERS = {
+    'jsonl': iter_jsonl,
+    'csv': iter_csv,
+}
+
+
+def detect_format(path: str) -> str:
+    """Pick the feed reader from the file extension."""
+    extension = os.path.splitext(path)[1].lower().lstrip('.')
+    if extension in ('jsonl', 'ndjson'):
+        return 'jsonl'
+    if extension == 'csv':
+        return 'csv'
+    raise ValueError(f"Cannot detect feed format of {path}; pass it explicitly")
+
+
+def _as_list(value) -> List[str]:
+    if value is None or value == '':
+        return []
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(CSV_LIST_SEPARATOR) if item.strip()]
+    return [str(item) for item in value]
+
+
+def _as_int(value) -> Optional[int]:
+    if value is None or value == '':
+        return None
+    return int(float(value))
+
+
+def _as_bool(value) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() in ['true', 'yes', 'y', '1']
+    return bool(value)
+
+
+def _as_datetime(value) -> Optional[datetime]:
+    if value is None or value == '':
+        return None
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(str(value).replace('Z', '+00:00')).replace(tzinfo=None)
+
+
+def normalize_record(record: Dict[str, Any], default_source: Optional[str] = None) -> Dict[str, Any]:
+    """Turn a raw feed record into a job_postings row.
+
+    Keywords are extracted here, once per posting, and stored as the
+    posting's keyword fingerprint. Feeds without a requirements list get the
+    extracted keywords as their requirements.
+    """
+    if not isinstance(record, dict):
+        raise InvalidPosting('record must be an object')
+    row = {column: record.get(column) for column in FEED_COLUMNS}
+    row['source'] = row['source'] or default_source
+    if not row['title'] or not row['company']:
+        raise InvalidPosting('title and company are required')
+    if not row['source'] or row['external_id'] in (None, ''):
+        raise InvalidPosting('source and external_id are required')
+
+    try:
+        row['external_id'] = str(row['external_id'])
+        row['requirements'] = _as_list(row['requirements'])
+        row['visa_types'] = _as_list(row['visa_types'])
+        row['visa_sponsorship'] = _as_bool(row['visa_sponsorship'])
+        row['salary_min'] = _as_int(row['salary_min'])
+        row['salary_max'] = _as_int(row['salary_max'])
+        row['posted_date'] = _as_datetime(row['posted_date'])
+    except (TypeError, ValueError) as e:
+        raise InvalidPosting(str(e)) from e
+
+    taxonomy = skill_taxonomy.current()
+    row['keyword_fingerprint'] = taxonomy.fingerprint(row['description'], ' , '.join(row['requirements'] or []))
+    row['keyword_taxonomy_version'] = taxonomy.version
+    if not row['requirements']:
+        row['requirements'] = row['keyword_fingerprint']
+    return row
+
+
+class JobPostingIngester:
+    """Load a feed into job_postings in fixed-size chunks.
+
+    Each chunk is deduplicated in memory and written with one bulk
+    ``INSERT ... ON CONFLICT (source, external_id) DO UPDATE``, so a
+    re-ingested feed refreshes existing postings instead of duplicating them
+    and memory use stays bounded by the chunk size, not the feed size.
+    The keyword and full-text index entries and the corpus document
+    frequencies for each chunk are refreshed in the same transaction.
+    """
+
+    def __init__(self, chunk_size: int = 1000, default_source: Optional[str] = None,
+                 keyword_index: Optional[JobKeywordIndex] = None):
+        self.chunk_size = chunk_size
+        self.default_source = default_source
+        self.keyword_index = keyword_index if keyword_index is not None else JobKeywordIndex()
+
+    def upsert_statement(self):
+        dialect = db.engine.dialect.name
+        insert = _UPSERT_INSERTS.get(dialect)
+        if insert is None:
+            raise ValueError(f"Bulk upsert is not supported on {dialect}")
+
+        statement = insert(JobPosting.__table__)
+        return statement.on_conflict_do_update(
+            index_elements=['source', 'external_id'],
+            set_={column: statement.excluded[column] for column in UPDATE_COLUMNS}
+        )
+
+    def ingest_records(self, records: Iterable[Dict[str, Any]]) -> IngestStats:
+        """Upsert records from any iterable, committing once per chunk."""
+        stats = IngestStats()
+        statement = self.upsert_statement()
+        records = iter(records)
+
+        while True:
+            chunk = list(islice(records, self.chunk_size))
+            if not chunk:
+                break
+            stats.rows_read += len(chunk)
+
+            rows: Dict[tuple, Dict[str, Any]] = {}
+            for record in chunk:
+                try:
+                    row = normalize_record(record, self.default_source)
+                except InvalidPosting:
+                    stats.rows_skipped += 1
+                    continue
+                key = (row['source'], row['external_id'])
+                if key in rows:
+                    # PostgreSQL refuses to update one row twice in a statement
+                    stats.duplicates += 1
+                rows[key] = row
+
+            if rows:
+                previous = self._stored_fingerprints(rows)
+                db.session.execute(statement, list(rows.values()))
+                self._index_chunk(rows)
+                update_document_frequencies(fingerprint_deltas(
+                    previous, (row['keyword_fingerprint'] for row in rows.values())))
+                db.session.commit()
+                stats.rows_written += len(rows)
+            stats.chunks += 1
+
+        stats.finished = time.monotonic()
+        return stats
+
+    def _stored_fingerprints(self, rows: Dict[tuple, Dict[str, Any]]) -> List[Optional[List[str]]]:
+        """Fingerprints of the chunk's postings that already exist, before they are replaced."""
+        return [fingerprint for fingerprint, in db.session.query(JobPosting.keyword_fingerprint).filter(
+            tuple_(JobPosting.source, JobPosting.external_id).in_(list(rows)))]
+
+    def _index_chunk(self, rows: Dict[tuple, Dict[str, Any]]) -> None:
+        ids = db.session.query(JobPosting.id, JobPosting.source, JobPosting.external_id).filter(
+            tuple_(JobPosting.source, JobPosting.external_id).in_(list(rows)))
+        postings = [dict(rows[(source, external_id)], id=job_id) for job_id, source, external_id in ids]
+        self.keyword_index.index(postings)
+        # Core upserts bypass the ORM events that maintain the full-text index
+        index_job_postings(db.session.connection(), postings)
+
+    def ingest_file(self, path: str, feed_format: Optional[str] = None) -> IngestStats:
+        """Stream a JSONL or CSV feed file into the database."""
+        reader = FEED_READERS[feed_format or detect_format(path)]
+        with open(path, newline='', encoding='utf-8') as stream:
+            return self.ingest_records(reader(stream))
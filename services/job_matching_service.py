@@ -0,0 +1,169 @@
+"""Batch matching of users against job postings using sparse keyword matrices."""
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from scipy import sparse
+from sqlalchemy import insert
+
+from models import db
+from models.job_match import JobMatch
+from models.job_posting import JobPosting
+from models.resume_version import ResumeVersion
+from models.user import User
+from services.keyword_fingerprints import stale_fingerprints
+from services.taxonomy import Taxonomy, skill_taxonomy
+
+
+class JobMatchingService:
+    """Score every user against a batch of postings in one vectorized pass.
+
+    Users and postings become rows of binary CSR matrices over the keyword
+    vocabulary. ``U @ P.T`` gives the number of shared keywords for every
+    pair; dividing by each posting's keyword count gives the same score as
+    ``ResumeTailoringService.analyze_compatibility``, without any per-pair
+    Python work. A service uses one skill taxonomy snapshot throughout, so
+    a hot reload never mixes vocabularies within a batch.
+    """
+
+    def __init__(self, vocabulary: Optional[Iterable[str]] = None, taxonomy: Optional[Taxonomy] = None):
+        self.taxonomy = taxonomy if taxonomy is not None else skill_taxonomy.current()
+        self.vocabulary: List[str] = sorted(vocabulary if vocabulary is not None else self.taxonomy.matcher.terms)
+        self.term_index: Dict[str, int] = {term: i for i, term in enumerate(self.vocabulary)}
+
+    def build_matrix(self, keyword_sets: Sequence[Iterable[str]]) -> sparse.csr_matrix:
+        """Build a binary rows × vocabulary matrix from keyword sets."""
+        indptr = [0]
+        indices: List[int] = []
+        for keywords in keyword_sets:
+            columns = sorted({self.term_index[k] for k in keywords if k in self.term_index})
+            indices.extend(columns)
+            indptr.append(len(indices))
+        data = np.ones(len(indices), dtype=np.float32)
+        return sparse.csr_matrix(
+            (data, np.array(indices, dtype=np.int32), np.array(indptr, dtype=np.int64)),
+            shape=(len(keyword_sets), len(self.vocabulary))
+        )
+
+    def resume_columns(self, keyword_sets: Sequence[Iterable[str]]) -> np.ndarray:
+        """Dense vocabulary × resumes matrix, built once for repeated ``score_matrix`` calls."""
+        return np.ascontiguousarray(self.build_matrix(keyword_sets).T.toarray(), dtype=np.float32)
+
+    def score_matrix(self, job_keyword_sets: Sequence[Iterable[str]], resume_columns: np.ndarray) -> np.ndarray:
+        """Jobs × resumes scores: the share of each job's keywords found in each resume."""
+        jobs = self.build_matrix(job_keyword_sets)
+        sizes = np.asarray(jobs.sum(axis=1), dtype=np.float32)
+        overlap = np.asarray(jobs @ resume_columns, dtype=np.float32)
+        return np.divide(overlap, sizes, out=np.zeros_like(overlap), where=sizes > 0)
+
+    def top_k(self, user_matrix: sparse.csr_matrix, posting_matrix: sparse.csr_matrix,
+              k: int = 10, min_score: float = 0.0,
+              block_size: int = 512) -> Iterator[Tuple[int, int, float]]:
+        """Yield (user_row, posting_row, score) for each user's best k postings.
+
+        Users are scored in blocks so memory stays at ``block_size`` times the
+        number of postings regardless of how many users there are. Only pairs
+        scoring above ``min_score`` are returned.
+        """
+        n_postings = posting_matrix.shape[0]
+        if n_postings == 0 or k <= 0:
+            return
+
+        # Fold each posting's 1 / keyword count into its column so one product
+        # yields final scores. The posting side is densified: the vocabulary is
+        # small, and a sparse × sparse product whose result is mostly non-zero
+        # is far slower than sparse × dense.
+        posting_sizes = np.asarray(posting_matrix.sum(axis=1)).ravel()
+        inverse_sizes = np.divide(1.0, posting_sizes, out=np.zeros_like(posting_sizes),
+                                  where=posting_sizes > 0)
+        weighted_columns = np.ascontiguousarray(
+            posting_matrix.multiply(inverse_sizes[:, None]).T.toarray(), dtype=np.float32)
+
+        for block_start in range(0, user_matrix.shape[0], block_size):
+            block = user_matrix[block_start:block_start + block_size]
+            scores = np.asarray(block @ weighted_columns)
+
+            if n_postings > k:
+                candidates = np.argpartition(scores, -k, axis=1)[:, -k:]
+            else:
+                candidates = np.broadcast_to(np.arange(n_postings), (block.shape[0], n_postings))
+            candidate_scores = np.take_along_axis(scores, candidates, axis=1)
+
+            rows, columns = np.nonzero(candidate_scores > min_score)
+            for row, column in zip(rows.tolist(), columns.tolist()):
+                yield block_start + row, int(candidates[row, column]), float(candidate_scores[row, column])
+
+    def matched_keywords(self, user_matrix: sparse.csr_matrix, posting_matrix: sparse.csr_matrix,
+                         user_row: int, posting_row: int) -> List[str]:
+        """Return the keywords a user and posting have in common."""
+        user_columns = user_matrix.indices[user_matrix.indptr[user_row]:user_matrix.indptr[user_row + 1]]
+        posting_columns = posting_matrix.indices[posting_matrix.indptr[posting_row]:posting_matrix.indptr[posting_row + 1]]
+        shared = np.intersect1d(user_columns, posting_columns, assume_unique=True)
+        return [self.vocabulary[i] for i in shared.tolist()]
+
+    def load_user_keywords(self) -> Tuple[List[int], List[Set[str]]]:
+        """Collect each user's keywords from profile skills and resume fingerprints."""
+        taxonomy = self.taxonomy
+        keywords: Dict[int, Set[str]] = {}
+        for user_id, skills in db.session.query(User.id, User.skills):
+            keywords[user_id] = taxonomy.matcher.find(' , '.join(skills or []))
+
+        versions = db.session.query(ResumeVersion.user_id, ResumeVersion.keyword_fingerprint)
+        for user_id, fingerprint in versions.filter(ResumeVersion.keyword_fingerprint.isnot(None),
+                                                    ResumeVersion.keyword_taxonomy_version == taxonomy.version):
+            keywords.setdefault(user_id, set()).update(fingerprint)
+
+        # Versions saved before fingerprints existed, or under another taxonomy, need a full extraction
+        stale = ResumeVersion.query.filter(stale_fingerprints(ResumeVersion, taxonomy.version))
+        for version in stale:
+            keywords.setdefault(version.user_id, set()).update(taxonomy.matcher.find(version.latex_content))
+
+        user_ids = sorted(keywords)
+        return user_ids, [keywords[user_id] for user_id in user_ids]
+
+    def posting_keywords(self, description: Optional[str], requirements: Optional[Sequence[str]]) -> Set[str]:
+        """Keywords a posting asks for, from its requirements and description."""
+        return set(self.taxonomy.fingerprint(description, ' , '.join(requirements or [])))
+
+    def match_postings(self, job_ids: Sequence[int], k: int = 10, min_score: float = 0.0,
+                       block_size: int = 512) -> int:
+        """Score all users against the given postings and store the top-k JobMatch rows per user.
+
+        Existing matches for these postings are replaced. Returns the number
+        of JobMatch rows written.
+        """
+        if not job_ids:
+            return 0
+
+        postings = db.session.query(JobPosting.id, JobPosting.description, JobPosting.requirements,
+                                    JobPosting.keyword_fingerprint, JobPosting.keyword_taxonomy_version).filter(
+            JobPosting.id.in_(job_ids)).order_by(JobPosting.id).all()
+        posting_ids = [posting.id for posting in postings]
+        posting_matrix = self.build_matrix([
+            posting.keyword_fingerprint
+            if self.taxonomy.is_current(posting.keyword_fingerprint, posting.keyword_taxonomy_version)
+            else self.posting_keywords(posting.description, posting.requirements)
+            for posting in postings
+        ])
+
+        user_ids, user_keywords = self.load_user_keywords()
+        user_matrix = self.build_matrix(user_keywords)
+
+        rows = []
+        for user_row, posting_row, score in self.top_k(user_matrix, posting_matrix, k, min_score, block_size):
+            rows.append({
+                'user_id': user_ids[user_row],
+                'job_id': posting_ids[posting_row],
+                'compatibility_score': score,
+                'match_reasons': self.matched_keywords(user_matrix, posting_matrix, user_row, posting_row),
+            })
+
+        JobMatch.query.filter(JobMatch.job_id.in_(posting_ids)).delete(synchronize_session=False)
+        if rows:
+            db.session.execute(insert(JobMatch), rows)
+        db.session.commit()
+        return len(rows)
+
+    def unmatched_job_ids(self) -> List[int]:
+        """Ids of postings that have no JobMatch rows yet."""
+        matched = db.session.query(JobMatch.job_id).distinct()
+        return [job_id for job_id, in db.session.query(JobPosting.id).filter(JobPosting.id.notin_(matched))]
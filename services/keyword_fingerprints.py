@@ -0,0 +1,60 @@
+"""Maintenance for stored keyword fingerprints when the skill taxonomy changes."""
+from typing import Tuple
+
+from sqlalchemy import or_, update
+
+from models import db
+from models.job_posting import JobPosting
+from models.resume_version import ResumeVersion
+from services.resume_service import ResumeTailoringService
+from services.taxonomy import skill_taxonomy
+
+
+def stale_fingerprints(model, version: str):
+    """Filter for rows of ``model`` whose fingerprint is missing or from another taxonomy version."""
+    return or_(model.keyword_fingerprint.is_(None), model.keyword_taxonomy_version.is_(None),
+               model.keyword_taxonomy_version != version)
+
+
+def refresh_fingerprints(batch_size: int = 500) -> Tuple[int, int]:
+    """Recompute stale fingerprints with the current taxonomy.
+
+    Rows are processed in id order with one commit per batch, so the job can
+    be interrupted and re-run. Returns the number of resume versions and job
+    postings updated.
+    """
+    taxonomy = skill_taxonomy.current()
+    service = ResumeTailoringService()
+
+    versions_updated = 0
+    last_id = 0
+    while True:
+        versions = ResumeVersion.query.filter(
+            stale_fingerprints(ResumeVersion, taxonomy.version), ResumeVersion.id > last_id
+        ).order_by(ResumeVersion.id).limit(batch_size).all()
+        if not versions:
+            break
+        for version in versions:
+            service.update_fingerprint(version, force=True, taxonomy=taxonomy)
+        db.session.commit()
+        versions_updated += len(versions)
+        last_id = versions[-1].id
+
+    postings_updated = 0
+    last_id = 0
+    while True:
+        postings = db.session.query(JobPosting.id, JobPosting.description, JobPosting.requirements).filter(
+            stale_fingerprints(JobPosting, taxonomy.version), JobPosting.id > last_id
+        ).order_by(JobPosting.id).limit(batch_size).all()
+        if not postings:
+            break
+        db.session.execute(update(JobPosting), [
+            {'id': posting.id, 'keyword_taxonomy_version': taxonomy.version,
+             'keyword_fingerprint': taxonomy.fingerprint(posting.description, ' , '.join(posting.requirements or []))}
+            for posting in postings
+        ])
+        db.session.commit()
+        postings_updated += len(postings)
+        last_id = postings[-1].id
+
+    return versions_updated, postings_updated
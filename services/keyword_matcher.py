@@ -0,0 +1,163 @@
+"""Compiled multi-keyword matcher used for resume and job description analysis."""
+import re
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple
+
+
+# Words are runs of word characters. Punctuation only matters where a
+# vocabulary term contains it ("node.js", "c++", "ci/cd"), so each matcher
+# keeps just those characters as single-character tokens and treats all other
+# punctuation, hyphens included, as whitespace. Matching whole tokens gives
+# every term natural word boundaries: "go" can no longer match inside "google".
+_WORD_RE = re.compile(r'\w+')
+
+
+def _token_pattern(punctuation: Iterable[str]) -> 're.Pattern[str]':
+    chars = ''.join(sorted(set(punctuation)))
+    if not chars:
+        return _WORD_RE
+    return re.compile(r'\w+|[' + re.escape(chars) + ']')
+
+
+def _punctuation(term: str) -> Set[str]:
+    return {char for char in term if not char.isalnum() and not char.isspace()
+            and char not in '_-'}
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton over token sequences.
+
+    The automaton is built once from a vocabulary of terms and then finds
+    every term occurring in a text in a single linear pass over its tokens.
+    ``aliases`` maps other spellings to vocabulary terms ("k8s" to
+    "kubernetes"); an alias is matched like a term but reported as its target.
+    """
+
+    def __init__(self, terms: Iterable[str], aliases: Optional[Mapping[str, str]] = None):
+        self.terms: FrozenSet[str] = frozenset(terms)
+        self.aliases: Dict[str, str] = dict(aliases or {})
+        unknown = sorted(target for target in self.aliases.values() if target not in self.terms)
+        if unknown:
+            raise ValueError(f"Aliases of unknown terms: {', '.join(unknown)}")
+        self._token_re = _token_pattern(
+            char for term in self.terms | set(self.aliases) for char in _punctuation(term)
+        )
+
+        # State 0 is the root. Each state has a transition table, a failure
+        # link and the set of terms that end there (including via failures).
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[FrozenSet[str]] = []
+
+        outputs: List[Set[str]] = [set()]
+        spellings = [(term, term) for term in self.terms] + list(self.aliases.items())
+        for spelling, term in spellings:
+            state = 0
+            for token in self.tokenize(spelling):
+                next_state = self._goto[state].get(token)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][token] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append(set())
+                state = next_state
+            if state:
+                outputs[state].add(term)
+
+        # Breadth-first construction of failure links.
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(token, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                outputs[next_state] |= outputs[self._fail[next_state]]
+
+        self._output = [frozenset(terms) for terms in outputs]
+
+        # Each term owns one bit, in sorted order, so a keyword set is an int
+        # and set algebra between texts is a single bitwise operation.
+        self.vocabulary: Tuple[str, ...] = tuple(sorted(self.terms))
+        self.bits: Dict[str, int] = {term: 1 << i for i, term in enumerate(self.vocabulary)}
+        self._output_mask = [self.encode(terms) for terms in self._output]
+
+    def tokenize(self, text: str) -> List[str]:
+        """Split text into the lowercase tokens this matcher operates on."""
+        return self._token_re.findall(text.lower())
+
+    def _scan(self, tokens: Iterable[str]):
+        """Yield the set of terms ending at each token that completes a match."""
+        output = self._output
+        for state in self._scan_states(tokens):
+            yield output[state]
+
+    def _scan_states(self, tokens: Iterable[str]):
+        """Yield the automaton state at each token that completes a match."""
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        root = goto[0]
+        state = 0
+        for token in tokens:
+            if state:
+                while state and token not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(token, 0)
+            else:
+                state = root.get(token, 0)
+                if not state:
+                    continue
+            if output[state]:
+                yield state
+
+    def find(self, text: str) -> Set[str]:
+        """Return the set of vocabulary terms that occur in text."""
+        found: Set[str] = set()
+        for terms in self._scan(self.tokenize(text)):
+            found |= terms
+        return found
+
+    def mask(self, text: str) -> int:
+        """Return the bitmask of vocabulary terms that occur in text."""
+        output_mask = self._output_mask
+        found = 0
+        for state in self._scan_states(self.tokenize(text)):
+            found |= output_mask[state]
+        return found
+
+    def encode(self, keywords: Iterable[str]) -> int:
+        """Return the bitmask of keywords; terms outside the vocabulary are ignored."""
+        bits = self.bits
+        mask = 0
+        for keyword in keywords:
+            mask |= bits.get(keyword, 0)
+        return mask
+
+    def decode(self, mask: int) -> List[str]:
+        """Return the terms of a bitmask in vocabulary (sorted) order."""
+        vocabulary = self.vocabulary
+        terms = []
+        while mask:
+            lowest = mask & -mask
+            terms.append(vocabulary[lowest.bit_length() - 1])
+            mask ^= lowest
+        return terms
+
+    def count(self, text: str) -> Dict[str, int]:
+        """Return the number of occurrences of each vocabulary term in text."""
+        counts: Dict[str, int] = {}
+        for terms in self._scan(self.tokenize(text)):
+            for term in terms:
+                counts[term] = counts.get(term, 0) + 1
+        return counts
+
+    def __contains__(self, term: str) -> bool:
+        return term in self.terms
+
+    def __len__(self) -> int:
+        return len(self.terms)
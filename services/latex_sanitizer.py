@@ -0,0 +1,269 @@
+"""Single-pass sanitizer for LaTeX produced by the tailoring model.
+
+``sanitize_latex`` strips comments and escapes stray ``&``, ``%`` and ``$``
+characters in text mode while leaving alignment environments, math and
+verbatim blocks untouched. It walks the document once with a single compiled
+tokenizer, copying the text between special tokens verbatim.
+"""
+import re
+from typing import List
+
+# Environments in which & is an alignment tab rather than a literal ampersand
+ALIGNMENT_ENVIRONMENTS = frozenset({
+    'tabular', 'tabular*', 'tabularx', 'tabulary', 'longtable', 'array',
+    'align', 'align*', 'alignat', 'alignat*', 'aligned', 'alignedat',
+    'eqnarray', 'eqnarray*', 'split', 'cases', 'matrix', 'pmatrix',
+    'bmatrix', 'Bmatrix', 'vmatrix', 'Vmatrix', 'smallmatrix',
+})
+
+# Environments that are math mode from begin to end
+MATH_ENVIRONMENTS = frozenset({
+    'math', 'displaymath', 'equation', 'equation*', 'align', 'align*',
+    'alignat', 'alignat*', 'gather', 'gather*', 'multline', 'multline*',
+    'eqnarray', 'eqnarray*',
+})
+
+# Environments whose body is copied without any processing. The arguments of
+# \url{} and the target of \href{}{} are copied the same way, since % and &
+# are ordinary URL characters there.
+VERBATIM_ENVIRONMENTS = frozenset({'verbatim', 'verbatim*', 'lstlisting', 'minted', 'comment'})
+
+_TOKEN_RE = re.compile(r'''
+    \\(?P<kind>begin|end)\s*\{(?P<env>[^{}]*)\}   # environment boundary
+  | \\[()\[\]]                                     # \( \) \[ \] math delimiters
+  | \\(?P<link>url|href)\s*\{                      # URL argument, copied verbatim
+  | \\.                                            # control symbol or start of a control word
+  | \$\$?                                          # inline or display math shift
+  | [%&\n]
+''', re.VERBOSE)
+
+# An & directly before a row break or closing brace, or directly after an
+# opening brace, belongs to table markup even outside a known environment
+_TABLE_AMPERSAND_AFTER_RE = re.compile(r'[ \t]*(?:\\\\|\})')
+_TABLE_AMPERSAND_BEFORE_RE = re.compile(r'\{[ \t]*$')
+
+_UNESCAPED_DOLLAR_RE = re.compile(r'(?<!\\)\$')
+
+
+class LatexSanitizer:
+    """Incremental form of ``sanitize_latex``.
+
+    Text can be fed in arbitrary chunks; each call to ``feed`` returns the
+    sanitized output for every line completed so far, and ``close`` flushes
+    the final partial line. Concatenating the pieces gives exactly
+    ``sanitize_latex`` of the whole text.
+    """
+
+    def __init__(self):
+        self._buffer = ''
+        self._output: List[str] = []
+        self._parts: List[str] = []
+        self._line_has_comment = False
+        self._in_comment = False
+        self._started = False
+        self._pending_blank = False
+        self._environments: List[str] = []
+        self._math = None  # closing delimiter of the current math mode, if any
+        self._verbatim_end = None  # pattern closing the current verbatim block, if any
+        self._argument_depth = 0  # open braces of the URL argument being copied, if any
+
+    def feed(self, chunk: str) -> str:
+        """Add text and return the sanitized form of any newly completed lines."""
+        self._buffer += chunk
+        cut = self._buffer.rfind('\n')
+        if cut == -1:
+            return ''
+        complete, self._buffer = self._buffer[:cut + 1], self._buffer[cut + 1:]
+        self._process(complete)
+        return self._flush()
+
+    def close(self) -> str:
+        """Finish the document and return the remaining sanitized output."""
+        self._process(self._buffer)
+        self._buffer = ''
+        self._end_line()
+        return self._flush()
+
+    def _flush(self) -> str:
+        output = ''.join(self._output)
+        self._output = []
+        # Replace anything that cannot be encoded (e.g. lone surrogates) so the
+        # result can always be written out as UTF-8
+        return output.encode('utf-8', errors='replace').decode('utf-8')
+
+    def _end_line(self) -> None:
+        line = ''.join(self._parts).rstrip()
+        self._parts = []
+        line_has_comment = self._line_has_comment
+        self._line_has_comment = self._in_comment = False
+
+        if not line:
+            # Comment-only lines vanish; blank lines are held back so runs of
+            # them collapse to one and trailing ones are never emitted
+            if not line_has_comment and self._started:
+                self._pending_blank = True
+            return
+
+        if not self._started:
+            self._output.append(line.lstrip())
+            self._started = True
+        else:
+            self._output.append('\n\n' if self._pending_blank else '\n')
+            self._output.append(line)
+        self._pending_blank = False
+
+    def _copy_argument(self, latex: str, position: int) -> int:
+        """Copy a brace-balanced argument verbatim and return where it ends."""
+        depth = self._argument_depth
+        start = position
+        length = len(latex)
+        while position < length and depth:
+            char = latex[position]
+            if char == '\\' and latex[position + 1:position + 2] not in ('', '\n'):
+                position += 2
+                continue
+            if char == '{':
+                depth += 1
+            elif char == '}':
+                depth -= 1
+            elif char == '\n':
+                self._parts.append(latex[start:position])
+                self._end_line()
+                start = position + 1
+            position += 1
+        self._parts.append(latex[start:position])
+        self._argument_depth = depth
+        return position
+
+    def _process(self, latex: str) -> None:
+        parts = self._parts
+        environments = self._environments
+        position = 0
+        length = len(latex)
+
+        while position < length:
+            if self._verbatim_end is not None:
+                # Copy everything up to the matching \end verbatim
+                close = self._verbatim_end.search(latex, position)
+                body_end = close.start() if close else length
+                body_lines = latex[position:body_end].split('\n')
+                self._parts.append(body_lines[0])
+                for body_line in body_lines[1:]:
+                    self._end_line()
+                    self._parts.append(body_line)
+                parts = self._parts
+                position = body_end
+                if close is None:
+                    break
+                self._verbatim_end = None
+
+            if self._argument_depth:
+                position = self._copy_argument(latex, position)
+                parts = self._parts
+                if self._argument_depth:
+                    break
+                continue
+
+            match = _TOKEN_RE.search(latex, position)
+            if match is None:
+                if not self._in_comment:
+                    parts.append(latex[position:])
+                break
+
+            start, end = match.span()
+            if start > position and not self._in_comment:
+                parts.append(latex[position:start])
+            position = end
+            token = match.group()
+
+            if token == '\n':
+                self._end_line()
+                parts = self._parts
+                continue
+            if self._in_comment:
+                continue
+
+            if match.group('link') is not None:
+                parts.append(token)
+                self._argument_depth = 1
+                continue
+
+            kind = match.group('kind')
+            if kind is not None:
+                env = match.group('env').strip()
+                parts.append(token)
+                if kind == 'begin':
+                    if env in VERBATIM_ENVIRONMENTS:
+                        self._verbatim_end = re.compile(r'\\end\s*\{' + re.escape(env) + r'\}')
+                    else:
+                        environments.append(env)
+                elif env in environments:
+                    while environments.pop() != env:
+                        pass
+                continue
+
+            if self._math is not None or (environments and environments[-1] in MATH_ENVIRONMENTS):
+                # Math is copied as-is apart from comments
+                if token == '%':
+                    self._line_has_comment = self._in_comment = True
+                else:
+                    if token == self._math:
+                        self._math = None
+                    parts.append(token)
+                continue
+
+            if token == '%':
+                preceding = parts[-1][-1:] if parts else ''
+                if preceding.isdigit():
+                    parts.append('\\%')
+                else:
+                    self._line_has_comment = self._in_comment = True
+            elif token == '\\%' and not ''.join(parts).strip():
+                self._line_has_comment = self._in_comment = True
+            elif token == '&':
+                if environments and environments[-1] in ALIGNMENT_ENVIRONMENTS:
+                    parts.append(token)
+                elif (_TABLE_AMPERSAND_AFTER_RE.match(latex, position)
+                      or (parts and _TABLE_AMPERSAND_BEFORE_RE.search(parts[-1]))):
+                    parts.append(token)
+                else:
+                    parts.append('\\&')
+            elif token == '$$':
+                self._math = '$$'
+                parts.append(token)
+            elif token == '$':
+                line_end = latex.find('\n', position)
+                if line_end == -1:
+                    line_end = length
+                next_char = latex[position:position + 1]
+                if not next_char.isdigit() and _UNESCAPED_DOLLAR_RE.search(latex, position, line_end):
+                    self._math = '$'
+                    parts.append(token)
+                else:
+                    parts.append('\\$')
+            elif token == '\\(':
+                self._math = '\\)'
+                parts.append(token)
+            elif token == '\\[':
+                self._math = '\\]'
+                parts.append(token)
+            else:
+                parts.append(token)
+
+
+def sanitize_latex(latex: str) -> str:
+    """Strip comments and escape stray special characters in one pass.
+
+    - ``%`` starts a comment unless it directly follows a digit ("40%"), in
+      which case it is a literal percent sign and is escaped.
+    - Lines that only contained a comment are dropped, as are lines starting
+      with an escaped ``\\%``, which the model sometimes emits as a comment.
+    - ``&`` is escaped unless it is an alignment tab.
+    - ``\\url`` arguments and ``\\href`` targets are left as they are.
+    - ``$`` opens math when it is closed later on the same line and is not
+      followed by a digit; otherwise it is a currency sign and is escaped.
+    - Trailing whitespace is removed and runs of blank lines are collapsed
+      to a single blank line.
+    """
+    sanitizer = LatexSanitizer()
+    return sanitizer.feed(latex) + sanitizer.close()
@@ -0,0 +1,111 @@
+"""Section index for LaTeX resumes."""
+import difflib
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional
+
+# Shared with content-addressed storage, which cuts resume bodies at the same boundaries
+from models.content_chunk import SECTION_BOUNDARY_RE as _BOUNDARY_RE
+
+
+class Section(NamedTuple):
+    """A section's name and its [start, end) span in the document."""
+    name: str
+    start: int
+    end: int
+
+
+class SectionIndex:
+    """Spans of every ``\\section`` in a LaTeX document, computed in one scan.
+
+    Extracting or replacing a section is a slice of the original text, so
+    several sections can be read or rewritten without rescanning.
+    """
+
+    def __init__(self, latex: str):
+        self.latex = latex
+        self.sections: List[Section] = []
+
+        current = None
+        for match in _BOUNDARY_RE.finditer(latex):
+            if current is not None:
+                self.sections.append(self._close(current, match.start()))
+                current = None
+            if match.group(1) is not None:
+                current = (match.group(1).strip(), match.start())
+            else:
+                break
+        if current is not None:
+            self.sections.append(self._close(current, len(latex)))
+
+        self._by_name: Dict[str, Section] = {}
+        for section in self.sections:
+            self._by_name.setdefault(section.name.casefold(), section)
+
+    def _close(self, current, end: int) -> Section:
+        name, start = current
+        # Trailing whitespace belongs to the gap between sections
+        while end > start and self.latex[end - 1].isspace():
+            end -= 1
+        return Section(name, start, end)
+
+    def names(self) -> List[str]:
+        return [section.name for section in self.sections]
+
+    def get(self, name: str) -> Optional[Section]:
+        """Look up the first section with this name, ignoring case."""
+        return self._by_name.get(name.casefold())
+
+    def __contains__(self, name: str) -> bool:
+        return self.get(name) is not None
+
+    def extract(self, name: str) -> Optional[str]:
+        """Return the section's text, including its ``\\section`` heading."""
+        section = self.get(name)
+        if section is None:
+            return None
+        return self.latex[section.start:section.end]
+
+    def replace(self, name: str, new_text: str) -> str:
+        """Return the document with one section replaced."""
+        return self.replace_many({name: new_text})
+
+    def replace_many(self, replacements: Dict[str, Optional[str]]) -> str:
+        """Return the document with several sections replaced at once.
+
+        Sections that do not exist, or whose replacement is empty, are left
+        unchanged.
+        """
+        spans = []
+        for name, new_text in replacements.items():
+            section = self.get(name)
+            if section is not None and new_text:
+                spans.append((section, new_text))
+        if not spans:
+            return self.latex
+
+        pieces = []
+        position = 0
+        for section, new_text in sorted(spans, key=lambda span: span[0].start):
+            pieces.append(self.latex[position:section.start])
+            pieces.append(new_text)
+            position = section.end
+        pieces.append(self.latex[position:])
+        return ''.join(pieces)
+
+    def diff(self, other: 'SectionIndex', name: str) -> str:
+        """Unified diff of one section between this document and another."""
+        before = (self.extract(name) or '').splitlines(keepends=True)
+        after = (other.extract(name) or '').splitlines(keepends=True)
+        return ''.join(difflib.unified_diff(before, after, fromfile=f'{name} (before)',
+                                            tofile=f'{name} (after)'))
+
+    def changed_sections(self, other: 'SectionIndex') -> List[str]:
+        """Names of sections whose text differs between the two documents."""
+        names = self.names() + [name for name in other.names() if name not in self]
+        return [name for name in names if self.extract(name) != other.extract(name)]
+
+
+@lru_cache(maxsize=256)
+def section_index(latex: str) -> SectionIndex:
+    """Return the (cached) section index for a document."""
+    return SectionIndex(latex)
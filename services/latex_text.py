@@ -0,0 +1,41 @@
+"""Plain-text extraction from LaTeX for search indexing."""
+import re
+
+_COMMENT_RE = re.compile(r'(?<!\\)%.*')
+_DOCUMENT_RE = re.compile(r'\\begin\{document\}(.*?)(?:\\end\{document\}|\Z)', re.DOTALL)
+_ENVIRONMENT_RE = re.compile(r'\\(?:begin|end)\s*\{[^{}]*\}(?:\[[^\]]*\])?')
+
+# Commands whose arguments are lengths, labels or file names rather than text
+_NON_TEXT_COMMAND_RE = re.compile(
+    r'\\(?:vspace|hspace|setlength|addtolength|label|ref|pageref|includegraphics|'
+    r'color|pagestyle|thispagestyle|usepackage|documentclass)\*?'
+    r'(?:\[[^\]]*\])?(?:\{[^{}]*\})*'
+)
+_ESCAPED_RE = re.compile(r'\\([%&$#_{}])')
+# Escaped specials are parked on private-use characters while markup is removed
+_PLACEHOLDERS = {char: chr(0xE000 + i) for i, char in enumerate('%&$#_{}')}
+_RESTORE = str.maketrans({placeholder: char for char, placeholder in _PLACEHOLDERS.items()})
+_COMMAND_RE = re.compile(r'\\(?:[A-Za-z@]+\*?(?:\[[^\]]*\])?|\\|.)')
+_MARKUP_RE = re.compile(r'[{}$&^_~]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def strip_latex(latex: str) -> str:
+    """Reduce a LaTeX document to the words a reader would see.
+
+    Comments, the preamble, environment markers and command names are
+    dropped; the text inside command arguments is kept, so
+    ``\\textbf{Flask}`` indexes as "Flask".
+    """
+    if not latex:
+        return ''
+    text = _COMMENT_RE.sub('', latex)
+    body = _DOCUMENT_RE.search(text)
+    if body is not None:
+        text = body.group(1)
+    text = _ENVIRONMENT_RE.sub(' ', text)
+    text = _NON_TEXT_COMMAND_RE.sub(' ', text)
+    text = _ESCAPED_RE.sub(lambda match: _PLACEHOLDERS[match.group(1)], text)
+    text = _COMMAND_RE.sub(' ', text)
+    text = _MARKUP_RE.sub(' ', text).translate(_RESTORE)
+    return _WHITESPACE_RE.sub(' ', text).strip()
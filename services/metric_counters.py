@@ -0,0 +1,115 @@
+"""Named counters that every process of a deployment adds to and reads."""
+import threading
+from typing import Dict, Mapping
+
+from sqlalchemy.dialects import postgresql, sqlite
+
+_UPSERT_INSERTS = {
+    'sqlite': sqlite.insert,
+    'postgresql': postgresql.insert,
+}
+
+
+class MemoryCounters:
+    """Counters held in this process; only for single-process deployments and tests."""
+
+    def __init__(self, namespace: str):
+        self.namespace = namespace
+        self._values: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def add(self, deltas: Mapping[str, float]) -> None:
+        with self._lock:
+            for name, delta in deltas.items():
+                self._values[name] = self._values.get(name, 0) + delta
+
+    def values(self) -> Dict[str, float]:
+        with self._lock:
+            return dict(self._values)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class DatabaseCounters:
+    """Counters stored as rows of the metric_counters table of the app database."""
+
+    def __init__(self, namespace: str):
+        self.prefix = namespace + '.'
+
+    def add(self, deltas: Mapping[str, float]) -> None:
+        """Add the deltas in one upsert statement and commit."""
+        from models import db
+        from models.metric_counter import MetricCounter
+
+        if not deltas:
+            return
+        dialect = db.engine.dialect.name
+        dialect_insert = _UPSERT_INSERTS.get(dialect)
+        if dialect_insert is None:
+            raise ValueError(f"Bulk upsert is not supported on {dialect}")
+
+        table = MetricCounter.__table__
+        statement = dialect_insert(table)
+        statement = statement.on_conflict_do_update(
+            index_elements=['name'],
+            set_={'value': table.c.value + statement.excluded.value}
+        )
+        db.session.execute(statement, [{'name': self.prefix + name, 'value': delta}
+                                       for name, delta in sorted(deltas.items())])
+        db.session.commit()
+
+    def values(self) -> Dict[str, float]:
+        from models.metric_counter import MetricCounter
+
+        rows = MetricCounter.query.filter(MetricCounter.name.startswith(self.prefix, autoescape=True))
+        return {row.name[len(self.prefix):]: row.value for row in rows}
+
+    def reset(self) -> None:
+        from models import db
+        from models.metric_counter import MetricCounter
+
+        MetricCounter.query.filter(MetricCounter.name.startswith(self.prefix, autoescape=True)).delete(
+            synchronize_session=False)
+        db.session.commit()
+
+
+class RedisCounters:
+    """Counters kept in one Redis hash."""
+
+    def __init__(self, redis_client, namespace: str):
+        self.redis = redis_client
+        self.key = namespace + ':counters'
+
+    @classmethod
+    def from_url(cls, url: str, namespace: str) -> 'RedisCounters':
+        import redis
+
+        return cls(redis.Redis.from_url(url), namespace)
+
+    def add(self, deltas: Mapping[str, float]) -> None:
+        pipe = self.redis.pipeline()
+        for name, delta in deltas.items():
+            if isinstance(delta, int):
+                pipe.hincrby(self.key, name, delta)
+            else:
+                pipe.hincrbyfloat(self.key, name, delta)
+        pipe.execute()
+
+    def values(self) -> Dict[str, float]:
+        return {name.decode('utf-8'): float(value) for name, value in self.redis.hgetall(self.key).items()}
+
+    def reset(self) -> None:
+        self.redis.delete(self.key)
+
+
+def make_counters(backend_name: str, namespace: str, redis_url: str = None):
+    """Build the counter store for 'memory', 'database' or 'redis'."""
+    if backend_name == 'memory':
+        return MemoryCounters(namespace)
+    if backend_name == 'database':
+        return DatabaseCounters(namespace)
+    if backend_name == 'redis':
+        return RedisCounters.from_url(redis_url, namespace)
+    raise ValueError(f"Unknown metrics backend: {backend_name}")
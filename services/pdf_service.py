@@ -0,0 +1,364 @@
+"""PDF compilation service for LaTeX resumes."""
+import fcntl
+import hashlib
+import os
+import resource
+import subprocess
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+
+class CompileQueueFull(Exception):
+    """Raised when the compile queue has no free slot for another job."""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"PDF compile queue is full; retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class CompileResult:
+    """Outcome of compiling a LaTeX document."""
+
+    def __init__(self, pdf: Optional[bytes], log: str = '', cached: bool = False):
+        self.pdf = pdf
+        self.log = log
+        self.cached = cached
+
+    @property
+    def success(self) -> bool:
+        return self.pdf is not None
+
+
+class PdfCache:
+    """On-disk cache of compiled PDFs keyed by a hash of their LaTeX source."""
+
+    def __init__(self, directory: str, max_entries: int = 500):
+        self.directory = directory
+        self.max_entries = max_entries
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.pdf")
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                pdf = f.read()
+        except FileNotFoundError:
+            return None
+        # Refresh the modification time so eviction is least recently used
+        os.utime(path)
+        return pdf
+
+    def set(self, key: str, pdf: bytes) -> None:
+        # Write to a temporary file first so readers never see a partial PDF
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(pdf)
+        os.replace(tmp_path, self._path(key))
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.pdf'):
+                path = os.path.join(self.directory, name)
+                try:
+                    entries.append((os.path.getmtime(path), path))
+                except FileNotFoundError:
+                    continue
+
+        overflow = len(entries) - self.max_entries
+        if overflow > 0:
+            for _, path in sorted(entries)[:overflow]:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+
+@contextmanager
+def _locked(directory: str):
+    """Hold an exclusive lock on a work directory across threads and processes."""
+    with open(os.path.join(directory, '.lock'), 'w') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+class PdfCompiler:
+    """Compile LaTeX to PDF with pdflatex, caching results by content hash.
+
+    When ``work_dir`` is set, each distinct preamble gets a persistent
+    directory under it. Its ``.aux`` files survive between compiles and, if
+    ``precompile_preamble`` is enabled, the preamble is dumped once into a
+    format file with ``mylatexformat`` so later compiles skip loading packages.
+    """
+
+    JOBNAME = 'resume'
+    FORMAT_NAME = 'preamble'
+
+    def __init__(self, cache: Optional[PdfCache] = None, work_dir: Optional[str] = None,
+                 precompile_preamble: bool = True, pdflatex: str = 'pdflatex',
+                 timeout: Optional[float] = None, memory_limit_mb: Optional[int] = None):
+        self.cache = cache
+        self.work_dir = work_dir
+        self.precompile_preamble = precompile_preamble
+        self.pdflatex = pdflatex
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+
+    @staticmethod
+    def cache_key(latex_content: str) -> str:
+        return hashlib.sha256(latex_content.encode('utf-8')).hexdigest()
+
+    def lookup(self, key: str) -> Optional[CompileResult]:
+        """Return the cached result for a cache_key, if any."""
+        if self.cache is None:
+            return None
+        pdf = self.cache.get(key)
+        if pdf is None:
+            return None
+        return CompileResult(pdf, cached=True)
+
+    def compile(self, latex_content: str) -> CompileResult:
+        """Compile LaTeX, serving identical documents from the cache."""
+        key = self.cache_key(latex_content)
+
+        cached = self.lookup(key)
+        if cached is not None:
+            return cached
+
+        return self.build(latex_content, key)
+
+    def build(self, latex_content: str, key: str) -> CompileResult:
+        """Compile LaTeX the caller already looked up, caching the PDF under key."""
+        if self.work_dir:
+            result = self._compile_incremental(latex_content)
+        else:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                result = self._compile_in(temp_dir, latex_content)
+
+        if result.success and self.cache is not None:
+            self.cache.set(key, result.pdf)
+
+        return result
+
+    def _limit_memory(self, pid: int) -> None:
+        # Set on the running child from here: preexec_fn can deadlock when
+        # called from the compile executor's worker threads
+        limit = self.memory_limit_mb * 1024 * 1024
+        try:
+            resource.prlimit(pid, resource.RLIMIT_AS, (limit, limit))
+        except ProcessLookupError:
+            pass  # Already exited
+
+    def _run(self, args: List[str], cwd: str) -> subprocess.CompletedProcess:
+        with subprocess.Popen(args, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                              text=True) as process:
+            if self.memory_limit_mb:
+                self._limit_memory(process.pid)
+            try:
+                stdout, stderr = process.communicate(timeout=self.timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.communicate()
+                raise
+        return subprocess.CompletedProcess(args, process.returncode, stdout, stderr)
+
+    def _compile_in(self, directory: str, latex_content: str,
+                    extra_args: Optional[List[str]] = None) -> CompileResult:
+        tex_filename = f"{self.JOBNAME}.tex"
+        with open(os.path.join(directory, tex_filename), "w", encoding='utf-8') as f:
+            f.write(latex_content)
+
+        pdf_filepath = os.path.join(directory, f"{self.JOBNAME}.pdf")
+        if os.path.exists(pdf_filepath):
+            os.remove(pdf_filepath)
+
+        try:
+            compile_process = self._run(
+                [self.pdflatex, "-interaction=nonstopmode", *(extra_args or []), tex_filename],
+                cwd=directory
+            )
+        except subprocess.TimeoutExpired:
+            return CompileResult(None, f"pdflatex timed out after {self.timeout} seconds")
+
+        if compile_process.returncode != 0 or not os.path.exists(pdf_filepath):
+            log_filepath = os.path.join(directory, f"{self.JOBNAME}.log")
+            if os.path.exists(log_filepath):
+                with open(log_filepath, "r", errors='replace') as log_file:
+                    log_content = log_file.read()
+            else:
+                log_content = compile_process.stdout + compile_process.stderr
+            return CompileResult(None, log_content)
+
+        with open(pdf_filepath, 'rb') as f:
+            return CompileResult(f.read(), compile_process.stdout)
+
+    def _compile_incremental(self, latex_content: str) -> CompileResult:
+        preamble = latex_content.partition('\\begin{document}')[0]
+        template_key = hashlib.sha256(preamble.encode('utf-8')).hexdigest()[:16]
+        directory = os.path.join(self.work_dir, template_key)
+        os.makedirs(directory, exist_ok=True)
+
+        with _locked(directory):
+            extra_args = []
+            if self.precompile_preamble and self._ensure_format(directory, latex_content):
+                extra_args = [f"-fmt={self.FORMAT_NAME}"]
+            return self._compile_in(directory, latex_content, extra_args)
+
+    def _ensure_format(self, directory: str, latex_content: str) -> bool:
+        """Build the preamble format for a template once; return whether it is usable."""
+        format_path = os.path.join(directory, f"{self.FORMAT_NAME}.fmt")
+        failed_marker = os.path.join(directory, f"{self.FORMAT_NAME}.failed")
+        if os.path.exists(format_path):
+            return True
+        if os.path.exists(failed_marker):
+            return False
+
+        tex_filename = f"{self.JOBNAME}.tex"
+        with open(os.path.join(directory, tex_filename), "w", encoding='utf-8') as f:
+            f.write(latex_content)
+
+        try:
+            build_process = self._run(
+                [self.pdflatex, "-ini", "-interaction=nonstopmode", f"-jobname={self.FORMAT_NAME}",
+                 "&pdflatex", "mylatexformat.ltx", tex_filename],
+                cwd=directory
+            )
+            built = build_process.returncode == 0 and os.path.exists(format_path)
+        except subprocess.TimeoutExpired:
+            built = False
+
+        if not built:
+            # Most likely mylatexformat is not installed; fall back to plain compiles
+            open(failed_marker, 'w').close()
+            return False
+        return True
+
+
+class CompileMetrics:
+    """Thread-safe counters for the compile executor."""
+
+    def __init__(self, window: int = 1000):
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=window)
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.cache_hits = 0
+
+    def record(self, **deltas: int) -> None:
+        with self._lock:
+            for name, delta in deltas.items():
+                setattr(self, name, getattr(self, name) + delta)
+
+    def record_latency(self, seconds: float) -> None:
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            latencies = sorted(self._latencies)
+            snapshot = {
+                'queue_depth': self.queued,
+                'running': self.running,
+                'completed': self.completed,
+                'failed': self.failed,
+                'rejected': self.rejected,
+                'cache_hits': self.cache_hits,
+            }
+        if latencies:
+            snapshot['latency_p50'] = latencies[len(latencies) // 2]
+            snapshot['latency_p95'] = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+            snapshot['latency_max'] = latencies[-1]
+        return snapshot
+
+
+class CompileExecutor:
+    """Bounded pool of pdflatex workers with a bounded wait queue.
+
+    At most ``workers`` compiles run at once and at most ``queue_size`` more
+    wait for a worker. Further submissions raise ``CompileQueueFull`` instead
+    of starting more TeX processes.
+    """
+
+    def __init__(self, compiler: PdfCompiler, workers: int = 2, queue_size: int = 8,
+                 retry_after: int = 5):
+        self.compiler = compiler
+        self.retry_after = retry_after
+        self.metrics = CompileMetrics()
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='pdflatex')
+
+    def compile(self, latex_content: str) -> CompileResult:
+        """Compile on the pool, blocking the caller until the result is ready."""
+        key = self.compiler.cache_key(latex_content)
+        cached = self.compiler.lookup(key)
+        if cached is not None:
+            self.metrics.record(cache_hits=1)
+            return cached
+
+        if not self._slots.acquire(blocking=False):
+            self.metrics.record(rejected=1)
+            raise CompileQueueFull(self.retry_after)
+
+        self.metrics.record(queued=1)
+        try:
+            return self._pool.submit(self._run_job, latex_content, key).result()
+        finally:
+            self._slots.release()
+
+    def _run_job(self, latex_content: str, key: str) -> CompileResult:
+        self.metrics.record(queued=-1, running=1)
+        started = time.monotonic()
+        try:
+            result = self.compiler.build(latex_content, key)
+        except Exception:
+            self.metrics.record(running=-1, failed=1)
+            raise
+        self.metrics.record_latency(time.monotonic() - started)
+        if result.success:
+            self.metrics.record(running=-1, completed=1)
+        else:
+            self.metrics.record(running=-1, failed=1)
+        return result
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=True)
+
+
+def make_pdf_compiler(config) -> PdfCompiler:
+    """Build the PDF compiler described by the application config."""
+    cache = None
+    if config.get('PDF_CACHE_DIR'):
+        cache = PdfCache(config['PDF_CACHE_DIR'], config.get('PDF_CACHE_MAX_ENTRIES', 500))
+
+    return PdfCompiler(
+        cache=cache,
+        work_dir=config.get('PDFLATEX_WORK_DIR'),
+        precompile_preamble=config.get('PDFLATEX_PRECOMPILE_PREAMBLE', True),
+        timeout=config.get('PDF_COMPILE_TIMEOUT'),
+        memory_limit_mb=config.get('PDF_COMPILE_MEMORY_LIMIT_MB')
+    )
+
+
+def make_compile_executor(config) -> CompileExecutor:
+    """Build the bounded compile executor described by the application config."""
+    return CompileExecutor(
+        make_pdf_compiler(config),
+        workers=config.get('PDF_COMPILE_WORKERS', 2),
+        queue_size=config.get('PDF_COMPILE_QUEUE_SIZE', 8),
+        retry_after=config.get('PDF_COMPILE_RETRY_AFTER', 5)
+    )
@@ -1,199 +1,189 @@
 """Resume tailoring and compatibility analysis service."""
-import re
-from typing import List, Dict, Tuple, Optional
-from collections import Counter
+from typing import Iterable, List, Optional
+from sqlalchemy.orm import load_only
+from models import db
 from models.resume_version import ResumeVersion
-from models.user import User
+from services.corpus_statistics import CorpusStatistics
+from services.keyword_matcher import KeywordMatcher
+from services.taxonomy import Taxonomy, skill_taxonomy
+
+
+def compatibility_suggestions(score: float, missing_keywords: List[str]) -> List[str]:
+    """Advice shown with a compatibility score."""
+    suggestions = []
+    if missing_keywords:
+        suggestions.append(f"Consider adding these skills to your resume: {', '.join(missing_keywords[:5])}")
+    
+    if score < 0.3:
+        suggestions.append("Your resume has low compatibility with this job. Consider using a different resume version or adding more relevant experience.")
+    elif score < 0.6:
+        suggestions.append("Your resume has moderate compatibility. Consider emphasizing relevant projects and skills.")
+    else:
+        suggestions.append("Your resume has good compatibility with this job!")
+    return suggestions
 
 
 class CompatibilityScore:
-    """Represents the compatibility between a resume and job description."""
+    """Represents the compatibility between a resume and job description.
     
-    def __init__(self, score: float, matched_keywords: List[str], 
-                 missing_keywords: List[str], suggestions: List[str]):
+    Scores built by ``from_masks`` hold the matched and missing keywords as
+    bitmasks over the vocabulary of the matcher that produced them (the
+    current skill taxonomy's by default); the keyword lists and suggestion
+    strings are only decoded when first read.
+    """
+    
+    __slots__ = ('score', 'weighted_score', 'matched_mask', 'missing_mask', 'matcher', '_matched_keywords',
+                 '_missing_keywords', '_suggestions')
+    
+    def __init__(self, score: float, matched_keywords: Optional[List[str]] = None,
+                 missing_keywords: Optional[List[str]] = None, suggestions: Optional[List[str]] = None,
+                 matched_mask: int = 0, missing_mask: int = 0, matcher: Optional[KeywordMatcher] = None,
+                 weighted_score: Optional[float] = None):
         self.score = score  # 0.0 to 1.0
-        self.matched_keywords = matched_keywords
-        self.missing_keywords = missing_keywords
-        self.suggestions = suggestions
+        self.weighted_score = weighted_score  # 0.0 to 1.0, matched keywords weighted by corpus IDF
+        self.matched_mask = matched_mask
+        self.missing_mask = missing_mask
+        self.matcher = matcher
+        self._matched_keywords = matched_keywords
+        self._missing_keywords = missing_keywords
+        self._suggestions = suggestions
+    
+    @classmethod
+    def from_masks(cls, resume_mask: int, job_mask: int, matcher: Optional[KeywordMatcher] = None,
+                   statistics: Optional[CorpusStatistics] = None) -> 'CompatibilityScore':
+        """Score a resume against a job from their keyword bitmasks.
+        
+        With corpus ``statistics`` the score also gets an IDF-weighted form.
+        """
+        matched_mask = resume_mask & job_mask
+        job_count = job_mask.bit_count()
+        score = matched_mask.bit_count() / job_count if job_count else 0.0
+        weighted_score = statistics.score(resume_mask, job_mask) if statistics is not None else None
+        return cls(score, matched_mask=matched_mask, missing_mask=job_mask & ~resume_mask, matcher=matcher,
+                   weighted_score=weighted_score)
+    
+    def _decode(self, mask: int) -> List[str]:
+        if self.matcher is None:
+            self.matcher = skill_taxonomy.current().matcher
+        return self.matcher.decode(mask)
+    
+    @property
+    def matched_keywords(self) -> List[str]:
+        if self._matched_keywords is None:
+            self._matched_keywords = self._decode(self.matched_mask)
+        return self._matched_keywords
+    
+    @property
+    def missing_keywords(self) -> List[str]:
+        if self._missing_keywords is None:
+            self._missing_keywords = self._decode(self.missing_mask)
+        return self._missing_keywords
+    
+    @property
+    def suggestions(self) -> List[str]:
+        if self._suggestions is None:
+            self._suggestions = compatibility_suggestions(self.score, self.missing_keywords)
+        return self._suggestions
 
 
 class ResumeTailoringService:
     """Service for resume tailoring and compatibility analysis."""
     
-    # Common technical keywords by category
-    CATEGORY_KEYWORDS = {
-        'Engineering': [
-            'python', 'java', 'javascript', 'react', 'node.js', 'sql', 'aws', 'docker',
-            'kubernetes', 'git', 'api', 'microservices', 'database', 'frontend', 'backend',
-            'full-stack', 'agile', 'scrum', 'ci/cd', 'testing', 'debugging'
-        ],
-        'Data Science': [
-            'python', 'r', 'sql', 'machine learning', 'deep learning', 'tensorflow',
-            'pytorch', 'pandas', 'numpy', 'scikit-learn', 'statistics', 'data analysis',
-            'data visualization', 'tableau', 'power bi', 'jupyter', 'spark', 'hadoop'
-        ],
-        'Product': [
-            'product management', 'roadmap', 'stakeholder', 'user research', 'analytics',
-            'a/b testing', 'metrics', 'kpi', 'agile', 'scrum', 'jira', 'wireframes',
-            'user experience', 'market research', 'competitive analysis'
-        ],
-        'Design': [
-            'ui/ux', 'figma', 'sketch', 'adobe', 'photoshop', 'illustrator', 'wireframes',
-            'prototyping', 'user research', 'design systems', 'responsive design',
-            'accessibility', 'user testing', 'visual design', 'interaction design'
-        ]
-    }
-    
     def extract_keywords(self, text: str) -> List[str]:
         """Extract relevant keywords from text."""
-        import re
-        
-        # Convert to lowercase and remove special characters
-        text = re.sub(r'[^\w\s]', ' ', text.lower())
-        
-        # Common technical terms and skills
-        keywords = []
-        
-        # Extract programming languages (using word boundaries for single letters)
-        prog_languages = [
-            'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'go', 'rust',
-            'php', 'ruby', 'swift', 'kotlin', 'scala', 'matlab'
-        ]
-        
-        # Special handling for single-letter languages
-        single_letter_langs = ['r']
-        
-        # Extract frameworks and libraries
-        frameworks = [
-            'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask',
-            'spring', 'laravel', 'rails', 'tensorflow', 'pytorch', 'pandas', 'numpy'
-        ]
-        
-        # Extract tools and technologies
-        tools = [
-            'git', 'docker', 'kubernetes', 'aws', 'azure', 'gcp', 'jenkins', 'jira',
-            'confluence', 'slack', 'figma', 'sketch', 'tableau', 'power bi'
-        ]
-        
-        # Extract databases
-        databases = ['sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch']
-        
-        # Combine all keyword lists (excluding single letter languages)
-        all_keywords = prog_languages + frameworks + tools + databases
-        
-        # Find keywords in text
-        for keyword in all_keywords:
-            if keyword in text:
-                keywords.append(keyword)
-        
-        # Handle single-letter programming languages with word boundaries
-        for lang in single_letter_langs:
-            if re.search(r'\b' + lang + r'\b', text):
-                keywords.append(lang)
-        
-        # Extract multi-word technical terms
-        multi_word_terms = [
-            'machine learning', 'deep learning', 'data science', 'data analysis',
-            'software engineering', 'full stack', 'front end', 'back end',
-            'user experience', 'user interface', 'product management', 'project management',
-            'agile development', 'test driven development', 'continuous integration',
-            'continuous deployment', 'cloud computing', 'artificial intelligence'
-        ]
-        
-        for term in multi_word_terms:
-            if term in text:
-                keywords.append(term)
-        
-        return list(set(keywords))  # Remove duplicates
+        return list(skill_taxonomy.current().matcher.find(text))
     
-    def analyze_compatibility(self, resume_content: str, job_description: str) -> CompatibilityScore:
-        """Analyze compatibility between resume and job description."""
-        resume_keywords = set(self.extract_keywords(resume_content))
-        job_keywords = set(self.extract_keywords(job_description))
-        
-        # Find matched and missing keywords
-        matched_keywords = list(resume_keywords.intersection(job_keywords))
-        missing_keywords = list(job_keywords - resume_keywords)
-        
-        # Calculate compatibility score
-        if not job_keywords:
-            score = 0.0
-        else:
-            score = len(matched_keywords) / len(job_keywords)
-        
-        # Generate suggestions
-        suggestions = []
-        if missing_keywords:
-            suggestions.append(f"Consider adding these skills to your resume: {', '.join(missing_keywords[:5])}")
-        
-        if score < 0.3:
-            suggestions.append("Your resume has low compatibility with this job. Consider using a different resume version or adding more relevant experience.")
-        elif score < 0.6:
-            suggestions.append("Your resume has moderate compatibility. Consider emphasizing relevant projects and skills.")
-        else:
-            suggestions.append("Your resume has good compatibility with this job!")
-        
-        return CompatibilityScore(score, matched_keywords, missing_keywords, suggestions)
+    def analyze_compatibility(self, resume_content: str, job_description: str,
+                              statistics: Optional[CorpusStatistics] = None) -> CompatibilityScore:
+        """Analyze compatibility between resume and job description.
+        
+        Pass corpus ``statistics`` to also get a ``weighted_score`` in which
+        rare skills count for more than common ones.
+        """
+        matcher = statistics.matcher if statistics is not None else skill_taxonomy.current().matcher
+        return CompatibilityScore.from_masks(matcher.mask(resume_content), matcher.mask(job_description),
+                                             matcher, statistics)
+    
+    def keyword_fingerprint(self, resume_content: str) -> List[str]:
+        """Return the sorted keyword set stored on a resume version."""
+        return sorted(self.extract_keywords(resume_content))
+    
+    def update_fingerprint(self, version: ResumeVersion, force: bool = False,
+                           taxonomy: Optional[Taxonomy] = None) -> bool:
+        """Recompute a version's fingerprint if it is missing or from another taxonomy.
+        
+        Returns whether the fingerprint was recomputed; the caller commits.
+        """
+        taxonomy = taxonomy if taxonomy is not None else skill_taxonomy.current()
+        if not force and taxonomy.is_current(version.keyword_fingerprint, version.keyword_taxonomy_version):
+            return False
+        version.keyword_fingerprint = taxonomy.fingerprint(version.latex_content)
+        version.keyword_taxonomy_version = taxonomy.version
+        return True
     
     def suggest_resume_version(self, user_id: int, job_description: str) -> Optional[ResumeVersion]:
         """Suggest the best resume version for a job based on compatibility."""
-        user = User.query.get(user_id)
-        if not user or not user.resume_versions:
+        job_keywords = set(self.extract_keywords(job_description))
+        if not job_keywords:
             return None
         
+        # Score against stored fingerprints without loading the LaTeX bodies
+        versions = ResumeVersion.query.options(
+            load_only(ResumeVersion.id, ResumeVersion.name,
+                      ResumeVersion.category, ResumeVersion.keyword_fingerprint,
+                      ResumeVersion.keyword_taxonomy_version)
+        ).filter_by(user_id=user_id).order_by(ResumeVersion.id).all()
+        
         best_version = None
         best_score = 0.0
-        
-        for version in user.resume_versions:
-            compatibility = self.analyze_compatibility(version.latex_content, job_description)
-            if compatibility.score > best_score:
-                best_score = compatibility.score
+        backfilled = False
+        
+        for version in versions:
+            # Versions saved before fingerprints existed, or under an older taxonomy, are backfilled once
+            if self.update_fingerprint(version):
+                backfilled = True
+            
+            score = len(job_keywords.intersection(version.keyword_fingerprint)) / len(job_keywords)
+            if score > best_score:
+                best_score = score
                 best_version = version
         
+        if backfilled:
+            db.session.commit()
+        
         return best_version
     
     def get_category_from_job_description(self, job_description: str) -> str:
         """Determine job category from job description."""
-        job_text = job_description.lower()
-        
-        # Check for specific role indicators first
-        if any(term in job_text for term in ['software engineer', 'developer', 'programming']):
-            return 'Engineering'
-        elif any(term in job_text for term in ['data scientist', 'machine learning', 'analytics']):
-            return 'Data Science'
-        elif any(term in job_text for term in ['product manager', 'product']):
-            return 'Product'
-        elif any(term in job_text for term in ['designer', 'ui/ux', 'design']):
-            return 'Design'
-        
-        # Fallback to keyword scoring with word boundaries
-        import re
-        category_scores = {}
-        
-        for category, keywords in self.CATEGORY_KEYWORDS.items():
-            score = 0
-            for keyword in keywords:
-                # Use word boundaries for single-letter keywords, regular search for others
-                if len(keyword) == 1:
-                    if re.search(r'\b' + re.escape(keyword) + r'\b', job_text):
-                        score += 1
-                else:
-                    if keyword in job_text:
-                        score += 1
-            category_scores[category] = score
-        
-        # Return category with highest score, or 'Other' if no clear match
-        if category_scores:
-            best_category = max(category_scores, key=category_scores.get)
-            if category_scores[best_category] > 0:
-                return best_category
-        
-        return 'Other'
+        return skill_taxonomy.current().classifier.classify(job_description)
+    
+    def get_categories_from_job_descriptions(self, job_descriptions: Iterable[str]) -> List[str]:
+        """Determine the job category of many descriptions, e.g. a chunk of ingested postings."""
+        return skill_taxonomy.current().classifier.classify_many(job_descriptions)
+    
+    def list_resume_versions(self, user_id: int, limit: Optional[int] = None,
+                             before: Optional[int] = None) -> List[ResumeVersion]:
+        """List a user's resume versions, newest first, without their LaTeX bodies.
+        
+        Versions are ordered by id, which follows creation order, so ``before``
+        (the last id of the previous page) is a stable cursor: inserts and
+        deletes never shift later pages the way an offset would.
+        """
+        query = ResumeVersion.query.options(
+            load_only(ResumeVersion.id, ResumeVersion.name,
+                      ResumeVersion.category, ResumeVersion.created_at)
+        ).filter(ResumeVersion.user_id == user_id)
+        if before is not None:
+            query = query.filter(ResumeVersion.id < before)
+        query = query.order_by(ResumeVersion.id.desc())
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
     
     def get_resume_versions_by_category(self, user_id: int, category: str) -> List[ResumeVersion]:
         """Get resume versions filtered by category."""
-        user = User.query.get(user_id)
-        if not user:
-            return []
-        
-        return [v for v in user.resume_versions if v.category == category]
\ No newline at end of file
+        return ResumeVersion.query.filter_by(
+            user_id=user_id,
+            category=category
+        ).order_by(ResumeVersion.id).all()
+
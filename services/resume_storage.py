@@ -0,0 +1,79 @@
+"""Maintenance for content-addressed resume storage (models.content_chunk)."""
+from datetime import datetime, timedelta
+from typing import Dict, Set
+
+from models import db
+from models.content_chunk import ContentChunk, chunk_hash, split_chunks, store_chunks
+from models.resume_version import ResumeVersion
+
+# Longest a resume version's transaction may run between storing its chunks and committing
+GC_GRACE_SECONDS = 24 * 3600
+
+
+def migrate_resume_versions(batch_size: int = 200) -> int:
+    """Move inline LaTeX bodies into content chunks; return the number of rows moved.
+
+    Run it after ``flask db upgrade`` has added the chunk storage schema.
+    Rows are converted in id order with one commit per batch, so the
+    migration can be interrupted and re-run.
+    """
+    table = ResumeVersion.__table__
+    migrated = 0
+    last_id = 0
+    while True:
+        # Core rows, since the ORM property would hand back the inline body without chunking it
+        rows = db.session.execute(
+            db.select(table.c.id, table.c.latex_content)
+            .where(table.c.chunk_hashes.is_(None), table.c.id > last_id)
+            .order_by(table.c.id).limit(batch_size)
+        ).all()
+        if not rows:
+            break
+
+        connection = db.session.connection()
+        chunks: Dict[str, str] = {}
+        updates = []
+        for row in rows:
+            pieces = split_chunks(row.latex_content or '')
+            hashes = [chunk_hash(piece) for piece in pieces]
+            chunks.update(zip(hashes, pieces))
+            updates.append({'row_id': row.id, 'chunk_hashes': hashes})
+        store_chunks(connection, chunks)
+        connection.execute(
+            table.update().where(table.c.id == db.bindparam('row_id'))
+            .values(chunk_hashes=db.bindparam('chunk_hashes'), latex_content=''),
+            updates
+        )
+        db.session.commit()
+
+        migrated += len(rows)
+        last_id = rows[-1].id
+    return migrated
+
+
+def _referenced_hashes() -> Set[str]:
+    referenced: Set[str] = set()
+    for hashes, in db.session.query(ResumeVersion.chunk_hashes).filter(ResumeVersion.chunk_hashes.isnot(None)):
+        referenced.update(hashes)
+    return referenced
+
+
+def delete_unreferenced_chunks(grace_seconds: float = GC_GRACE_SECONDS) -> int:
+    """Delete chunks no resume version points at; return how many were removed.
+
+    A version's chunks are written during its flush but its chunk_hashes only
+    become visible when it commits, so a chunk stored or re-stored within
+    ``grace_seconds`` is kept even if nothing references it yet. The age is
+    checked again by the DELETE itself, so a write that lands after the
+    references were read still keeps its chunks.
+    """
+    cutoff = datetime.utcnow() - timedelta(seconds=grace_seconds)
+    stale = {h for h, in db.session.query(ContentChunk.hash).filter(ContentChunk.created_at < cutoff)}
+    unreferenced = list(stale - _referenced_hashes())
+    deleted = 0
+    for start in range(0, len(unreferenced), 500):
+        deleted += ContentChunk.query.filter(
+            ContentChunk.hash.in_(unreferenced[start:start + 500]), ContentChunk.created_at < cutoff
+        ).delete(synchronize_session=False)
+    db.session.commit()
+    return deleted
@@ -0,0 +1,152 @@
+"""Full-text search tables for resume versions and job postings.
+
+SQLite gets FTS5 virtual tables whose rowid is the indexed row's id.
+PostgreSQL gets plain tables holding the stripped text and a GIN-indexed
+tsvector. The tables are created by a migration (and alongside the ORM
+tables by ``db.create_all``) and kept in sync by mapper events, registered
+when this module is imported; create_app imports it. Bulk Core writes (feed
+ingest) call ``index_job_postings`` themselves.
+"""
+from typing import Iterable, Mapping
+
+from sqlalchemy import event, inspect, text
+
+from models import db
+from models.job_posting import JobPosting
+from models.resume_version import ResumeVersion
+from services.latex_text import strip_latex
+
+# Text search configuration used for PostgreSQL tsvectors and queries
+TS_CONFIG = 'english'
+
+_CREATE = {
+    'sqlite': [
+        "CREATE VIRTUAL TABLE IF NOT EXISTS resume_search USING fts5("
+        "title, body, tokenize='porter unicode61')",
+        "CREATE VIRTUAL TABLE IF NOT EXISTS job_posting_search USING fts5("
+        "title, body, tokenize='porter unicode61')",
+    ],
+    'postgresql': [
+        "CREATE TABLE IF NOT EXISTS resume_search ("
+        "id INTEGER PRIMARY KEY REFERENCES resume_versions (id) ON DELETE CASCADE, "
+        "title TEXT NOT NULL, body TEXT NOT NULL, document TSVECTOR NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS ix_resume_search_document ON resume_search USING GIN (document)",
+        "CREATE TABLE IF NOT EXISTS job_posting_search ("
+        "id INTEGER PRIMARY KEY REFERENCES job_postings (id) ON DELETE CASCADE, "
+        "title TEXT NOT NULL, body TEXT NOT NULL, document TSVECTOR NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS ix_job_posting_search_document ON job_posting_search USING GIN (document)",
+    ],
+}
+
+_DROP = [
+    "DROP TABLE IF EXISTS resume_search",
+    "DROP TABLE IF EXISTS job_posting_search",
+]
+
+
+def _upsert_sql(dialect: str, table: str):
+    if dialect == 'sqlite':
+        return [
+            text(f"DELETE FROM {table} WHERE rowid = :id"),
+            text(f"INSERT INTO {table} (rowid, title, body) VALUES (:id, :title, :body)"),
+        ]
+    if dialect == 'postgresql':
+        # Titles weigh more than body text in ts_rank
+        return [text(
+            f"INSERT INTO {table} (id, title, body, document) VALUES (:id, :title, :body, "
+            f"setweight(to_tsvector('{TS_CONFIG}', :title), 'A') || to_tsvector('{TS_CONFIG}', :body)) "
+            "ON CONFLICT (id) DO UPDATE SET title = EXCLUDED.title, body = EXCLUDED.body, "
+            "document = EXCLUDED.document"
+        )]
+    return []
+
+
+def _delete_sql(dialect: str, table: str):
+    if dialect == 'sqlite':
+        return text(f"DELETE FROM {table} WHERE rowid = :id")
+    if dialect == 'postgresql':
+        return text(f"DELETE FROM {table} WHERE id = :id")
+    return None
+
+
+def _write(connection, table: str, documents: Iterable[Mapping]) -> None:
+    documents = list(documents)
+    if not documents:
+        return
+    for statement in _upsert_sql(connection.dialect.name, table):
+        connection.execute(statement, documents)
+
+
+def index_resume_versions(connection, versions: Iterable) -> None:
+    """Index resume versions (objects or rows with id, name and latex_content)."""
+    _write(connection, 'resume_search', (
+        {'id': version.id, 'title': version.name or '', 'body': strip_latex(version.latex_content)}
+        for version in versions
+    ))
+
+
+def index_job_postings(connection, postings: Iterable[Mapping]) -> None:
+    """Index job postings given as mappings with id, title, company and description."""
+    _write(connection, 'job_posting_search', (
+        {'id': posting['id'], 'title': f"{posting['title']} {posting['company'] or ''}".strip(),
+         'body': strip_latex(posting['description'] or '')}
+        for posting in postings
+    ))
+
+
+# The migration carries its own copy of this DDL; these hooks serve db.create_all (manage.py init, tests)
+@event.listens_for(db.metadata, 'after_create')
+def _create_search_tables(target, connection, **kw):
+    for statement in _CREATE.get(connection.dialect.name, []):
+        connection.execute(text(statement))
+
+
+@event.listens_for(db.metadata, 'before_drop')
+def _drop_search_tables(target, connection, **kw):
+    if connection.dialect.name in _CREATE:
+        for statement in _DROP:
+            connection.execute(text(statement))
+
+
+def _changed(target, *attributes) -> bool:
+    state = inspect(target)
+    return any(state.attrs[name].history.has_changes() for name in attributes)
+
+
+@event.listens_for(ResumeVersion, 'after_insert')
+def _resume_inserted(mapper, connection, target):
+    index_resume_versions(connection, [target])
+
+
+@event.listens_for(ResumeVersion, 'after_update')
+def _resume_updated(mapper, connection, target):
+    if _changed(target, 'name', 'inline_content', 'chunk_hashes'):
+        index_resume_versions(connection, [target])
+
+
+@event.listens_for(JobPosting, 'after_insert')
+def _job_posting_inserted(mapper, connection, target):
+    index_job_postings(connection, [_posting_fields(target)])
+
+
+@event.listens_for(JobPosting, 'after_update')
+def _job_posting_updated(mapper, connection, target):
+    if _changed(target, 'title', 'company', 'description'):
+        index_job_postings(connection, [_posting_fields(target)])
+
+
+def _posting_fields(posting: JobPosting) -> Mapping:
+    return {'id': posting.id, 'title': posting.title, 'company': posting.company,
+            'description': posting.description}
+
+
+def _deleted(table: str):
+    def listener(mapper, connection, target):
+        statement = _delete_sql(connection.dialect.name, table)
+        if statement is not None:
+            connection.execute(statement, {'id': target.id})
+    return listener
+
+
+event.listen(ResumeVersion, 'after_delete', _deleted('resume_search'))
+event.listen(JobPosting, 'after_delete', _deleted('job_posting_search'))
@@ -0,0 +1,120 @@
+"""Full-text search over resume versions and job postings."""
+import re
+from typing import List, NamedTuple, Optional
+
+from sqlalchemy import text
+
+from models import db
+from models.job_posting import JobPosting
+from models.resume_version import ResumeVersion
+from services.search_index import TS_CONFIG, index_job_postings, index_resume_versions
+
+_WORD_RE = re.compile(r'\w+')
+
+# Snippet highlight markers; plain text so results are safe to render anywhere
+HIGHLIGHT_START = '['
+HIGHLIGHT_END = ']'
+
+
+class SearchResult(NamedTuple):
+    """One search hit. Higher scores are better."""
+    id: int
+    title: str
+    snippet: str
+    score: float
+
+
+def fts5_query(query: str) -> str:
+    """Turn free text into an FTS5 query matching all of its words.
+
+    Each word is quoted, so FTS5 operators and punctuation in user input are
+    treated as plain text.
+    """
+    return ' '.join(f'"{word}"' for word in _WORD_RE.findall(query))
+
+
+class FullTextSearch:
+    """Dialect-independent search API over the tables in services.search_index."""
+
+    def __init__(self, snippet_words: int = 16):
+        self.snippet_words = snippet_words
+
+    @property
+    def dialect(self) -> str:
+        return db.engine.dialect.name
+
+    def _search(self, table: str, source_table: str, query: str, limit: int,
+                owner_filter: str = '', params: Optional[dict] = None) -> List[SearchResult]:
+        params = dict(params or {}, limit=limit)
+
+        if self.dialect == 'sqlite':
+            params['query'] = fts5_query(query)
+            if not params['query']:
+                return []
+            statement = text(
+                f"SELECT s.rowid AS id, s.title, "
+                f"snippet({table}, 1, :start, :end, '…', :words) AS snippet, bm25({table}) AS rank "
+                f"FROM {table} s JOIN {source_table} src ON src.id = s.rowid "
+                f"WHERE {table} MATCH :query {owner_filter} "
+                f"ORDER BY rank LIMIT :limit"
+            )
+            params.update(start=HIGHLIGHT_START, end=HIGHLIGHT_END, words=self.snippet_words)
+            # bm25() is lower-is-better; flip it so every dialect ranks high-is-better
+            return [SearchResult(row.id, row.title, row.snippet, -row.rank)
+                    for row in db.session.execute(statement, params)]
+
+        if self.dialect == 'postgresql':
+            if not _WORD_RE.search(query):
+                return []
+            statement = text(
+                f"SELECT s.id, s.title, ts_headline('{TS_CONFIG}', s.body, q, :options) AS snippet, "
+                f"ts_rank(s.document, q) AS rank "
+                f"FROM {table} s JOIN {source_table} src ON src.id = s.id, "
+                f"websearch_to_tsquery('{TS_CONFIG}', :query) q "
+                f"WHERE s.document @@ q {owner_filter} "
+                f"ORDER BY rank DESC LIMIT :limit"
+            )
+            params.update(query=query, options=(
+                f'StartSel="{HIGHLIGHT_START}", StopSel="{HIGHLIGHT_END}", '
+                f'MaxWords={self.snippet_words}, MinWords={max(1, self.snippet_words // 2)}'
+            ))
+            return [SearchResult(row.id, row.title, row.snippet, float(row.rank))
+                    for row in db.session.execute(statement, params)]
+
+        raise ValueError(f"Full-text search is not supported on {self.dialect}")
+
+    def search_resumes(self, query: str, user_id: int, limit: int = 20) -> List[SearchResult]:
+        """Search one user's resume versions."""
+        return self._search('resume_search', 'resume_versions', query, limit,
+                            'AND src.user_id = :user_id', {'user_id': user_id})
+
+    def search_job_postings(self, query: str, limit: int = 20) -> List[SearchResult]:
+        """Search all job postings by title, company and description."""
+        return self._search('job_posting_search', 'job_postings', query, limit)
+
+    def rebuild(self, batch_size: int = 500) -> None:
+        """Re-index every resume version and job posting."""
+        connection = db.session.connection()
+        for statement in ('DELETE FROM resume_search', 'DELETE FROM job_posting_search'):
+            connection.execute(text(statement))
+
+        last_id = 0
+        while True:
+            # Whole objects, since a version's body may have to be reassembled from chunks
+            versions = ResumeVersion.query.filter(ResumeVersion.id > last_id).order_by(
+                ResumeVersion.id).limit(batch_size).all()
+            if not versions:
+                break
+            index_resume_versions(connection, versions)
+            last_id = versions[-1].id
+
+        last_id = 0
+        while True:
+            rows = db.session.query(JobPosting.id, JobPosting.title, JobPosting.company,
+                                    JobPosting.description).filter(JobPosting.id > last_id).order_by(
+                JobPosting.id).limit(batch_size).all()
+            if not rows:
+                break
+            index_job_postings(connection, (row._mapping for row in rows))
+            last_id = rows[-1].id
+        db.session.commit()
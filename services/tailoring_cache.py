@@ -0,0 +1,198 @@
+"""Content-addressed cache for tailored resume LaTeX."""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+
+from services.metric_counters import DatabaseCounters, MemoryCounters, RedisCounters
+
+
+class MemoryCacheBackend:
+    """In-process LRU cache backend."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, Tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.counters = MemoryCounters('tailoring_cache')
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class DatabaseCacheBackend:
+    """Cache backend stored in the tailoring_cache table of the app database."""
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        # Hit/miss rows in metric_counters, so worker lookups show up in the web process
+        self.counters = DatabaseCounters('tailoring_cache')
+
+    def get(self, key: str) -> Optional[str]:
+        from models import db
+        from models.tailoring_cache_entry import TailoringCacheEntry
+
+        entry = db.session.get(TailoringCacheEntry, key)
+        if entry is None:
+            return None
+        if entry.expires_at < datetime.utcnow():
+            db.session.delete(entry)
+            db.session.commit()
+            return None
+        entry.accessed_at = datetime.utcnow()
+        db.session.commit()
+        return entry.latex_content
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        from models import db
+        from models.tailoring_cache_entry import TailoringCacheEntry
+
+        now = datetime.utcnow()
+        entry = db.session.get(TailoringCacheEntry, key) or TailoringCacheEntry(key=key)
+        entry.latex_content = value
+        entry.accessed_at = now
+        entry.expires_at = now + timedelta(seconds=ttl)
+        db.session.add(entry)
+        db.session.flush()
+
+        # Evict expired entries, then the least recently used beyond the cap
+        TailoringCacheEntry.query.filter(TailoringCacheEntry.expires_at < now).delete()
+        overflow = TailoringCacheEntry.query.count() - self.max_entries
+        if overflow > 0:
+            stale = db.session.query(TailoringCacheEntry.key).order_by(
+                TailoringCacheEntry.accessed_at).limit(overflow)
+            TailoringCacheEntry.query.filter(TailoringCacheEntry.key.in_(stale)).delete(
+                synchronize_session=False)
+        db.session.commit()
+
+    def clear(self) -> None:
+        from models import db
+        from models.tailoring_cache_entry import TailoringCacheEntry
+
+        TailoringCacheEntry.query.delete()
+        db.session.commit()
+
+
+class RedisCacheBackend:
+    """Cache backend shared between processes through Redis."""
+
+    def __init__(self, url: str, max_entries: int = 10000, prefix: str = 'tailoring:'):
+        import redis
+
+        self.redis = redis.Redis.from_url(url)
+        self.max_entries = max_entries
+        self.prefix = prefix
+        self._index = prefix + 'lru'
+        self.counters = RedisCounters(self.redis, prefix + 'stats')
+
+    def get(self, key: str) -> Optional[str]:
+        value = self.redis.get(self.prefix + key)
+        if value is None:
+            self.redis.zrem(self._index, key)
+            return None
+        self.redis.zadd(self._index, {key: time.time()})
+        return value.decode('utf-8')
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        pipe = self.redis.pipeline()
+        pipe.set(self.prefix + key, value.encode('utf-8'), ex=ttl)
+        pipe.zadd(self._index, {key: time.time()})
+        pipe.execute()
+
+        overflow = self.redis.zcard(self._index) - self.max_entries
+        if overflow > 0:
+            stale = self.redis.zrange(self._index, 0, overflow - 1)
+            pipe = self.redis.pipeline()
+            pipe.delete(*[self.prefix + k.decode('utf-8') for k in stale])
+            pipe.zrem(self._index, *stale)
+            pipe.execute()
+
+    def clear(self) -> None:
+        keys = [self.prefix + k.decode('utf-8') for k in self.redis.zrange(self._index, 0, -1)]
+        if keys:
+            self.redis.delete(*keys)
+        self.redis.delete(self._index)
+
+
+class TailoringCache:
+    """Cache of post-processed tailoring results keyed by a content hash."""
+
+    def __init__(self, backend, ttl: int = 86400):
+        self.backend = backend
+        self.ttl = ttl
+
+    @staticmethod
+    def make_key(model: str, prompt_version: str, resume: str, job_description: str) -> str:
+        """Hash everything that determines the tailored output."""
+        digest = hashlib.sha256()
+        for part in (model, str(prompt_version), resume, job_description):
+            data = part.encode('utf-8')
+            # Length-prefix each part so different splits never collide
+            digest.update(len(data).to_bytes(8, 'big'))
+            digest.update(data)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        value = self.backend.get(key)
+        self.backend.counters.add({'misses' if value is None else 'hits': 1})
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        self.backend.set(key, value, self.ttl)
+
+    def clear(self) -> None:
+        self.backend.clear()
+        self.backend.counters.reset()
+
+    def stats(self) -> Dict[str, float]:
+        """Return hit/miss counters kept by the backend, shared like its entries."""
+        counters = self.backend.counters.values()
+        hits = int(counters.get('hits', 0))
+        misses = int(counters.get('misses', 0))
+        lookups = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / lookups if lookups else 0.0
+        }
+
+
+def make_tailoring_cache(config) -> Optional[TailoringCache]:
+    """Build the tailoring cache selected by TAILORING_CACHE_BACKEND."""
+    backend_name = config.get('TAILORING_CACHE_BACKEND', 'memory')
+    max_entries = config.get('TAILORING_CACHE_MAX_ENTRIES', 1024)
+
+    if backend_name == 'memory':
+        backend = MemoryCacheBackend(max_entries)
+    elif backend_name == 'database':
+        backend = DatabaseCacheBackend(max_entries)
+    elif backend_name == 'redis':
+        backend = RedisCacheBackend(config['TAILORING_CACHE_REDIS_URL'], max_entries)
+    elif backend_name == 'none':
+        return None
+    else:
+        raise ValueError(f"Unknown tailoring cache backend: {backend_name}")
+
+    return TailoringCache(backend, ttl=config.get('TAILORING_CACHE_TTL', 86400))
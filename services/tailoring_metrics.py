@@ -0,0 +1,61 @@
+"""Token usage and latency accounting for Gemini tailoring calls."""
+from typing import Dict, Optional
+
+from services.metric_counters import MemoryCounters
+
+FIELDS = ('calls', 'prompt_tokens', 'output_tokens', 'latency')
+
+
+def _count(value) -> int:
+    return value if isinstance(value, int) else 0
+
+
+class TailoringMetrics:
+    """Per-mode totals of prompt/output tokens and model latency.
+
+    Tailoring usually runs in the Celery worker while the metrics endpoint is
+    served by the web process, so the totals live in a counter store from
+    services.metric_counters that both can reach (see TAILORING_METRICS_BACKEND).
+    """
+
+    def __init__(self, counters=None):
+        self.counters = counters if counters is not None else MemoryCounters('tailoring')
+
+    def record(self, mode: str, usage_metadata, latency: float) -> Dict[str, float]:
+        """Record one model call and return its individual measurements."""
+        call = {
+            'prompt_tokens': _count(getattr(usage_metadata, 'prompt_token_count', None)),
+            'output_tokens': _count(getattr(usage_metadata, 'candidates_token_count', None)),
+            'latency': latency,
+        }
+        deltas = {f'{mode}.calls': 1}
+        deltas.update((f'{mode}.{name}', value) for name, value in call.items())
+        self.counters.add(deltas)
+        return call
+
+    def snapshot(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """Return totals and per-call averages for each tailoring mode."""
+        modes: Dict[str, Dict[str, float]] = {}
+        for name, value in self.counters.values().items():
+            mode, _, field = name.rpartition('.')
+            if field in FIELDS:
+                modes.setdefault(mode, dict.fromkeys(FIELDS, 0))[field] = value
+
+        snapshot = {}
+        for mode, totals in modes.items():
+            calls = int(totals['calls'])
+            if not calls:
+                continue
+            snapshot[mode] = {
+                'calls': calls,
+                'prompt_tokens': int(totals['prompt_tokens']),
+                'output_tokens': int(totals['output_tokens']),
+                'latency': float(totals['latency']),
+                'avg_prompt_tokens': totals['prompt_tokens'] / calls,
+                'avg_output_tokens': totals['output_tokens'] / calls,
+                'avg_latency': totals['latency'] / calls,
+            }
+        return snapshot
+
+    def reset(self) -> None:
+        self.counters.reset()
@@ -0,0 +1,208 @@
+"""Skill taxonomy: the keyword vocabulary, its aliases and the job categories, loaded from a data file."""
+import json
+import os
+import threading
+import time
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+from services.category_classifier import CategoryClassifier
+from services.keyword_matcher import KeywordMatcher
+
+# Shipped with the app; SKILL_TAXONOMY_PATH points workers at another file
+DEFAULT_TAXONOMY_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'skill_taxonomy.json'
+)
+
+
+class InvalidTaxonomy(ValueError):
+    """A taxonomy file that cannot be parsed or is inconsistent."""
+
+
+def _terms(values: Any, where: str) -> Tuple[str, ...]:
+    """Lowercased, whitespace-normalized terms in file order, without repeats."""
+    if not isinstance(values, list) or not all(isinstance(value, str) and value.strip() for value in values):
+        raise InvalidTaxonomy(f'{where} must be a list of non-empty strings')
+    terms: Dict[str, None] = {}
+    for value in values:
+        terms[' '.join(value.lower().split())] = None
+    return tuple(terms)
+
+
+def _section(data: Mapping, name: str) -> Mapping:
+    section = data.get(name) or {}
+    if not isinstance(section, dict):
+        raise InvalidTaxonomy(f'{name} must be a mapping')
+    return section
+
+
+class Taxonomy(NamedTuple):
+    """A compiled, read-only skill taxonomy.
+
+    ``skills`` groups the vocabulary extracted from resumes and job
+    descriptions, ``aliases`` maps other spellings to a skill or category
+    term, and ``categories``/``category_rules`` drive job classification.
+    The matcher and classifier are compiled once per taxonomy; fingerprints
+    computed with one are tagged with its ``version``.
+    """
+
+    version: str
+    skills: Mapping[str, Tuple[str, ...]]
+    aliases: Mapping[str, str]
+    categories: Mapping[str, Tuple[str, ...]]
+    category_rules: Tuple[Tuple[str, Tuple[str, ...]], ...]
+    profile_skills: Tuple[str, ...]
+    matcher: KeywordMatcher
+    classifier: CategoryClassifier
+
+    @classmethod
+    def from_dict(cls, data: Any) -> 'Taxonomy':
+        """Validate and compile a parsed taxonomy file."""
+        if not isinstance(data, dict):
+            raise InvalidTaxonomy('A taxonomy must be a mapping')
+        version = data.get('version')
+        if version is None or not str(version).strip():
+            raise InvalidTaxonomy('version is required')
+
+        skills = {group: _terms(terms, f'skills.{group}') for group, terms in _section(data, 'skills').items()}
+        skill_terms = {term for terms in skills.values() for term in terms}
+        if not skill_terms:
+            raise InvalidTaxonomy('skills must list at least one term')
+
+        categories: Dict[str, Tuple[str, ...]] = {}
+        category_rules = []
+        for name, category in _section(data, 'categories').items():
+            if not isinstance(category, dict):
+                raise InvalidTaxonomy(f'categories.{name} must be a mapping')
+            categories[name] = _terms(category.get('keywords', []), f'categories.{name}.keywords')
+            roles = _terms(category.get('roles', []), f'categories.{name}.roles')
+            if roles:
+                category_rules.append((name, roles))
+        category_terms = {term for terms in categories.values() for term in terms}
+        category_terms.update(term for _, roles in category_rules for term in roles)
+
+        aliases: Dict[str, str] = {}
+        for target, spellings in _section(data, 'aliases').items():
+            target = ' '.join(target.lower().split())
+            if target not in skill_terms and target not in category_terms:
+                raise InvalidTaxonomy(f'Alias target "{target}" is not a skill or category term')
+            for alias in _terms(spellings, f'aliases.{target}'):
+                if alias in skill_terms or alias in category_terms:
+                    raise InvalidTaxonomy(f'Alias "{alias}" is already a term')
+                if aliases.setdefault(alias, target) != target:
+                    raise InvalidTaxonomy(f'Alias "{alias}" names both "{aliases[alias]}" and "{target}"')
+
+        profile_skills = data.get('profile_skills', [])
+        if not isinstance(profile_skills, list) or not all(isinstance(skill, str) for skill in profile_skills):
+            raise InvalidTaxonomy('profile_skills must be a list of strings')
+
+        return cls(
+            version=str(version).strip(),
+            skills=MappingProxyType(skills),
+            aliases=MappingProxyType(aliases),
+            categories=MappingProxyType(categories),
+            category_rules=tuple(category_rules),
+            profile_skills=tuple(profile_skills),
+            matcher=KeywordMatcher(skill_terms, {
+                alias: target for alias, target in aliases.items() if target in skill_terms
+            }),
+            classifier=CategoryClassifier(categories, category_rules, aliases=aliases),
+        )
+
+    def fingerprint(self, *texts: Optional[str]) -> List[str]:
+        """Sorted skill terms found in any of the texts."""
+        keywords = set()
+        for text in texts:
+            if text:
+                keywords |= self.matcher.find(text)
+        return sorted(keywords)
+
+    def is_current(self, fingerprint: Optional[List[str]], version: Optional[str]) -> bool:
+        """Whether a stored fingerprint was computed with this taxonomy."""
+        return fingerprint is not None and version == self.version
+
+
+def load_taxonomy(path: str) -> Taxonomy:
+    """Read and compile a taxonomy from a .json, .yaml or .yml file."""
+    with open(path, encoding='utf-8') as stream:
+        if path.lower().endswith(('.yaml', '.yml')):
+            import yaml  # Only needed for YAML taxonomies
+
+            try:
+                data = yaml.safe_load(stream)
+            except yaml.YAMLError as e:
+                raise InvalidTaxonomy(f'{path}: {e}') from e
+        else:
+            try:
+                data = json.load(stream)
+            except ValueError as e:
+                raise InvalidTaxonomy(f'{path}: {e}') from e
+    return Taxonomy.from_dict(data)
+
+
+class TaxonomyStore:
+    """Process-wide taxonomy that follows its file without restarting workers.
+
+    The file is compiled on first use. Every ``refresh_seconds`` one stat()
+    checks whether it changed; a changed file is compiled in full before the
+    reference is swapped, so a caller holding a taxonomy keeps a consistent
+    snapshot and never sees a half-built one. A file that fails to load
+    leaves the previous taxonomy in place and is reported in ``last_error``.
+    Replace the file with a rename so a partial write is never read.
+    """
+
+    def __init__(self, path: str = DEFAULT_TAXONOMY_PATH, refresh_seconds: float = 30):
+        self.path = path
+        self.refresh_seconds = refresh_seconds
+        self.last_error: Optional[str] = None
+        self._taxonomy: Optional[Taxonomy] = None
+        self._stamp = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def _file_stamp(self) -> Tuple[int, int]:
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load(self) -> Taxonomy:
+        stamp = self._file_stamp()
+        self._taxonomy = load_taxonomy(self.path)
+        self._stamp = stamp
+        self._checked_at = time.monotonic()
+        self.last_error = None
+        return self._taxonomy
+
+    def configure(self, path: Optional[str] = None, refresh_seconds: Optional[float] = None) -> Taxonomy:
+        """Point the store at a file and compile it now, e.g. at app startup."""
+        with self._lock:
+            if path:
+                self.path = path
+            if refresh_seconds is not None:
+                self.refresh_seconds = refresh_seconds
+            return self._load()
+
+    def reload(self) -> Taxonomy:
+        """Compile the file now; raises, keeping the current taxonomy, if it is invalid."""
+        with self._lock:
+            return self._load()
+
+    def current(self) -> Taxonomy:
+        """Return the loaded taxonomy, reloading it if its file changed."""
+        taxonomy = self._taxonomy
+        if taxonomy is not None and time.monotonic() - self._checked_at <= self.refresh_seconds:
+            return taxonomy
+        with self._lock:
+            if self._taxonomy is None:
+                return self._load()
+            if time.monotonic() - self._checked_at > self.refresh_seconds:
+                self._checked_at = time.monotonic()
+                try:
+                    if self._file_stamp() != self._stamp:
+                        self._load()
+                except (OSError, InvalidTaxonomy) as e:
+                    self.last_error = str(e)
+            return self._taxonomy
+
+
+# Shared by every service in the process; create_app points it at SKILL_TAXONOMY_PATH
+skill_taxonomy = TaxonomyStore()
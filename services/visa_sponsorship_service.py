@@ -0,0 +1,179 @@
+"""In-memory visa sponsorship lookup by company name."""
+import re
+import threading
+import time
+import unicodedata
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import func
+
+from models import db
+from models.visa_sponsorship_data import VisaSponsorshipData, approval_rate
+
+_WORD_RE = re.compile(r'[a-z0-9]+')
+
+# Trailing words that only name the legal form (or a web domain): "Google LLC" and "Google" are one employer
+LEGAL_SUFFIXES = frozenset({
+    'inc', 'incorporated', 'llc', 'llp', 'lp', 'ltd', 'limited', 'corp', 'corporation', 'co',
+    'company', 'plc', 'gmbh', 'ag', 'sa', 'nv', 'bv', 'pvt', 'pte', 'holdings', 'group', 'com',
+})
+
+# Bound on remembered raw-name resolutions per loaded directory
+MAX_RESOLVED_NAMES = 200_000
+
+
+@lru_cache(maxsize=65536)
+def normalize_company(name: str) -> str:
+    """Case-, accent- and punctuation-insensitive company key without legal suffixes."""
+    text = unicodedata.normalize('NFKD', name or '').encode('ascii', 'ignore').decode('ascii').lower()
+    words = _WORD_RE.findall(text.replace('&', ' and '))
+    stripped = words[1:] if words[:1] == ['the'] else list(words)
+    while stripped and stripped[-1] in LEGAL_SUFFIXES:
+        stripped.pop()
+    # A name made only of suffixes ("The Company") keeps its words
+    return ' '.join(stripped or words)
+
+
+def trigrams(key: str) -> FrozenSet[str]:
+    """Character trigrams of a normalized name, padded so word edges count."""
+    padded = f'  {key} '
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+class Sponsor(NamedTuple):
+    """A company's sponsorship history, with its approval rate worked out once."""
+    company_name: str
+    visa_types_sponsored: Tuple[str, ...]
+    h1b_approvals: int
+    h1b_denials: int
+    h1b_approval_rate: Optional[float]
+
+    @property
+    def sponsors_visas(self) -> bool:
+        return bool(self.visa_types_sponsored)
+
+    def to_dict(self) -> dict:
+        return dict(self._asdict(), sponsors_visas=self.sponsors_visas)
+
+
+class SponsorDirectory:
+    """Sponsors by normalized name, with a trigram index for near misses.
+
+    A near miss must have as many words as the name it stands for, so a
+    misspelling resolves but a longer name that merely contains a sponsor's
+    name ("Apple Bank" for "Apple") does not.
+    """
+
+    def __init__(self, sponsors: Iterable[Sponsor], min_similarity: float = 0.5):
+        self.min_similarity = min_similarity
+        self.by_key: Dict[str, Sponsor] = {}
+        for sponsor in sponsors:
+            self.by_key.setdefault(normalize_company(sponsor.company_name), sponsor)
+
+        self.keys: List[str] = list(self.by_key)
+        self.sizes: List[int] = []
+        self.word_counts: List[int] = []
+        self.postings: Dict[str, List[int]] = {}
+        for position, key in enumerate(self.keys):
+            grams = trigrams(key)
+            self.sizes.append(len(grams))
+            self.word_counts.append(key.count(' ') + 1)
+            for gram in grams:
+                self.postings.setdefault(gram, []).append(position)
+
+        # Raw name -> resolved sponsor (or None); names repeat heavily across postings
+        self.resolved: Dict[str, Optional[Sponsor]] = {}
+
+    def closest(self, key: str) -> Optional[Sponsor]:
+        """The sponsor with as many words whose name shares the most trigrams with key (Jaccard similarity)."""
+        grams = trigrams(key)
+        words = key.count(' ') + 1
+        shared = Counter()
+        for gram in grams:
+            shared.update(self.postings.get(gram, ()))
+        best, best_score = None, self.min_similarity
+        for position, count in shared.items():
+            if self.word_counts[position] != words:
+                continue
+            score = count / (len(grams) + self.sizes[position] - count)
+            if score > best_score or (score == best_score and best is not None and position < best):
+                best, best_score = position, score
+        return self.by_key[self.keys[best]] if best is not None else None
+
+    def resolve(self, name: str) -> Optional[Sponsor]:
+        try:
+            return self.resolved[name]
+        except KeyError:
+            pass
+        key = normalize_company(name)
+        sponsor = self.by_key.get(key)
+        if sponsor is None and key:
+            sponsor = self.closest(key)
+        if len(self.resolved) >= MAX_RESOLVED_NAMES:
+            self.resolved.clear()
+        self.resolved[name] = sponsor
+        return sponsor
+
+
+class VisaSponsorshipLookup:
+    """Process-wide sponsorship lookup for enriching job postings.
+
+    visa_sponsorship_data is read once into a SponsorDirectory. Every
+    ``refresh_seconds`` one cheap query compares the row count and latest
+    ``last_updated`` with the loaded copy and reloads only if they moved.
+    Lookups themselves never touch the database.
+    """
+
+    def __init__(self, refresh_seconds: float = 60, min_similarity: float = 0.5):
+        self.refresh_seconds = refresh_seconds
+        self.min_similarity = min_similarity
+        self._directory: Optional[SponsorDirectory] = None
+        self._version = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _current_version():
+        return db.session.query(func.count(VisaSponsorshipData.id), func.max(VisaSponsorshipData.last_updated)).one()
+
+    def _load(self) -> SponsorDirectory:
+        rows = db.session.query(VisaSponsorshipData.company_name, VisaSponsorshipData.visa_types_sponsored,
+                                VisaSponsorshipData.h1b_approvals, VisaSponsorshipData.h1b_denials).order_by(
+            VisaSponsorshipData.id)
+        return SponsorDirectory((
+            Sponsor(name, tuple(visa_types or ()), approvals or 0, denials or 0, approval_rate(approvals, denials))
+            for name, visa_types, approvals, denials in rows
+        ), self.min_similarity)
+
+    def directory(self) -> SponsorDirectory:
+        """Return the loaded directory, reloading it if the table changed."""
+        directory = self._directory
+        if directory is not None and time.monotonic() - self._checked_at <= self.refresh_seconds:
+            return directory
+        with self._lock:
+            if self._directory is None or time.monotonic() - self._checked_at > self.refresh_seconds:
+                version = tuple(self._current_version())
+                if self._directory is None or version != self._version:
+                    self._directory = self._load()
+                    self._version = version
+                self._checked_at = time.monotonic()
+            return self._directory
+
+    def clear(self) -> None:
+        """Drop the loaded copy; the next lookup reloads it."""
+        with self._lock:
+            self._directory = None
+            self._version = None
+
+    def lookup(self, company: Optional[str]) -> Optional[Sponsor]:
+        """Sponsorship history for a company name as written on a posting."""
+        if not company:
+            return None
+        return self.directory().resolve(company)
+
+    def lookup_many(self, companies: Iterable[Optional[str]]) -> List[Optional[Sponsor]]:
+        """Resolve many names against one snapshot of the directory."""
+        directory = self.directory()
+        return [directory.resolve(company) if company else None for company in companies]
@@ -0,0 +1,125 @@
+"""Tests for /api/analyze-compatibility/batch."""
+import json
+import os
+import unittest
+from unittest.mock import patch
+
+# The app module reads these at import time
+os.environ.setdefault('FLASK_ENV', 'testing')
+os.environ.setdefault('GOOGLE_API_KEY', 'test-key')
+
+import app as app_module
+from models import db
+from models.resume_version import ResumeVersion
+from models.user import User
+from services.resume_service import ResumeTailoringService
+
+RESUMES = {
+    'Backend': 'Python, SQL, Docker and AWS',
+    'Frontend': 'React, TypeScript and Figma',
+}
+
+JOBS = [
+    'Backend engineer: Python, SQL and Kubernetes',
+    'Frontend engineer with React and TypeScript',
+    'Office manager',
+]
+
+
+class TestBatchCompatibility(unittest.TestCase):
+    """Test cases for the batch compatibility endpoint."""
+
+    def setUp(self):
+        """Set up a logged-in client with two resume versions."""
+        self.app = app_module.app
+        with self.app.app_context():
+            db.create_all()
+            user = User(email='batch@example.com')
+            user.set_password('testpassword')
+            db.session.add(user)
+            db.session.commit()
+            for name, content in RESUMES.items():
+                db.session.add(ResumeVersion(user_id=user.id, name=name, latex_content=content))
+            db.session.commit()
+            self.version_ids = [version.id for version in ResumeVersion.query.order_by(ResumeVersion.id)]
+
+        self.client = self.app.test_client()
+        self.client.post('/login', data={'email': 'batch@example.com', 'password': 'testpassword'})
+
+    def tearDown(self):
+        """Tear down the database."""
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def test_matrix_matches_single_analysis(self):
+        """Test that every cell equals the score of the single-pair analysis."""
+        response = self.client.post('/api/analyze-compatibility/batch', json={'job_descriptions': JOBS})
+
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertEqual([v['id'] for v in data['versions']], self.version_ids)
+        service = ResumeTailoringService()
+        for job, row in zip(JOBS, data['jobs']):
+            expected = [service.analyze_compatibility(content, job).score for content in RESUMES.values()]
+            for score, want in zip(row['scores'], expected):
+                self.assertAlmostEqual(score, want, places=4)
+        self.assertEqual([job['best_version_id'] for job in data['jobs']],
+                         [self.version_ids[0], self.version_ids[1], None])
+
+    def test_ndjson_stream(self):
+        """Test the streamed form: a header line, then one line per job in order."""
+        response = self.client.post(
+            '/api/analyze-compatibility/batch',
+            json={'job_descriptions': [{'id': 'li-1', 'text': JOBS[0]}, JOBS[1]],
+                  'resume_version_ids': [self.version_ids[1]], 'resume_content': 'Kubernetes'},
+            headers={'Accept': 'application/x-ndjson'}
+        )
+
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+        lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        self.assertEqual(lines[0]['versions'], [{'id': self.version_ids[1], 'name': 'Frontend'},
+                                                {'id': None, 'name': 'resume_content'}])
+        self.assertEqual([(line['index'], line['id']) for line in lines[1:]], [(0, 'li-1'), (1, None)])
+        self.assertEqual(lines[1]['scores'], [0.0, round(1 / 3, 4)])
+        self.assertEqual(lines[2]['scores'], [1.0, 0.0])
+
+    def test_validation(self):
+        """Test malformed requests and versions the user does not own."""
+        url = '/api/analyze-compatibility/batch'
+        self.assertEqual(self.client.post(url, json={}).status_code, 400)
+        self.assertEqual(self.client.post(url, json={'job_descriptions': 'Python'}).status_code, 400)
+        self.assertEqual(self.client.post(url, json={'job_descriptions': [3]}).status_code, 400)
+        self.assertEqual(self.client.post(url, json={
+            'job_descriptions': JOBS, 'resume_version_ids': [self.version_ids[1] + 1]}).status_code, 404)
+
+        too_many = ['Python'] * (self.app.config['BATCH_COMPATIBILITY_MAX_JOBS'] + 1)
+        self.assertEqual(self.client.post(url, json={'job_descriptions': too_many}).status_code, 400)
+
+    def test_malformed_fields(self):
+        """Test that bodies of the wrong shape are rejected rather than failing the request."""
+        url = '/api/analyze-compatibility/batch'
+        for body in (
+            [JOBS[0]],
+            {'job_descriptions': JOBS, 'resume_version_ids': [[self.version_ids[0]]]},
+            {'job_descriptions': JOBS, 'resume_version_ids': [str(self.version_ids[0])]},
+            {'job_descriptions': JOBS, 'resume_version_ids': [True]},
+            {'job_descriptions': JOBS, 'resume_content': 5},
+            {'job_descriptions': JOBS, 'resume_content': ['a']},
+        ):
+            with self.subTest(body=body):
+                self.assertEqual(self.client.post(url, json=body).status_code, 400)
+
+    def test_commits_only_refreshed_fingerprints(self):
+        """Test that a request commits only when it had to compute fingerprints."""
+        url = '/api/analyze-compatibility/batch'
+        self.assertEqual(self.client.post(url, json={'job_descriptions': JOBS}).status_code, 200)
+
+        with patch.object(db.session, 'commit') as commit:
+            self.assertEqual(self.client.post(url, json={'job_descriptions': JOBS}).status_code, 200)
+
+        commit.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
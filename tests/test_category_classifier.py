@@ -0,0 +1,63 @@
+"""Unit tests for the job category classifier."""
+import unittest
+from unittest.mock import patch
+
+from services.category_classifier import CategoryClassifier
+
+KEYWORDS = {
+    'Engineering': ['python', 'docker', 'api', 'database'],
+    'Data Science': ['python', 'r', 'statistics', 'tableau'],
+    'Design': ['figma', 'wireframes'],
+}
+
+RULES = (
+    ('Engineering', ('software engineer', 'developer')),
+    ('Design', ('designer',)),
+)
+
+
+class TestCategoryClassifier(unittest.TestCase):
+    """Test cases for CategoryClassifier."""
+
+    def setUp(self):
+        """Set up a classifier over a small vocabulary."""
+        self.classifier = CategoryClassifier(KEYWORDS, RULES, max_entries=2)
+
+    def test_rules_in_priority_order(self):
+        """Test that the earliest rule with a role term present wins."""
+        self.assertEqual(self.classifier.classify('Designer and developer, Figma and wireframes'), 'Engineering')
+        self.assertEqual(self.classifier.classify('Product designer'), 'Design')
+        self.assertEqual(self.classifier.classify('We hire Developers'), 'Engineering')
+
+    def test_keyword_counts(self):
+        """Test that the category with the most distinct keywords wins, ties to the earlier one."""
+        self.assertEqual(self.classifier.classify('Python, R and statistics in Tableau'), 'Data Science')
+        self.assertEqual(self.classifier.classify('Python and Python only'), 'Engineering')
+        self.assertEqual(self.classifier.classify('APIs and databases'), 'Engineering')
+        self.assertEqual(self.classifier.classify('Sales representative'), 'Other')
+
+    def test_whole_words_only(self):
+        """Test that keywords do not match inside longer words."""
+        self.assertEqual(self.classifier.classify('Rapid growth, great capital'), 'Other')
+
+    def test_aliases(self):
+        """Test that aliases count as the keyword or role term they spell."""
+        aliases = {'stats': 'statistics', 'dev': 'developer', 'k8s': 'kubernetes'}
+        classifier = CategoryClassifier(KEYWORDS, RULES, aliases=aliases)
+        
+        self.assertEqual(classifier.classify('Python, R and stats'), 'Data Science')
+        self.assertEqual(classifier.classify('Figma dev'), 'Engineering')
+        self.assertEqual(classifier.classify('K8s'), 'Other')
+    
+    def test_memoized_by_description(self):
+        """Test that repeated descriptions are scanned once and the cache is bounded."""
+        with patch.object(self.classifier, '_classify', wraps=self.classifier._classify) as scan:
+            categories = self.classifier.classify_many(['Figma', 'Docker', 'Figma', None])
+            self.assertEqual(categories, ['Design', 'Engineering', 'Design', 'Other'])
+            self.assertEqual(scan.call_count, 3)
+
+        self.assertEqual(len(self.classifier._cache), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+"""Tests for corpus document frequencies and IDF-weighted scoring."""
+import unittest
+
+from database import create_app
+from models import db
+from models.corpus_term_statistic import CorpusTermStatistic
+from services.corpus_statistics import (CorpusStatistics, CorpusStatisticsStore, bm25_idf, fingerprint_deltas,
+                                        rebuild_document_frequencies)
+from services.job_ingest_service import JobPostingIngester
+from services.keyword_matcher import KeywordMatcher
+from services.resume_service import ResumeTailoringService
+from services.taxonomy import skill_taxonomy
+
+
+class TestCorpusStatistics(unittest.TestCase):
+    """Test cases for IDF weights and scores."""
+
+    def setUp(self):
+        """Set up statistics where git is common and kubernetes is rare."""
+        self.matcher = KeywordMatcher(['git', 'kubernetes', 'python'])
+        self.statistics = CorpusStatistics(self.matcher, 100, {'git': 90, 'kubernetes': 5, 'python': 50})
+
+    def test_idf(self):
+        """Test that IDF falls with document frequency and stays positive."""
+        self.assertGreater(bm25_idf(5, 100), bm25_idf(50, 100))
+        self.assertGreater(bm25_idf(100, 100), 0)
+        self.assertEqual(self.statistics.idf[self.matcher.vocabulary.index('kubernetes')], bm25_idf(5, 100))
+
+    def test_rare_skills_weigh_more(self):
+        """Test that matching the rare skill scores higher than matching the common one."""
+        job = self.matcher.encode(['git', 'kubernetes'])
+        rare = self.statistics.score(self.matcher.encode(['kubernetes']), job)
+        common = self.statistics.score(self.matcher.encode(['git']), job)
+
+        self.assertGreater(rare, 0.5)
+        self.assertAlmostEqual(rare + common, 1.0)
+        self.assertEqual(self.statistics.score(job, job), 1.0)
+        self.assertEqual(self.statistics.score(job, 0), 0.0)
+
+    def test_fingerprint_deltas(self):
+        """Test that replaced fingerprints count each term once per posting."""
+        deltas = fingerprint_deltas([['go', 'sql'], None], [['go', 'rust', 'rust'], ['sql']])
+
+        self.assertEqual(deltas, {'rust': 1})
+
+
+class TestCorpusStatisticsDatabase(unittest.TestCase):
+    """Database tests for maintaining document frequencies on ingest."""
+
+    def setUp(self):
+        """Set up an in-memory database."""
+        self.app = create_app('testing')
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+        self.ingester = JobPostingIngester(chunk_size=2, default_source='feed')
+
+    def tearDown(self):
+        """Tear down the database."""
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def frequencies(self):
+        return {row.term: row.document_frequency for row in CorpusTermStatistic.query if row.document_frequency}
+
+    def posting(self, external_id, description):
+        return {'title': 'Engineer', 'company': 'Acme', 'external_id': external_id, 'description': description}
+
+    def test_ingest_updates_frequencies(self):
+        """Test that ingest adds new postings' terms and swaps those of re-ingested ones."""
+        self.ingester.ingest_records([
+            self.posting('1', 'Python and Git'), self.posting('2', 'Git and Kubernetes'), self.posting('3', 'Git'),
+        ])
+        self.assertEqual(self.frequencies(), {'git': 3, 'python': 1, 'kubernetes': 1})
+
+        self.ingester.ingest_records([self.posting('1', 'Python and Go'), self.posting('4', 'Go')])
+
+        self.assertEqual(self.frequencies(), {'git': 2, 'python': 1, 'kubernetes': 1, 'go': 2})
+        rebuild_document_frequencies()
+        self.assertEqual(self.frequencies(), {'git': 2, 'python': 1, 'kubernetes': 1, 'go': 2})
+
+    def test_weighted_compatibility(self):
+        """Test that the weighted score favors the resume with the rarer skill."""
+        self.ingester.ingest_records([self.posting(str(i), 'Git and Python') for i in range(8)]
+                                     + [self.posting('k8s', 'Kubernetes')])
+        statistics = CorpusStatisticsStore().statistics()
+        service = ResumeTailoringService()
+        job = 'Git and Kubernetes'
+
+        rare = service.analyze_compatibility('Kubernetes', job, statistics)
+        common = service.analyze_compatibility('Git', job, statistics)
+
+        self.assertEqual(rare.score, common.score)
+        self.assertGreater(rare.weighted_score, common.weighted_score)
+        self.assertIsNone(service.analyze_compatibility('Git', job).weighted_score)
+
+    def test_store_reloads(self):
+        """Test that the store serves one snapshot until cleared or the taxonomy changes."""
+        store = CorpusStatisticsStore(refresh_seconds=3600)
+        first = store.statistics()
+        self.ingester.ingest_records([self.posting('1', 'Git')])
+
+        self.assertIs(store.statistics(), first)
+        store.clear()
+        self.assertEqual(store.statistics().documents, 1)
+        self.assertIs(store.statistics().matcher, skill_taxonomy.current().matcher)
+
+
+if __name__ == '__main__':
+    unittest.main()
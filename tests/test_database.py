@@ -0,0 +1,78 @@
+"""Tests for engine configuration in database.py."""
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from sqlalchemy import create_engine, text
+
+from config import Config
+from database import configure_sqlite, engine_options, sqlite_pragmas
+
+
+class TestEngineOptions(unittest.TestCase):
+    """Test cases for engine_options."""
+
+    def test_postgresql_pool(self):
+        """Test that server databases get a tuned, pre-pinged pool."""
+        options = engine_options(dict(vars(Config), SQLALCHEMY_DATABASE_URI='postgresql://u:p@db/app'))
+
+        self.assertEqual(options['pool_size'], Config.DATABASE_POOL_SIZE)
+        self.assertEqual(options['max_overflow'], Config.DATABASE_MAX_OVERFLOW)
+        self.assertEqual(options['pool_recycle'], Config.DATABASE_POOL_RECYCLE)
+        self.assertTrue(options['pool_pre_ping'])
+
+    def test_sqlite_keeps_defaults(self):
+        """Test that SQLite gets no pool options."""
+        self.assertEqual(engine_options(dict(vars(Config), SQLALCHEMY_DATABASE_URI='sqlite:///app.db')), {})
+
+
+class TestSqlitePragmas(unittest.TestCase):
+    """Test cases for the SQLite connect hook on a file database."""
+
+    def setUp(self):
+        """Set up a tuned engine on a temporary database file."""
+        self.directory = tempfile.mkdtemp()
+        self.engine = create_engine(f"sqlite:///{os.path.join(self.directory, 'app.db')}")
+        configure_sqlite(self.engine, sqlite_pragmas(vars(Config)))
+
+    def tearDown(self):
+        """Remove the database file."""
+        self.engine.dispose()
+        shutil.rmtree(self.directory)
+
+    def test_pragmas_applied(self):
+        """Test that every connection runs in WAL mode with the configured settings."""
+        with self.engine.connect() as connection:
+            self.assertEqual(connection.execute(text('PRAGMA journal_mode')).scalar(), 'wal')
+            self.assertEqual(connection.execute(text('PRAGMA synchronous')).scalar(), 1)  # NORMAL
+            self.assertEqual(connection.execute(text('PRAGMA busy_timeout')).scalar(), Config.SQLITE_BUSY_TIMEOUT)
+
+    def test_concurrent_writers(self):
+        """Test that concurrent writers wait for the lock instead of failing."""
+        with self.engine.begin() as connection:
+            connection.execute(text('CREATE TABLE events (id INTEGER PRIMARY KEY, worker INTEGER)'))
+        errors = []
+
+        def write(worker):
+            try:
+                for _ in range(25):
+                    with self.engine.begin() as connection:
+                        connection.execute(text('INSERT INTO events (worker) VALUES (:w)'), {'w': worker})
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=write, args=(worker,)) for worker in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        with self.engine.connect() as connection:
+            self.assertEqual(connection.execute(text('SELECT COUNT(*) FROM events')).scalar(), 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+"""Tests for the H-1B disclosure importer."""
+import csv
+import os
+import shutil
+import tempfile
+import unittest
+
+from database import create_app
+from models import db
+from models.h1b_employer_year import H1BEmployerYear
+from models.visa_sponsorship_data import VisaSponsorshipData
+from services.h1b_import_service import DisclosureColumns, H1BImporter, InvalidDisclosureFile
+
+HUB_HEADER = ['Fiscal Year', 'Employer', 'Initial Approval', 'Initial Denial',
+              'Continuing Approval', 'Continuing Denial', 'State']
+
+
+class TestDisclosureColumns(unittest.TestCase):
+    """Test cases for header detection and row parsing."""
+
+    def test_employer_hub_row(self):
+        """Test that every approval and denial column is summed."""
+        columns = DisclosureColumns(HUB_HEADER)
+        row = dict(zip(HUB_HEADER, ['2023', 'Google LLC', '1,200', '30', '800', '', 'CA']))
+
+        self.assertEqual(columns.parse(row), ('Google LLC', 2023, 2000, 30))
+
+    def test_lca_case_rows(self):
+        """Test that case files count one decision per row."""
+        columns = DisclosureColumns(['CASE_STATUS', 'EMPLOYER_NAME'], fiscal_year=2024)
+
+        self.assertEqual(columns.parse({'CASE_STATUS': 'Certified', 'EMPLOYER_NAME': 'Acme'}), ('Acme', 2024, 1, 0))
+        self.assertEqual(columns.parse({'CASE_STATUS': 'Denied', 'EMPLOYER_NAME': 'Acme'}), ('Acme', 2024, 0, 1))
+        self.assertIsNone(columns.parse({'CASE_STATUS': 'Withdrawn', 'EMPLOYER_NAME': 'Acme'}))
+
+    def test_missing_columns(self):
+        """Test that unusable headers are rejected up front."""
+        with self.assertRaises(InvalidDisclosureFile):
+            DisclosureColumns(['Company', 'Initial Approval', 'Fiscal Year'])
+        with self.assertRaises(InvalidDisclosureFile):
+            DisclosureColumns(['Employer', 'Initial Approval'])
+
+
+class TestH1BImporter(unittest.TestCase):
+    """Database tests for importing disclosure files."""
+
+    def setUp(self):
+        """Set up an in-memory database seeded with one company."""
+        self.app = create_app('testing')
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+        db.session.add(VisaSponsorshipData(company_name='Google', visa_types_sponsored=['L1'],
+                                           h1b_approvals=1, h1b_denials=1))
+        db.session.commit()
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Tear down the database and files."""
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+        shutil.rmtree(self.directory)
+
+    def write_csv(self, name, rows):
+        path = os.path.join(self.directory, name)
+        with open(path, 'w', newline='', encoding='utf-8-sig') as stream:
+            writer = csv.writer(stream)
+            writer.writerow(HUB_HEADER)
+            writer.writerows(rows)
+        return path
+
+    def company(self, name):
+        return VisaSponsorshipData.query.filter_by(company_name=name).one()
+
+    def test_aggregates_per_normalized_employer(self):
+        """Test that spellings of one employer are summed into the existing company."""
+        path = self.write_csv('fy2023.csv', [
+            [2023, 'GOOGLE LLC', 10, 1, 5, 0, 'CA'],
+            [2023, 'Google, Inc.', 3, 0, 2, 1, 'NY'],
+            [2023, 'Initech', 0, 2, 0, 0, 'TX'],
+            [2023, '', 4, 0, 0, 0, 'TX'],
+        ])
+
+        stats = H1BImporter(flush_every=1).import_file(path)
+
+        google = self.company('Google')
+        self.assertEqual((google.h1b_approvals, google.h1b_denials), (20, 2))
+        self.assertEqual(google.visa_types_sponsored, ['L1', 'H1B'])
+        initech = self.company('Initech')
+        self.assertEqual((initech.h1b_approvals, initech.h1b_denials), (0, 2))
+        self.assertEqual(initech.visa_types_sponsored, [])
+        self.assertEqual((stats.rows_read, stats.rows_skipped, stats.employers_updated), (4, 1, 2))
+        self.assertEqual(VisaSponsorshipData.query.count(), 2)
+
+    def test_yearly_reload(self):
+        """Test that a new year adds to totals and reloading a year replaces it."""
+        H1BImporter().import_file(self.write_csv('fy2022.csv', [[2022, 'Google LLC', 10, 0, 0, 0, 'CA']]))
+        H1BImporter().import_file(self.write_csv('fy2023.csv', [
+            [2023, 'Google LLC', 5, 1, 0, 0, 'CA'],
+            [2023, 'Initech', 1, 0, 0, 0, 'TX'],
+        ]))
+        self.assertEqual(self.company('Google').h1b_approvals, 15)
+
+        # A corrected FY2023 file no longer lists Initech
+        H1BImporter().import_file(self.write_csv('fy2023.csv', [[2023, 'Google LLC', 7, 1, 0, 0, 'CA']]))
+
+        self.assertEqual((self.company('Google').h1b_approvals, self.company('Google').h1b_denials), (17, 1))
+        self.assertEqual(self.company('Initech').h1b_approvals, 0)
+        self.assertEqual(H1BEmployerYear.query.count(), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
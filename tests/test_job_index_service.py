@@ -0,0 +1,194 @@
+"""Tests for the job posting keyword index."""
+import os
+import unittest
+
+# The app module reads these at import time
+os.environ.setdefault('FLASK_ENV', 'testing')
+os.environ.setdefault('GOOGLE_API_KEY', 'test-key')
+
+import app as app_module
+from database import create_app
+from models import db
+from models.job_posting import JobPosting
+from models.job_posting_keyword import JobPostingKeyword
+from models.resume_version import ResumeVersion
+from models.user import User
+from models.visa_sponsorship_data import VisaSponsorshipData
+from services.job_index_service import JobKeywordIndex, KeywordBitmaps, bitmap
+from services.job_ingest_service import JobPostingIngester
+
+
+POSTINGS = [
+    {'title': 'Backend Engineer', 'company': 'Acme', 'external_id': '1',
+     'description': 'Python, SQL and AWS', 'visa_sponsorship': True},
+    {'title': 'Data Engineer', 'company': 'Globex', 'external_id': '2',
+     'description': 'Python and SQL', 'visa_sponsorship': False},
+    {'title': 'Frontend Engineer', 'company': 'Acme', 'external_id': '3',
+     'description': 'React and TypeScript', 'visa_sponsorship': True},
+]
+
+
+class TestKeywordBitmaps(unittest.TestCase):
+    """Test the in-memory bitmap ranking."""
+
+    def setUp(self):
+        """Set up bitmaps over a handful of postings."""
+        self.bitmaps = KeywordBitmaps()
+        self.bitmaps.update([
+            {'id': 1, 'keyword_fingerprint': ['python', 'sql', 'aws'], 'visa_sponsorship': True},
+            {'id': 2, 'keyword_fingerprint': ['python', 'sql'], 'visa_sponsorship': False},
+            {'id': 5, 'keyword_fingerprint': ['python', 'sql'], 'visa_sponsorship': True},
+            {'id': 9, 'keyword_fingerprint': ['react'], 'visa_sponsorship': False},
+        ])
+
+    def test_bitmap(self):
+        """Test packing ids into an int bitmap."""
+        self.assertEqual(bitmap([0, 3, 9]), 0b1000001001)
+        self.assertEqual(bitmap([]), 0)
+
+    def test_top_orders_by_overlap_then_newest(self):
+        """Test ranking by overlap with ties going to the highest id."""
+        ranked = self.bitmaps.top(['python', 'sql', 'aws', 'react', 'go'], limit=10)
+
+        self.assertEqual(ranked, [(1, 3), (5, 2), (2, 2), (9, 1)])
+
+    def test_top_respects_limit_and_mask(self):
+        """Test the limit and a filter mask."""
+        self.assertEqual(self.bitmaps.top(['python', 'sql'], limit=2), [(5, 2), (2, 2)])
+        self.assertEqual(self.bitmaps.top(['python'], limit=10, mask=self.bitmaps.sponsored),
+                         [(5, 1), (1, 1)])
+
+    def test_update_replaces_entries(self):
+        """Test that re-indexing a posting drops its old terms."""
+        self.bitmaps.update([{'id': 1, 'keyword_fingerprint': ['go'], 'visa_sponsorship': False}])
+
+        self.assertEqual(self.bitmaps.top(['aws'], limit=10), [])
+        self.assertEqual(self.bitmaps.top(['go'], limit=10), [(1, 1)])
+        self.assertEqual(self.bitmaps.sponsored, bitmap([5]))
+
+
+class TestJobKeywordIndex(unittest.TestCase):
+    """Test cases for JobKeywordIndex."""
+
+    def setUp(self):
+        """Set up an in-memory database with ingested postings."""
+        self.app = create_app('testing')
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+        JobPostingIngester(default_source='feed').ingest_records(POSTINGS)
+        self.index = JobKeywordIndex()
+
+    def tearDown(self):
+        """Tear down the database."""
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def titles(self, results):
+        return [(posting.title, overlap) for posting, overlap in results]
+
+    def test_ingest_updates_index(self):
+        """Test that ingest writes one entry per posting keyword."""
+        self.assertEqual(JobPostingKeyword.query.count(), 7)
+
+        JobPostingIngester(default_source='feed').ingest_records([
+            dict(POSTINGS[0], description='Go only')
+        ])
+
+        backend = JobPosting.query.filter_by(external_id='1').one()
+        terms = [entry.term for entry in JobPostingKeyword.query.filter_by(job_id=backend.id)]
+        self.assertEqual(terms, ['go'])
+
+    def test_search_ranks_by_overlap(self):
+        """Test that postings sharing more terms rank first."""
+        results = self.index.search(['python', 'sql', 'aws', 'react'])
+
+        self.assertEqual(self.titles(results), [
+            ('Backend Engineer', 3), ('Data Engineer', 2), ('Frontend Engineer', 1)
+        ])
+
+    def test_search_filters(self):
+        """Test filtering by visa sponsorship and company."""
+        sponsored = self.index.search(['python', 'react'], visa_sponsorship=True)
+        globex = self.index.search(['python', 'react'], company='Globex')
+
+        self.assertEqual({posting.title for posting, _ in sponsored},
+                         {'Backend Engineer', 'Frontend Engineer'})
+        self.assertEqual(self.titles(globex), [('Data Engineer', 1)])
+
+    def test_ingest_updates_loaded_index(self):
+        """Test that postings ingested in-process are searchable without a reload."""
+        self.index.search(['python'])
+
+        JobPostingIngester(default_source='feed', keyword_index=self.index).ingest_records([
+            {'title': 'Go Engineer', 'company': 'Initech', 'external_id': '4', 'description': 'Go'}
+        ])
+
+        self.assertEqual(self.titles(self.index.search(['go'])), [('Go Engineer', 1)])
+
+    def test_search_limit_and_empty_terms(self):
+        """Test the result limit and an empty query."""
+        self.assertEqual(len(self.index.search(['python'], limit=1)), 1)
+        self.assertEqual(self.index.search([]), [])
+
+    def test_rebuild(self):
+        """Test that a rebuild reproduces the incremental index."""
+        before = sorted((entry.term, entry.job_id) for entry in JobPostingKeyword.query)
+
+        self.assertEqual(self.index.rebuild(), len(before))
+        after = sorted((entry.term, entry.job_id) for entry in JobPostingKeyword.query)
+        self.assertEqual(after, before)
+
+
+class TestMatchingJobPostingsEndpoint(unittest.TestCase):
+    """Test cases for /api/resume-versions/<id>/job-postings."""
+
+    def setUp(self):
+        """Set up a logged-in client with one resume version."""
+        self.app = app_module.app
+        with self.app.app_context():
+            db.create_all()
+            JobPostingIngester(default_source='feed').ingest_records(POSTINGS)
+            user = User(email='index@example.com')
+            user.set_password('testpassword')
+            db.session.add(user)
+            db.session.commit()
+            version = ResumeVersion(user_id=user.id, name='Backend', latex_content='Python and AWS')
+            db.session.add(version)
+            db.session.add(VisaSponsorshipData(company_name='ACME Inc.', visa_types_sponsored=['H1B'],
+                                               h1b_approvals=9, h1b_denials=1))
+            db.session.commit()
+            self.version_id = version.id
+        app_module.job_keyword_index.clear()
+        app_module.visa_sponsorship_lookup.clear()
+
+        self.client = self.app.test_client()
+        self.client.post('/login', data={'email': 'index@example.com', 'password': 'testpassword'})
+
+    def tearDown(self):
+        """Tear down the database."""
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def test_returns_ranked_postings(self):
+        """Test that the endpoint ranks postings for the version's keywords."""
+        response = self.client.get(f'/api/resume-versions/{self.version_id}/job-postings?visa_sponsorship=true')
+
+        self.assertEqual(response.status_code, 200)
+        postings = response.get_json()['job_postings']
+        self.assertEqual([(p['title'], p['matched_count']) for p in postings],
+                         [('Backend Engineer', 2)])
+        self.assertEqual(postings[0]['sponsor']['company_name'], 'ACME Inc.')
+        self.assertEqual(postings[0]['sponsor']['h1b_approval_rate'], 90.0)
+
+    def test_other_users_version_is_not_found(self):
+        """Test that versions of other users are not exposed."""
+        response = self.client.get(f'/api/resume-versions/{self.version_id + 1}/job-postings')
+
+        self.assertEqual(response.status_code, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+"""Unit tests for job posting feed ingestion."""
+import io
+import json
+import os
+import tempfile
+import unittest
+from database import create_app
+from models import db
+from models.job_posting import JobPosting
+from services.job_ingest_service import (
+    InvalidPosting, JobPostingIngester, detect_format, iter_csv, iter_jsonl, normalize_record
+)
+
+
+class TestNormalizeRecord(unittest.TestCase):
+    """Test conversion of feed records to rows."""
+
+    def test_extracts_keywords(self):
+        """Test that the keyword fingerprint covers description and requirements."""
+        row = normalize_record({
+            'title': 'Engineer', 'company': 'Acme', 'source': 'feed', 'external_id': 7,
+            'description': 'Python and AWS', 'requirements': ['Docker']
+        })
+
+        self.assertEqual(row['external_id'], '7')
+        self.assertEqual(row['keyword_fingerprint'], ['aws', 'docker', 'python'])
+        self.assertEqual(row['requirements'], ['Docker'])
+
+    def test_missing_requirements_use_keywords(self):
+        """Test that feeds without requirements get the extracted keywords."""
+        row = normalize_record({
+            'title': 'Engineer', 'company': 'Acme', 'external_id': '1',
+            'description': 'React and SQL'
+        }, default_source='feed')
+
+        self.assertEqual(row['source'], 'feed')
+        self.assertEqual(row['requirements'], ['react', 'sql'])
+
+    def test_csv_values(self):
+        """Test parsing of CSV cell strings."""
+        record = next(iter_csv(io.StringIO(
+            'title,company,source,external_id,visa_sponsorship,visa_types,salary_min,posted_date\n'
+            'Engineer,Acme,feed,1,yes,H1B; O1,120000,2024-05-01T00:00:00Z\n'
+        )))
+        row = normalize_record(record)
+
+        self.assertTrue(row['visa_sponsorship'])
+        self.assertEqual(row['visa_types'], ['H1B', 'O1'])
+        self.assertEqual(row['salary_min'], 120000)
+        self.assertEqual(row['posted_date'].year, 2024)
+
+    def test_invalid_records(self):
+        """Test that records without identity or bad values are rejected."""
+        with self.assertRaises(InvalidPosting):
+            normalize_record({'title': 'Engineer', 'company': 'Acme', 'source': 'feed'})
+        with self.assertRaises(InvalidPosting):
+            normalize_record({'title': 'Engineer', 'company': 'Acme', 'source': 'feed',
+                              'external_id': '1', 'salary_min': 'lots'})
+        with self.assertRaises(InvalidPosting):
+            normalize_record(None)
+
+    def test_detect_format(self):
+        """Test feed format detection from file names."""
+        self.assertEqual(detect_format('feed.jsonl'), 'jsonl')
+        self.assertEqual(detect_format('feed.CSV'), 'csv')
+        with self.assertRaises(ValueError):
+            detect_format('feed.xml')
+
+
+class TestJobPostingIngester(unittest.TestCase):
+    """Database tests for chunked upserts."""
+
+    def setUp(self):
+        """Set up an in-memory database."""
+        self.app = create_app('testing')
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+        self.ingester = JobPostingIngester(chunk_size=2, default_source='feed')
+
+    def tearDown(self):
+        """Tear down the database."""
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def posting(self, external_id, title='Engineer', **fields):
+        return dict(title=title, company='Acme', external_id=external_id, **fields)
+
+    def test_ingest_and_dedupe(self):
+        """Test that repeated ids in a feed collapse to one posting."""
+        stats = self.ingester.ingest_records([
+            self.posting('1'), self.posting('2'), self.posting('2', title='Senior Engineer'),
+            self.posting('3'), {'title': 'No id', 'company': 'Acme'}
+        ])
+
+        self.assertEqual(stats.rows_read, 5)
+        self.assertEqual(stats.rows_skipped, 1)
+        self.assertEqual(stats.chunks, 3)
+        self.assertEqual(JobPosting.query.count(), 3)
+        self.assertEqual(JobPosting.query.filter_by(external_id='2').one().title, 'Senior Engineer')
+
+    def test_reingest_updates_in_place(self):
+        """Test that re-ingesting a posting refreshes it without a new row."""
+        self.ingester.ingest_records([self.posting('1', description='Python')])
+        original_id = JobPosting.query.one().id
+
+        self.ingester.ingest_records([self.posting('1', description='Go and Rust')])
+
+        posting = JobPosting.query.one()
+        self.assertEqual(posting.id, original_id)
+        self.assertEqual(posting.keyword_fingerprint, ['go', 'rust'])
+
+    def test_same_id_from_different_sources(self):
+        """Test that external ids are only unique within a source."""
+        self.ingester.ingest_records([self.posting('1'), self.posting('1', source='other')])
+
+        self.assertEqual(JobPosting.query.count(), 2)
+
+    def test_ingest_file(self):
+        """Test streaming a JSONL feed file."""
+        with tempfile.NamedTemporaryFile('w', suffix='.jsonl', delete=False) as f:
+            # Id 0 is a valid external id, not a missing one
+            for external_id in range(5):
+                f.write(json.dumps(self.posting(external_id)) + '\n')
+            f.write('\n')
+        try:
+            stats = self.ingester.ingest_file(f.name)
+        finally:
+            os.remove(f.name)
+
+        self.assertEqual(stats.rows_written, 5)
+        self.assertEqual(JobPosting.query.count(), 5)
+        snapshot = stats.snapshot()
+        self.assertIn('rows_per_second', snapshot)
+        self.assertGreater(snapshot['peak_memory_mb'], 0)
+
+    def test_corrupt_line_is_skipped(self):
+        """Test that a malformed JSONL line mid-feed is skipped and the rest is ingested."""
+        feed = io.StringIO('\n'.join([
+            json.dumps(self.posting('1')), '{"title": "Engineer", "company":', json.dumps(self.posting('2')),
+            '[]', json.dumps(self.posting('3')),
+        ]))
+
+        stats = self.ingester.ingest_records(iter_jsonl(feed))
+
+        self.assertEqual(stats.rows_read, 5)
+        self.assertEqual(stats.rows_skipped, 2)
+        self.assertEqual(stats.rows_written, 3)
+        self.assertEqual(JobPosting.query.count(), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+"""Unit tests for the batch job matching service."""
+import unittest
+from database import create_app
+from models import db
+from models.job_match import JobMatch
+from models.job_posting import JobPosting
+from models.resume_version import ResumeVersion
+from models.user import User
+from services.job_matching_service import JobMatchingService
+
+
+class TestTopK(unittest.TestCase):
+    """Test the vectorized scoring without a database."""
+
+    def setUp(self):
+        """Set up a small vocabulary."""
+        self.service = JobMatchingService(['aws', 'docker', 'python', 'react', 'sql'])
+
+    def test_build_matrix_ignores_unknown_terms(self):
+        """Test that only vocabulary terms become matrix entries."""
+        matrix = self.service.build_matrix([{'python', 'cobol'}, set()])
+
+        self.assertEqual(matrix.shape, (2, 5))
+        self.assertEqual(matrix.nnz, 1)
+
+    def test_scores_match_analyze_compatibility(self):
+        """Test that a score is the fraction of job keywords the user has."""
+        users = self.service.build_matrix([{'python', 'sql'}])
+        postings = self.service.build_matrix([{'python', 'sql', 'aws', 'docker'}])
+
+        matches = list(self.service.top_k(users, postings, k=5))
+
+        self.assertEqual(matches, [(0, 0, 0.5)])
+
+    def test_keeps_best_k_per_user(self):
+        """Test that only the k best postings are kept for each user."""
+        users = self.service.build_matrix([{'python', 'react'}, {'aws'}])
+        postings = self.service.build_matrix([
+            {'python'}, {'python', 'react'}, {'python', 'aws', 'sql', 'docker'}, {'aws'}
+        ])
+
+        matches = list(self.service.top_k(users, postings, k=2, block_size=1))
+        by_user = {}
+        for user_row, posting_row, score in matches:
+            by_user.setdefault(user_row, {})[posting_row] = score
+
+        self.assertEqual(by_user[0], {0: 1.0, 1: 1.0})
+        self.assertEqual(by_user[1], {3: 1.0, 2: 0.25})
+
+    def test_min_score_filters_weak_matches(self):
+        """Test that matches at or below min_score are dropped."""
+        users = self.service.build_matrix([{'python'}])
+        postings = self.service.build_matrix([{'python'}, {'python', 'aws', 'sql', 'docker'}, {'react'}])
+
+        matches = list(self.service.top_k(users, postings, k=3, min_score=0.25))
+
+        self.assertEqual(matches, [(0, 0, 1.0)])
+
+    def test_matched_keywords(self):
+        """Test the shared keywords recorded as match reasons."""
+        users = self.service.build_matrix([{'python', 'sql', 'react'}])
+        postings = self.service.build_matrix([{'python', 'sql', 'aws'}])
+
+        self.assertEqual(self.service.matched_keywords(users, postings, 0, 0), ['python', 'sql'])
+
+
+class TestMatchPostings(unittest.TestCase):
+    """Database tests for writing JobMatch rows."""
+
+    def setUp(self):
+        """Set up an in-memory database with users, a resume and postings."""
+        self.app = create_app('testing')
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+
+        self.service = JobMatchingService()
+        self.developer = User(email='dev@example.com', skills=['Python', 'Machine Learning'])
+        self.designer = User(email='design@example.com', skills=['Figma'])
+        for user in (self.developer, self.designer):
+            user.set_password('testpassword')
+            db.session.add(user)
+        db.session.commit()
+
+        db.session.add(ResumeVersion(
+            user_id=self.developer.id, name='Engineering', category='Engineering',
+            latex_content='Built services with Docker and AWS'
+        ))
+        self.backend = JobPosting(title='Backend Engineer', company='Acme',
+                                  description='Python services on AWS', requirements=['Docker'])
+        self.design = JobPosting(title='Product Designer', company='Acme',
+                                 description='Prototype in Figma and Sketch')
+        db.session.add_all([self.backend, self.design])
+        db.session.commit()
+
+    def tearDown(self):
+        """Tear down the database."""
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def test_writes_top_matches(self):
+        """Test that matches combine profile skills and resume keywords."""
+        written = self.service.match_postings([self.backend.id, self.design.id])
+
+        self.assertEqual(written, 2)
+        developer_match = JobMatch.query.filter_by(user_id=self.developer.id).one()
+        self.assertEqual(developer_match.job_id, self.backend.id)
+        self.assertEqual(developer_match.compatibility_score, 1.0)
+        self.assertEqual(developer_match.match_reasons, ['aws', 'docker', 'python'])
+        designer_match = JobMatch.query.filter_by(user_id=self.designer.id).one()
+        self.assertEqual(designer_match.job_id, self.design.id)
+        self.assertEqual(designer_match.compatibility_score, 0.5)
+
+    def test_rematching_replaces_existing_rows(self):
+        """Test that scoring a posting twice does not duplicate matches."""
+        self.service.match_postings([self.backend.id])
+        self.service.match_postings([self.backend.id])
+
+        self.assertEqual(JobMatch.query.filter_by(job_id=self.backend.id).count(), 1)
+
+    def test_unmatched_job_ids(self):
+        """Test that postings with matches are not rescored by default."""
+        self.service.match_postings([self.backend.id])
+
+        self.assertEqual(self.service.unmatched_job_ids(), [self.design.id])
+
+
+if __name__ == '__main__':
+    unittest.main()
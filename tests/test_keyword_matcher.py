@@ -0,0 +1,85 @@
+"""Unit tests for the compiled keyword matcher."""
+import unittest
+from services.keyword_matcher import KeywordMatcher
+
+
+class TestKeywordMatcher(unittest.TestCase):
+    """Test cases for KeywordMatcher."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.matcher = KeywordMatcher([
+            'go', 'r', 'java', 'javascript', 'c++', 'c#', 'node.js', 'ci/cd',
+            'machine learning', 'learning', 'full-stack', 'test driven development'
+        ])
+    
+    def test_word_boundaries(self):
+        """Test that terms only match whole tokens."""
+        found = self.matcher.find("Worked at Google on JavaScript and Rust")
+        
+        self.assertIn('javascript', found)
+        self.assertNotIn('go', found)
+        self.assertNotIn('java', found)
+        self.assertNotIn('r', found)
+    
+    def test_single_letter_terms(self):
+        """Test that single-letter terms match as standalone words."""
+        self.assertIn('r', self.matcher.find("Statistics in R, SQL and Python"))
+        self.assertIn('go', self.matcher.find("Services written in Go."))
+    
+    def test_punctuated_terms(self):
+        """Test terms containing punctuation, including LaTeX-escaped forms."""
+        found = self.matcher.find(r"C++, C\# and Node.js with CI/CD pipelines")
+        
+        self.assertEqual(found, {'c++', 'c#', 'node.js', 'ci/cd'})
+    
+    def test_multi_word_and_overlapping_terms(self):
+        """Test phrases spanning whitespace, hyphens and overlapping suffixes."""
+        found = self.matcher.find("Machine\n  learning and test-driven development")
+        
+        self.assertIn('machine learning', found)
+        self.assertIn('learning', found)
+        self.assertIn('test driven development', found)
+    
+    def test_hyphenated_vocabulary(self):
+        """Test that hyphens and spaces are interchangeable."""
+        self.assertIn('full-stack', self.matcher.find("Full stack engineer"))
+        self.assertIn('full-stack', self.matcher.find("Full-Stack engineer"))
+    
+    def test_count(self):
+        """Test occurrence counting."""
+        counts = self.matcher.count("Go, go and more Go; machine learning")
+        
+        self.assertEqual(counts['go'], 3)
+        self.assertEqual(counts['machine learning'], 1)
+        self.assertEqual(counts['learning'], 1)
+    
+    def test_empty_text(self):
+        """Test matching against empty text."""
+        self.assertEqual(self.matcher.find(""), set())
+    
+    def test_mask_matches_find(self):
+        """Test that bitmasks encode the same terms as find, in vocabulary order."""
+        text = "Machine learning in Go and Java with CI/CD"
+        mask = self.matcher.mask(text)
+        
+        self.assertEqual(mask, self.matcher.encode(self.matcher.find(text)))
+        self.assertEqual(self.matcher.decode(mask), sorted(self.matcher.find(text)))
+        self.assertEqual(self.matcher.encode(['go', 'cobol']), self.matcher.bits['go'])
+        self.assertEqual(self.matcher.mask(""), 0)
+    
+    def test_aliases(self):
+        """Test that aliases are matched as their own tokens and reported as their target."""
+        matcher = KeywordMatcher(['kubernetes', 'postgresql', 'node.js'],
+                                 {'k8s': 'kubernetes', 'postgres': 'postgresql', 'nodejs': 'node.js'})
+        
+        self.assertEqual(matcher.find("K8s, Postgres and NodeJS"), {'kubernetes', 'postgresql', 'node.js'})
+        self.assertEqual(matcher.count("k8s and Kubernetes"), {'kubernetes': 2})
+        self.assertEqual(matcher.vocabulary, ('kubernetes', 'node.js', 'postgresql'))
+        self.assertNotIn('k8s', matcher)
+        with self.assertRaises(ValueError):
+            KeywordMatcher(['go'], {'golang': 'rust'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+"""Golden-file tests for the LaTeX sanitizer."""
+import glob
+import os
+import unittest
+from services.latex_sanitizer import LatexSanitizer, sanitize_latex
+
+
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'golden', 'sanitizer')
+
+
+def read(path):
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
+
+class TestLatexSanitizer(unittest.TestCase):
+    """Test cases for sanitize_latex."""
+    
+    def golden_cases(self):
+        inputs = sorted(glob.glob(os.path.join(GOLDEN_DIR, '*.input.tex')))
+        self.assertTrue(inputs, 'No golden files found')
+        for input_path in inputs:
+            yield os.path.basename(input_path), input_path, input_path.replace('.input.tex', '.expected.tex')
+    
+    def test_golden_files(self):
+        """Test sanitizer output against the checked-in expectations."""
+        for name, input_path, expected_path in self.golden_cases():
+            with self.subTest(name):
+                self.assertEqual(sanitize_latex(read(input_path)), read(expected_path).rstrip('\n'))
+    
+    def test_idempotent(self):
+        """Test that sanitizing sanitized output changes nothing."""
+        for name, _, expected_path in self.golden_cases():
+            with self.subTest(name):
+                expected = read(expected_path).rstrip('\n')
+                self.assertEqual(sanitize_latex(expected), expected)
+    
+    def test_incremental_matches_whole_document(self):
+        """Test that feeding arbitrary chunks gives the same output."""
+        for name, input_path, expected_path in self.golden_cases():
+            text = read(input_path)
+            for chunk_size in (1, 7, 64):
+                with self.subTest(name, chunk_size=chunk_size):
+                    sanitizer = LatexSanitizer()
+                    pieces = [sanitizer.feed(text[i:i + chunk_size]) for i in range(0, len(text), chunk_size)]
+                    pieces.append(sanitizer.close())
+                    self.assertEqual(''.join(pieces), read(expected_path).rstrip('\n'))
+    
+    def test_feed_emits_complete_lines_only(self):
+        """Test that nothing is emitted until a line is complete."""
+        sanitizer = LatexSanitizer()
+        
+        self.assertEqual(sanitizer.feed('R&D team'), '')
+        self.assertEqual(sanitizer.feed(' lead\nnext'), 'R\\&D team lead')
+        self.assertEqual(sanitizer.close(), '\nnext')
+    
+    def test_empty_and_comment_only(self):
+        """Test degenerate documents."""
+        self.assertEqual(sanitize_latex(''), '')
+        self.assertEqual(sanitize_latex('% only a comment\n%another'), '')
+    
+    def test_unclosed_dollar_is_currency(self):
+        """Test that a lone dollar sign is escaped."""
+        self.assertEqual(sanitize_latex('Budget of $ millions'), 'Budget of \\$ millions')
+    
+    def test_percent_in_url_is_not_a_comment(self):
+        """Test that % inside a link target is kept, while later comments are still stripped."""
+        self.assertEqual(sanitize_latex(r'\href{https://x.com/a%20b}{link} and more % note'),
+                         r'\href{https://x.com/a%20b}{link} and more')
+        self.assertEqual(sanitize_latex(r'See \url{https://x.com/{a}%41} 50%'),
+                         r'See \url{https://x.com/{a}%41} 50\%')
+    
+    def test_ampersand_in_url_is_not_escaped(self):
+        """Test that & inside a link target is kept, but escaped in the link text."""
+        self.assertEqual(sanitize_latex(r'\url{https://x.com/?a=1&b=2} & more'),
+                         r'\url{https://x.com/?a=1&b=2} \& more')
+        self.assertEqual(sanitize_latex(r'\href{https://x.com/?a=1&b=2}{Q&A}'),
+                         r'\href{https://x.com/?a=1&b=2}{Q\&A}')
+    
+    def test_url_split_across_feeds(self):
+        """Test that a link argument left open at a chunk boundary is still copied verbatim."""
+        sanitizer = LatexSanitizer()
+        output = sanitizer.feed('\\url{https://x.com/\n') + sanitizer.feed('?a=1&b=2%} tail\n') + sanitizer.close()
+        
+        self.assertEqual(output, '\\url{https://x.com/\n?a=1&b=2%} tail')
+
+
+if __name__ == '__main__':
+    unittest.main()
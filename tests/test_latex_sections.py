@@ -0,0 +1,87 @@
+"""Unit tests for the LaTeX section index."""
+import unittest
+from services.latex_sections import SectionIndex, section_index
+
+
+RESUME = """\\documentclass{article}
+\\begin{document}
+\\section{Summary}
+Backend engineer.
+
+\\section{Experience}
+Acme Corp -- Python services.
+
+\\section*{Projects}
+Gitlytics dashboard.
+
+\\section{Skills}
+Python, SQL
+\\end{document}
+"""
+
+
+class TestSectionIndex(unittest.TestCase):
+    """Test cases for SectionIndex."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.index = SectionIndex(RESUME)
+    
+    def test_names(self):
+        """Test that every section is indexed in order."""
+        self.assertEqual(self.index.names(), ['Summary', 'Experience', 'Projects', 'Skills'])
+    
+    def test_extract(self):
+        """Test extracting sections by case-insensitive name."""
+        self.assertEqual(self.index.extract('experience'), '\\section{Experience}\nAcme Corp -- Python services.')
+        self.assertEqual(self.index.extract('Skills'), '\\section{Skills}\nPython, SQL')
+        self.assertIsNone(self.index.extract('Education'))
+    
+    def test_replace_preserves_surrounding_text(self):
+        """Test that replacement keeps the whitespace between sections."""
+        updated = self.index.replace('Projects', '\\section*{Projects}\nNew project.')
+        
+        self.assertIn('New project.\n\n\\section{Skills}', updated)
+        self.assertEqual(SectionIndex(updated).extract('Summary'), self.index.extract('Summary'))
+    
+    def test_replace_many(self):
+        """Test replacing several sections in one slice pass."""
+        updated = self.index.replace_many({
+            'Skills': '\\section{Skills}\nGo',
+            'Summary': '\\section{Summary}\nStaff engineer.',
+            'Education': '\\section{Education}\nIgnored'
+        })
+        
+        new_index = SectionIndex(updated)
+        self.assertEqual(new_index.extract('Skills'), '\\section{Skills}\nGo')
+        self.assertEqual(new_index.extract('Summary'), '\\section{Summary}\nStaff engineer.')
+        self.assertNotIn('Education', new_index)
+        self.assertTrue(updated.endswith('\\end{document}\n'))
+    
+    def test_replace_with_empty_text_is_noop(self):
+        """Test that an empty replacement leaves the document unchanged."""
+        self.assertEqual(self.index.replace('Projects', None), RESUME)
+    
+    def test_changed_sections_and_diff(self):
+        """Test section-level diffing between two documents."""
+        other = SectionIndex(self.index.replace('Experience', '\\section{Experience}\nAcme Corp -- Go services.'))
+        
+        self.assertEqual(self.index.changed_sections(other), ['Experience'])
+        diff = self.index.diff(other, 'Experience')
+        self.assertIn('-Acme Corp -- Python services.', diff)
+        self.assertIn('+Acme Corp -- Go services.', diff)
+    
+    def test_document_without_sections(self):
+        """Test a document with no sections at all."""
+        index = SectionIndex('Just text')
+        
+        self.assertEqual(index.names(), [])
+        self.assertEqual(index.replace('Projects', 'x'), 'Just text')
+    
+    def test_section_index_is_cached(self):
+        """Test that indexes are reused for identical content."""
+        self.assertIs(section_index(RESUME), section_index(RESUME))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+"""Tests for the Flask-Migrate migrations."""
+import os
+import unittest
+
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from flask_migrate import downgrade, upgrade
+from sqlalchemy import inspect, text
+
+from database import create_app
+from models import db
+
+MIGRATIONS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'migrations')
+
+
+def include_name(name, type_, parent_names):
+    # As in migrations/env.py: the full-text search tables have no models
+    return type_ != 'table' or not name.startswith(('resume_search', 'job_posting_search'))
+
+
+class TestMigrations(unittest.TestCase):
+    """Test cases for upgrading and downgrading an empty database."""
+
+    def setUp(self):
+        """Set up an empty in-memory database."""
+        self.app = create_app('testing')
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+
+    def tearDown(self):
+        """Drop whatever the migrations left behind."""
+        db.session.remove()
+        db.drop_all()
+        with db.engine.begin() as connection:
+            connection.exec_driver_sql('DROP TABLE IF EXISTS alembic_version')
+        self.ctx.pop()
+
+    def test_upgrade_matches_models(self):
+        """Test that the migrations build exactly the schema the models describe."""
+        upgrade(directory=MIGRATIONS)
+
+        with db.engine.connect() as connection:
+            context = MigrationContext.configure(connection, opts={'include_name': include_name})
+            self.assertEqual(compare_metadata(context, db.metadata), [])
+        self.assertIn('resume_search', inspect(db.engine).get_table_names())
+
+    def test_downgrade_to_base(self):
+        """Test that the migrations fully reverse."""
+        upgrade(directory=MIGRATIONS)
+
+        downgrade(directory=MIGRATIONS, revision='base')
+
+        self.assertEqual(inspect(db.engine).get_table_names(), ['alembic_version'])
+
+    def test_downgrade_restores_chunked_bodies(self):
+        """Test that leaving chunk storage copies each body back inline."""
+        upgrade(directory=MIGRATIONS, revision='1e0a636296ca')
+        with db.engine.begin() as connection:
+            connection.execute(text("INSERT INTO users (id, email, password_hash) VALUES (1, 'a@example.com', 'x')"))
+            connection.execute(text("INSERT INTO content_chunks (hash, content) VALUES ('a', 'Hello '), ('b', 'world')"))
+            connection.execute(text("INSERT INTO resume_versions (user_id, name, latex_content, chunk_hashes) "
+                                    "VALUES (1, 'Backend', '', '[\"a\", \"b\"]'), (1, 'Legacy', 'Inline', NULL)"))
+
+        downgrade(directory=MIGRATIONS, revision='d52855f79d90')
+
+        with db.engine.connect() as connection:
+            bodies = connection.execute(text('SELECT latex_content FROM resume_versions ORDER BY id')).scalars()
+            self.assertEqual(list(bodies), ['Hello world', 'Inline'])
+
+    
+    def test_upgrade_merges_dot_com_employer_keys(self):
+        """Test that employers keyed with a trailing 'com' join their plain-name rows."""
+        upgrade(directory=MIGRATIONS, revision='3a9d61c0f2b4')
+        with db.engine.begin() as connection:
+            connection.execute(text(
+                "INSERT INTO h1b_employer_years (employer_key, fiscal_year, employer_name, approvals, denials) "
+                "VALUES ('amazon com', 2023, 'Amazon.com Services LLC', 10, 1), "
+                "('amazon', 2023, 'Amazon', 5, 0), ('amazon com', 2024, 'Amazon.com, Inc.', 7, 2), "
+                "('apple', 2023, 'Apple Inc.', 3, 0)"))
+            connection.execute(text(
+                "INSERT INTO visa_sponsorship_data (company_name, h1b_approvals, h1b_denials) "
+                "VALUES ('Amazon', 5, 0), ('Apple Inc.', 3, 0)"))
+        
+        upgrade(directory=MIGRATIONS)
+        
+        with db.engine.connect() as connection:
+            rows = connection.execute(text(
+                'SELECT employer_key, fiscal_year, approvals, denials FROM h1b_employer_years '
+                'ORDER BY employer_key, fiscal_year')).all()
+            totals = connection.execute(text(
+                'SELECT company_name, h1b_approvals, h1b_denials FROM visa_sponsorship_data '
+                'ORDER BY company_name')).all()
+        self.assertEqual([tuple(row) for row in rows],
+                         [('amazon', 2023, 15, 1), ('amazon', 2024, 7, 2), ('apple', 2023, 3, 0)])
+        self.assertEqual([tuple(row) for row in totals], [('Amazon', 22, 3), ('Apple Inc.', 3, 0)])
+
+
+if __name__ == '__main__':
+    unittest.main()
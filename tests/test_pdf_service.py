@@ -0,0 +1,235 @@
+"""Unit tests for the PDF compilation service."""
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+import unittest
+from services.pdf_service import PdfCache, PdfCompiler, CompileExecutor, CompileQueueFull
+
+
+LATEX = """\\documentclass{article}
+\\usepackage{hyperref}
+\\begin{document}
+Hello
+\\end{document}"""
+
+
+class FakePdflatex:
+    """Stand-in for the pdflatex binary that records its invocations."""
+    
+    def __init__(self, returncode=0, format_returncode=0):
+        self.calls = []
+        self.returncode = returncode
+        self.format_returncode = format_returncode
+    
+    def __call__(self, args, cwd):
+        self.calls.append((args, cwd))
+        if '-ini' in args:
+            if self.format_returncode == 0:
+                open(os.path.join(cwd, 'preamble.fmt'), 'w').close()
+            return subprocess.CompletedProcess(args, self.format_returncode, '', '')
+        if self.returncode == 0:
+            with open(os.path.join(cwd, 'resume.pdf'), 'wb') as f:
+                f.write(b'%PDF-1.5 fake')
+        else:
+            with open(os.path.join(cwd, 'resume.log'), 'w') as f:
+                f.write('! Undefined control sequence.')
+        return subprocess.CompletedProcess(args, self.returncode, 'output', '')
+    
+    @property
+    def compiles(self):
+        return [args for args, _ in self.calls if '-ini' not in args]
+
+
+class TestPdfCompiler(unittest.TestCase):
+    """Test cases for PdfCompiler."""
+    
+    def setUp(self):
+        """Set up scratch directories."""
+        self.root = tempfile.mkdtemp()
+        self.cache = PdfCache(os.path.join(self.root, 'cache'), max_entries=2)
+    
+    def tearDown(self):
+        """Remove scratch directories."""
+        shutil.rmtree(self.root)
+    
+    def make_compiler(self, fake, **kwargs):
+        compiler = PdfCompiler(cache=self.cache, **kwargs)
+        compiler._run = fake
+        return compiler
+    
+    def test_identical_latex_is_served_from_cache(self):
+        """Test that a second compile of the same content skips pdflatex."""
+        fake = FakePdflatex()
+        compiler = self.make_compiler(fake)
+        
+        first = compiler.compile(LATEX)
+        second = compiler.compile(LATEX)
+        
+        self.assertEqual(first.pdf, b'%PDF-1.5 fake')
+        self.assertEqual(second.pdf, first.pdf)
+        self.assertTrue(second.cached)
+        self.assertEqual(len(fake.calls), 1)
+    
+    def test_failed_compile_returns_log_and_is_not_cached(self):
+        """Test that failures report the log and are retried next time."""
+        fake = FakePdflatex(returncode=1)
+        compiler = self.make_compiler(fake)
+        
+        result = compiler.compile(LATEX)
+        compiler.compile(LATEX)
+        
+        self.assertFalse(result.success)
+        self.assertIn('Undefined control sequence', result.log)
+        self.assertEqual(len(fake.calls), 2)
+    
+    def test_work_dir_reuses_precompiled_preamble(self):
+        """Test that the preamble format is built once per template."""
+        fake = FakePdflatex()
+        compiler = self.make_compiler(fake, work_dir=os.path.join(self.root, 'work'))
+        
+        compiler.compile(LATEX)
+        compiler.compile(LATEX.replace('Hello', 'Hello again'))
+        
+        format_builds = [args for args, _ in fake.calls if '-ini' in args]
+        self.assertEqual(len(format_builds), 1)
+        self.assertEqual(len(fake.compiles), 2)
+        for args in fake.compiles:
+            self.assertIn('-fmt=preamble', args)
+        self.assertEqual(len({cwd for _, cwd in fake.calls}), 1)
+    
+    def test_work_dir_falls_back_without_mylatexformat(self):
+        """Test that a failed format build falls back to plain compiles."""
+        fake = FakePdflatex(format_returncode=1)
+        compiler = self.make_compiler(fake, work_dir=os.path.join(self.root, 'work'))
+        
+        result = compiler.compile(LATEX)
+        compiler.compile(LATEX.replace('Hello', 'Hello again'))
+        
+        self.assertTrue(result.success)
+        self.assertEqual(len([args for args, _ in fake.calls if '-ini' in args]), 1)
+        for args in fake.compiles:
+            self.assertNotIn('-fmt=preamble', args)
+
+
+class TestPdfCache(unittest.TestCase):
+    """Test cases for the on-disk PDF cache."""
+    
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test eviction beyond the size cap."""
+        with tempfile.TemporaryDirectory() as directory:
+            cache = PdfCache(directory, max_entries=2)
+            cache.set('a', b'a')
+            cache.set('b', b'b')
+            os.utime(os.path.join(directory, 'a.pdf'), (0, 0))
+            cache.set('c', b'c')
+            
+            self.assertIsNone(cache.get('a'))
+            self.assertEqual(cache.get('b'), b'b')
+            self.assertEqual(cache.get('c'), b'c')
+
+
+class BlockingCompiler:
+    """Compiler stub that blocks until released."""
+    
+    def __init__(self):
+        self.started = threading.Semaphore(0)
+        self.release = threading.Event()
+    
+    cache_key = staticmethod(PdfCompiler.cache_key)
+    
+    def lookup(self, key):
+        return None
+    
+    def build(self, latex_content, key):
+        from services.pdf_service import CompileResult
+        self.started.release()
+        self.release.wait(5)
+        return CompileResult(b'%PDF')
+
+
+class TestCompileExecutor(unittest.TestCase):
+    """Test cases for the bounded compile executor."""
+    
+    def test_rejects_when_queue_is_full(self):
+        """Test back-pressure once workers and queue slots are taken."""
+        compiler = BlockingCompiler()
+        executor = CompileExecutor(compiler, workers=1, queue_size=1, retry_after=7)
+        threads = [threading.Thread(target=executor.compile, args=(LATEX,)) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        self.assertTrue(compiler.started.acquire(timeout=5))
+        for _ in range(500):
+            if executor.metrics.snapshot()['queue_depth'] == 1:
+                break
+            threading.Event().wait(0.01)
+        
+        with self.assertRaises(CompileQueueFull) as raised:
+            executor.compile(LATEX)
+        self.assertEqual(raised.exception.retry_after, 7)
+        
+        metrics = executor.metrics.snapshot()
+        self.assertEqual(metrics['running'], 1)
+        self.assertEqual(metrics['queue_depth'], 1)
+        self.assertEqual(metrics['rejected'], 1)
+        
+        compiler.release.set()
+        for thread in threads:
+            thread.join(5)
+        executor.shutdown()
+        
+        metrics = executor.metrics.snapshot()
+        self.assertEqual(metrics['completed'], 2)
+        self.assertEqual(metrics['queue_depth'], 0)
+        self.assertIn('latency_p95', metrics)
+    
+    def test_cache_hits_bypass_the_queue(self):
+        """Test that cached documents are served without a worker slot."""
+        with tempfile.TemporaryDirectory() as directory:
+            compiler = PdfCompiler(cache=PdfCache(directory))
+            compiler._run = FakePdflatex()
+            executor = CompileExecutor(compiler, workers=1, queue_size=0)
+            executor.compile(LATEX)
+            
+            executor._slots.acquire()
+            self.assertTrue(executor.compile(LATEX).cached)
+            self.assertEqual(executor.metrics.snapshot()['cache_hits'], 1)
+            executor.shutdown()
+    
+    def fake_binary(self, directory, script):
+        path = os.path.join(directory, 'pdflatex')
+        with open(path, 'w') as f:
+            f.write('#!/bin/sh\n' + script)
+        os.chmod(path, 0o755)
+        return path
+    
+    def test_timeout_is_reported_as_failure(self):
+        """Test that a pdflatex timeout kills the process and fails the job with a message."""
+        with tempfile.TemporaryDirectory() as directory:
+            compiler = PdfCompiler(pdflatex=self.fake_binary(directory, 'exec sleep 5\n'), timeout=0.2)
+            started = time.monotonic()
+            
+            result = compiler.compile(LATEX)
+        
+        self.assertFalse(result.success)
+        self.assertIn('timed out', result.log)
+        self.assertLess(time.monotonic() - started, 4)
+    
+    def test_memory_limit_applies_to_pdflatex(self):
+        """Test that the address space limit is set on the pdflatex process from a worker thread."""
+        with tempfile.TemporaryDirectory() as directory:
+            compiler = PdfCompiler(pdflatex=self.fake_binary(directory, 'sleep 0.2\nulimit -v\nexit 1\n'),
+                                   memory_limit_mb=256)
+            executor = CompileExecutor(compiler, workers=1)
+            
+            result = executor.compile(LATEX)
+            executor.shutdown()
+        
+        self.assertFalse(result.success)
+        self.assertEqual(result.log.strip(), str(256 * 1024))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+"""Query budget tests: each route must issue a fixed number of SQL statements."""
+import os
+import unittest
+from contextlib import contextmanager
+
+# The app module reads these at import time
+os.environ.setdefault('FLASK_ENV', 'testing')
+os.environ.setdefault('GOOGLE_API_KEY', 'test-key')
+
+from sqlalchemy import event
+
+import app as app_module
+from models import db
+from models.resume_version import ResumeVersion
+from models.user import User
+from services.taxonomy import skill_taxonomy
+
+
+class TestQueryCounts(unittest.TestCase):
+    """Test that routes do not reload the user or issue N+1 queries."""
+
+    VERSIONS = 5
+
+    def setUp(self):
+        """Set up a logged-in client whose user has several resume versions."""
+        self.app = app_module.app
+        with self.app.app_context():
+            db.create_all()
+            user = User(email='queries@example.com')
+            user.set_password('testpassword')
+            db.session.add(user)
+            db.session.commit()
+            for i in range(self.VERSIONS):
+                db.session.add(ResumeVersion(
+                    user_id=user.id, name=f'Version {i}', category='Engineering',
+                    latex_content=f'Python and SQL resume {i}', keyword_fingerprint=['python', 'sql'],
+                    keyword_taxonomy_version=skill_taxonomy.current().version
+                ))
+            db.session.commit()
+            self.version_id = ResumeVersion.query.first().id
+
+        self.client = self.app.test_client()
+        self.client.post('/login', data={'email': 'queries@example.com', 'password': 'testpassword'})
+
+    def tearDown(self):
+        """Tear down the database."""
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    @contextmanager
+    def assert_queries(self, expected):
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        with self.app.app_context():
+            engine = db.engine
+        event.listen(engine, 'before_cursor_execute', record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, 'before_cursor_execute', record)
+        self.assertEqual(len(statements), expected, '\n\n'.join(statements))
+
+    def test_profile(self):
+        """Test that the profile page only loads the user."""
+        with self.assert_queries(1):
+            self.assertEqual(self.client.get('/profile').status_code, 200)
+
+    def test_resume_versions_list(self):
+        """Test that listing versions is one query that skips the LaTeX bodies."""
+        with self.assert_queries(2) as statements:
+            self.assertEqual(self.client.get('/resume-versions').status_code, 200)
+        self.assertNotIn('latex_content', statements[1])
+
+    def test_tailor_form(self):
+        """Test that the tailor form loads version metadata only."""
+        with self.assert_queries(2) as statements:
+            response = self.client.get('/tailor')
+            self.assertEqual(response.status_code, 200)
+        self.assertNotIn('latex_content', statements[1])
+        self.assertNotIn(b'Python and SQL resume', response.data)
+
+    def test_view_resume_version(self):
+        """Test that viewing a version loads the user and that version."""
+        with self.assert_queries(2):
+            self.assertEqual(self.client.get(f'/resume-versions/{self.version_id}').status_code, 200)
+
+    def test_resume_version_content(self):
+        """Test the version content API."""
+        with self.assert_queries(2):
+            response = self.client.get(f'/api/resume-versions/{self.version_id}/content')
+            self.assertEqual(response.status_code, 200)
+
+    def test_analyze_compatibility(self):
+        """Test that scoring and suggestion use one query each after the user load."""
+        # IDF weights are loaded once per refresh interval, not per request
+        app_module.corpus_statistics.clear()
+        with self.app.app_context():
+            app_module.corpus_statistics.statistics()
+
+        with self.assert_queries(3):
+            response = self.client.post('/api/analyze-compatibility', json={
+                'job_description': 'Python and SQL developer',
+                'resume_version_id': self.version_id
+            })
+            self.assertEqual(response.status_code, 200)
+        self.assertIsNotNone(response.get_json()['compatibility']['weighted_score'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,11 @@
 """Unit tests for resume tailoring service."""
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
+from sqlalchemy import event
+from database import create_app
+from models import db
 from services.resume_service import ResumeTailoringService, CompatibilityScore
+from services.taxonomy import skill_taxonomy
 from models.resume_version import ResumeVersion
 from models.user import User
 
@@ -56,6 +60,18 @@ class TestResumeTailoringService(unittest.TestCase):
         self.assertIn('machine learning', keywords)
         self.assertIn('data science', keywords)
     
+    def test_extract_keywords_word_boundaries(self):
+        """Test that short keywords do not match inside longer words."""
+        text = "Worked at Google on JavaScript, PostgreSQL and R"
+        keywords = self.service.extract_keywords(text)
+        
+        self.assertNotIn('go', keywords)
+        self.assertNotIn('java', keywords)
+        self.assertNotIn('sql', keywords)
+        self.assertIn('javascript', keywords)
+        self.assertIn('postgresql', keywords)
+        self.assertIn('r', keywords)
+    
     def test_analyze_compatibility_high_score(self):
         """Test compatibility analysis with high matching score."""
         compatibility = self.service.analyze_compatibility(
@@ -173,6 +189,22 @@ class TestResumeTailoringService(unittest.TestCase):
         self.assertEqual(len(score.suggestions), 1)
         self.assertIn('python', score.matched_keywords)
         self.assertIn('java', score.missing_keywords)
+    
+    def test_compatibility_score_from_masks(self):
+        """Test that keyword lists and suggestions are decoded from bitmasks on first access."""
+        matcher = skill_taxonomy.current().matcher
+        resume_mask = matcher.encode(['python', 'sql', 'react'])
+        job_mask = matcher.encode(['python', 'sql', 'docker', 'aws'])
+        
+        score = CompatibilityScore.from_masks(resume_mask, job_mask)
+        
+        self.assertEqual(score.score, 0.5)
+        self.assertIsNone(score._matched_keywords)
+        self.assertEqual(score.matched_keywords, ['python', 'sql'])
+        self.assertEqual(score.missing_keywords, ['aws', 'docker'])
+        self.assertIn('aws, docker', score.suggestions[0])
+        self.assertEqual(CompatibilityScore.from_masks(resume_mask, 0).score, 0.0)
+        self.assertFalse(hasattr(score, '__dict__'))
 
 
 class TestResumeTailoringServiceIntegration(unittest.TestCase):
@@ -217,5 +249,114 @@ class TestResumeTailoringServiceIntegration(unittest.TestCase):
         self.assertTrue(any('good compatibility' in s.lower() for s in compatibility.suggestions))
 
 
+class TestSuggestResumeVersion(unittest.TestCase):
+    """Database tests for fingerprint-based resume version suggestion."""
+    
+    def setUp(self):
+        """Set up an in-memory database with one user and two versions."""
+        self.app = create_app('testing')
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+        
+        self.service = ResumeTailoringService()
+        self.user = User(email='suggest@example.com')
+        self.user.set_password('testpassword')
+        db.session.add(self.user)
+        db.session.commit()
+        
+        self.engineering = ResumeVersion(
+            user_id=self.user.id, name='Engineering', category='Engineering',
+            latex_content='Python, React, SQL, AWS and Docker'
+        )
+        self.marketing = ResumeVersion(
+            user_id=self.user.id, name='Marketing', category='Marketing',
+            latex_content='Social media campaigns and Figma mockups'
+        )
+        for version in (self.engineering, self.marketing):
+            self.service.update_fingerprint(version)
+            db.session.add(version)
+        db.session.commit()
+        self.user_id = self.user.id
+        self.marketing_id = self.marketing.id
+        db.session.expunge_all()
+    
+    def tearDown(self):
+        """Tear down the database."""
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+    
+    def test_keyword_fingerprint_is_sorted(self):
+        """Test that fingerprints are stable sorted keyword lists."""
+        self.assertEqual(
+            self.service.keyword_fingerprint('SQL, Python and AWS'),
+            ['aws', 'python', 'sql']
+        )
+    
+    def test_suggest_uses_fingerprints_without_loading_latex(self):
+        """Test that suggestion does not select the LaTeX bodies."""
+        statements = []
+        
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+        
+        event.listen(db.engine, 'before_cursor_execute', record)
+        try:
+            suggested = self.service.suggest_resume_version(self.user_id, 'Python and SQL developer')
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', record)
+        
+        self.assertEqual(suggested.name, 'Engineering')
+        self.assertEqual(len(statements), 1)
+        self.assertNotIn('latex_content', statements[0])
+    
+    def test_suggest_backfills_missing_fingerprints(self):
+        """Test that versions without a fingerprint are backfilled."""
+        version = db.session.get(ResumeVersion, self.marketing_id)
+        version.keyword_fingerprint = None
+        db.session.commit()
+        
+        suggested = self.service.suggest_resume_version(self.user_id, 'Figma designer')
+        
+        self.assertEqual(suggested.name, 'Marketing')
+        self.assertEqual(db.session.get(ResumeVersion, self.marketing_id).keyword_fingerprint, ['figma'])
+    
+    def test_suggest_recomputes_fingerprints_from_another_taxonomy(self):
+        """Test that fingerprints tagged with an older taxonomy version are recomputed."""
+        version = db.session.get(ResumeVersion, self.marketing_id)
+        version.keyword_fingerprint = ['python']
+        version.keyword_taxonomy_version = 'retired'
+        db.session.commit()
+        
+        suggested = self.service.suggest_resume_version(self.user_id, 'Figma designer')
+        
+        self.assertEqual(suggested.name, 'Marketing')
+        version = db.session.get(ResumeVersion, self.marketing_id)
+        self.assertEqual(version.keyword_fingerprint, ['figma'])
+        self.assertEqual(version.keyword_taxonomy_version, skill_taxonomy.current().version)
+    
+    def test_versions_by_category_filters_in_sql(self):
+        """Test that category filtering is a single filtered query."""
+        statements = []
+        
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+        
+        event.listen(db.engine, 'before_cursor_execute', record)
+        try:
+            versions = self.service.get_resume_versions_by_category(self.user_id, 'Marketing')
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', record)
+        
+        self.assertEqual([version.id for version in versions], [self.marketing_id])
+        self.assertEqual(len(statements), 1)
+        self.assertIn('category', statements[0].split('WHERE')[1])
+    
+    def test_suggest_without_job_keywords(self):
+        """Test that no suggestion is made when the job has no keywords."""
+        self.assertIsNone(self.service.suggest_resume_version(self.user_id, 'Friendly team player'))
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
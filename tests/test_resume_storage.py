@@ -0,0 +1,264 @@
+"""Tests for content-addressed resume storage."""
+import os
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+# The app module reads these at import time
+os.environ.setdefault('FLASK_ENV', 'testing')
+os.environ.setdefault('GOOGLE_API_KEY', 'test-key')
+
+from sqlalchemy import event
+
+import app as app_module
+from database import create_app
+from models import db
+from models.content_chunk import ContentChunk, content_cache, split_chunks
+from models.resume_version import ResumeVersion
+from models.user import User
+from services import resume_storage
+from services.resume_storage import GC_GRACE_SECONDS, delete_unreferenced_chunks, migrate_resume_versions
+
+
+RESUME = """\\documentclass{article}
+\\begin{document}
+\\section{Experience}
+Backend engineer at Acme.
+\\section{Projects}
+Kubernetes operator in Go.
+\\section{Skills}
+Python, SQL
+\\end{document}"""
+
+
+class TestSplitChunks(unittest.TestCase):
+    """Test cases for split_chunks."""
+
+    def test_chunks_join_to_original(self):
+        """Test that a document is cut at each section and loses nothing."""
+        chunks = split_chunks(RESUME)
+
+        self.assertEqual(len(chunks), 4)
+        self.assertTrue(chunks[2].startswith('\\section{Projects}'))
+        self.assertEqual(''.join(chunks), RESUME)
+
+    def test_document_without_sections(self):
+        """Test that text without sections is a single chunk."""
+        self.assertEqual(split_chunks('plain'), ['plain'])
+        self.assertEqual(split_chunks(''), [''])
+
+    def test_sections_after_end_document(self):
+        """Test that anything after \\end{document} stays in the last chunk."""
+        chunks = split_chunks(RESUME + '\n\\section{Notes}\n')
+
+        self.assertEqual(len(chunks), 4)
+        self.assertTrue(chunks[-1].endswith('\\section{Notes}\n'))
+
+
+class TestResumeStorage(unittest.TestCase):
+    """Database tests for chunked resume bodies."""
+
+    def setUp(self):
+        """Set up an in-memory database with one user."""
+        self.app = create_app('testing')
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+        content_cache.clear()
+
+        self.user = User(email='storage@example.com')
+        self.user.set_password('testpassword')
+        db.session.add(self.user)
+        db.session.commit()
+
+    def tearDown(self):
+        """Tear down the database."""
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def add_version(self, name, latex):
+        version = ResumeVersion(user_id=self.user.id, name=name, latex_content=latex)
+        db.session.add(version)
+        db.session.commit()
+        return version
+
+    def age_chunks(self):
+        table = ContentChunk.__table__
+        db.session.execute(table.update().values(
+            created_at=datetime.utcnow() - timedelta(seconds=GC_GRACE_SECONDS + 60)))
+        db.session.commit()
+
+    def count_queries(self, func):
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(db.engine, 'before_cursor_execute', record)
+        try:
+            result = func()
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', record)
+        return result, statements
+
+    def test_roundtrip(self):
+        """Test that the body is stored in chunks and read back exactly."""
+        version_id = self.add_version('Backend', RESUME).id
+        db.session.expire_all()
+        content_cache.clear()
+
+        version = db.session.get(ResumeVersion, version_id)
+
+        self.assertEqual(version.latex_content, RESUME)
+        self.assertEqual(version.inline_content, '')
+        self.assertEqual(ContentChunk.query.count(), 4)
+
+    def test_versions_share_unchanged_sections(self):
+        """Test that a version differing in one section adds one chunk."""
+        self.add_version('Backend', RESUME)
+        self.add_version('Platform', RESUME.replace('Kubernetes operator', 'Terraform modules'))
+
+        self.assertEqual(ContentChunk.query.count(), 5)
+
+    def test_edit_stores_only_new_chunks(self):
+        """Test that editing a version keeps the chunks it still uses."""
+        version = self.add_version('Backend', RESUME)
+        version.latex_content = RESUME.replace('Python, SQL', 'Python, SQL, Go')
+        db.session.commit()
+        db.session.expire_all()
+        content_cache.clear()
+
+        self.assertIn('Python, SQL, Go', version.latex_content)
+        self.assertEqual(ContentChunk.query.count(), 5)
+
+    def test_cached_reconstruction(self):
+        """Test that a body is reassembled once and then served from the cache."""
+        version_id = self.add_version('Backend', RESUME).id
+        db.session.expire_all()
+        content_cache.clear()
+        version = db.session.get(ResumeVersion, version_id)
+
+        _, first = self.count_queries(lambda: version.latex_content)
+        content, second = self.count_queries(lambda: version.latex_content)
+
+        self.assertEqual(len(first), 1)
+        self.assertEqual(second, [])
+        self.assertEqual(content, RESUME)
+
+    def test_missing_chunk_raises(self):
+        """Test that a dangling hash is reported rather than returning partial text."""
+        version = self.add_version('Backend', RESUME)
+        table = ResumeVersion.__table__
+        db.session.execute(table.update().where(table.c.id == version.id).values(
+            chunk_hashes=version.chunk_hashes + ['0' * 64]))
+        db.session.commit()
+        content_cache.clear()
+
+        with self.assertRaises(LookupError):
+            version.latex_content
+
+    def test_migrate_legacy_rows(self):
+        """Test that inline bodies are moved into chunks, idempotently."""
+        table = ResumeVersion.__table__
+        db.session.execute(table.insert(), [
+            {'user_id': self.user.id, 'name': f'Legacy {i}', 'latex_content': RESUME} for i in range(3)
+        ])
+        db.session.commit()
+        legacy = ResumeVersion.query.first()
+        self.assertIsNone(legacy.chunk_hashes)
+        self.assertEqual(legacy.latex_content, RESUME)
+
+        self.assertEqual(migrate_resume_versions(batch_size=2), 3)
+        self.assertEqual(migrate_resume_versions(batch_size=2), 0)
+
+        db.session.expire_all()
+        content_cache.clear()
+        for version in ResumeVersion.query:
+            self.assertEqual(version.inline_content, '')
+            self.assertEqual(version.latex_content, RESUME)
+        self.assertEqual(ContentChunk.query.count(), 4)
+
+    def test_delete_unreferenced_chunks(self):
+        """Test that only chunks no version uses are collected."""
+        version = self.add_version('Backend', RESUME)
+        self.add_version('Platform', RESUME.replace('Kubernetes operator', 'Terraform modules'))
+        db.session.delete(version)
+        db.session.commit()
+        self.age_chunks()
+
+        self.assertEqual(delete_unreferenced_chunks(), 1)
+        self.assertEqual(ContentChunk.query.count(), 4)
+        content_cache.clear()
+        self.assertIn('Terraform', ResumeVersion.query.one().latex_content)
+
+    def test_recent_chunks_are_kept(self):
+        """Test that unreferenced chunks are only collected after the grace period."""
+        db.session.delete(self.add_version('Backend', RESUME))
+        db.session.commit()
+
+        self.assertEqual(delete_unreferenced_chunks(), 0)
+        self.age_chunks()
+        self.assertEqual(delete_unreferenced_chunks(), 4)
+
+    def test_write_during_collection_keeps_its_chunks(self):
+        """Test that a version saved between GC reading references and deleting keeps its chunks."""
+        db.session.delete(self.add_version('Backend', RESUME))
+        db.session.commit()
+        self.age_chunks()
+        read_references = resume_storage._referenced_hashes
+
+        def save_while_collecting():
+            referenced = read_references()
+            self.add_version('Platform', RESUME)
+            return referenced
+
+        with patch('services.resume_storage._referenced_hashes', side_effect=save_while_collecting):
+            self.assertEqual(delete_unreferenced_chunks(), 0)
+
+        db.session.expire_all()
+        content_cache.clear()
+        self.assertEqual(ResumeVersion.query.one().latex_content, RESUME)
+
+
+class TestDuplicateResumeVersion(unittest.TestCase):
+    """Test cases for the duplicate route."""
+
+    def setUp(self):
+        """Set up a logged-in client with one resume version."""
+        self.app = app_module.app
+        with self.app.app_context():
+            db.create_all()
+            user = User(email='duplicate@example.com')
+            user.set_password('testpassword')
+            db.session.add(user)
+            db.session.commit()
+            version = ResumeVersion(user_id=user.id, name='Backend', latex_content=RESUME)
+            db.session.add(version)
+            db.session.commit()
+            self.version_id = version.id
+
+        self.client = self.app.test_client()
+        self.client.post('/login', data={'email': 'duplicate@example.com', 'password': 'testpassword'})
+
+    def tearDown(self):
+        """Tear down the database."""
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def test_duplicate_references_same_chunks(self):
+        """Test that duplicating writes no new content."""
+        response = self.client.post(f'/resume-versions/{self.version_id}/duplicate')
+
+        self.assertEqual(response.status_code, 302)
+        with self.app.app_context():
+            original, duplicate = ResumeVersion.query.order_by(ResumeVersion.id).all()
+            self.assertEqual(duplicate.name, 'Backend (Copy)')
+            self.assertEqual(duplicate.chunk_hashes, original.chunk_hashes)
+            self.assertEqual(duplicate.latex_content, RESUME)
+            self.assertEqual(ContentChunk.query.count(), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+"""Tests for the resume version list pages."""
+import os
+import unittest
+
+# The app module reads these at import time
+os.environ.setdefault('FLASK_ENV', 'testing')
+os.environ.setdefault('GOOGLE_API_KEY', 'test-key')
+
+import app as app_module
+from models import db
+from models.resume_version import ResumeVersion
+from models.user import User
+
+
+class TestResumeVersionPagination(unittest.TestCase):
+    """Test cursor pagination on /resume-versions."""
+
+    def setUp(self):
+        """Set up a logged-in client with five versions and a page size of two."""
+        self.app = app_module.app
+        self.per_page = self.app.config['RESUME_VERSIONS_PER_PAGE']
+        self.app.config['RESUME_VERSIONS_PER_PAGE'] = 2
+        with self.app.app_context():
+            db.create_all()
+            user = User(email='pages@example.com')
+            user.set_password('testpassword')
+            db.session.add(user)
+            db.session.commit()
+            for i in range(5):
+                db.session.add(ResumeVersion(user_id=user.id, name=f'Version {i}', latex_content='x'))
+            db.session.commit()
+            self.ids = [version.id for version in ResumeVersion.query.order_by(ResumeVersion.id)]
+
+        self.client = self.app.test_client()
+        self.client.post('/login', data={'email': 'pages@example.com', 'password': 'testpassword'})
+
+    def tearDown(self):
+        """Restore the page size and tear down the database."""
+        self.app.config['RESUME_VERSIONS_PER_PAGE'] = self.per_page
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def names(self, response):
+        return [f'Version {i}' for i in range(5) if f'>Version {i}<'.encode() in response.data]
+
+    def test_walks_pages_newest_first(self):
+        """Test following the Older links through every page."""
+        first = self.client.get('/resume-versions')
+        self.assertEqual(self.names(first), ['Version 3', 'Version 4'])
+        self.assertIn(f'before={self.ids[3]}'.encode(), first.data)
+        self.assertNotIn(b'Newest', first.data)
+
+        second = self.client.get(f'/resume-versions?before={self.ids[3]}')
+        self.assertEqual(self.names(second), ['Version 1', 'Version 2'])
+        self.assertIn(f'before={self.ids[1]}'.encode(), second.data)
+
+        last = self.client.get(f'/resume-versions?before={self.ids[1]}')
+        self.assertEqual(self.names(last), ['Version 0'])
+        self.assertNotIn(b'before=', last.data)
+        self.assertIn(b'Newest', last.data)
+
+    def test_cursor_is_stable_across_inserts(self):
+        """Test that new versions do not shift older pages."""
+        with self.app.app_context():
+            user_id = ResumeVersion.query.first().user_id
+            db.session.add(ResumeVersion(user_id=user_id, name='Version new', latex_content='x'))
+            db.session.commit()
+
+        second = self.client.get(f'/resume-versions?before={self.ids[3]}')
+
+        self.assertEqual(self.names(second), ['Version 1', 'Version 2'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,175 @@
+"""Tests for full-text search over resumes and job postings."""
+import os
+import unittest
+
+# The app module reads these at import time
+os.environ.setdefault('FLASK_ENV', 'testing')
+os.environ.setdefault('GOOGLE_API_KEY', 'test-key')
+
+import app as app_module
+from database import create_app
+from models import db
+from models.job_posting import JobPosting
+from models.resume_version import ResumeVersion
+from models.user import User
+from services.job_ingest_service import JobPostingIngester
+from services.latex_text import strip_latex
+from services.search_service import FullTextSearch, fts5_query
+
+
+RESUME = """\\documentclass{article}
+\\usepackage{geometry}
+\\begin{document}
+\\section{Projects}
+\\begin{itemize}
+  \\item \\textbf{Kubernetes} operator in Go, cut costs 40\\% % private note
+\\end{itemize}
+\\end{document}"""
+
+
+class TestStripLatex(unittest.TestCase):
+    """Test cases for strip_latex."""
+
+    def test_keeps_visible_text_only(self):
+        """Test that preamble, comments and markup are removed."""
+        self.assertEqual(strip_latex(RESUME), 'Projects Kubernetes operator in Go, cut costs 40%')
+
+    def test_escaped_specials_and_arguments(self):
+        """Test that escaped characters survive and non-text arguments do not."""
+        self.assertEqual(strip_latex('Flask \\& React\\vspace{2pt} \\href{https://a.io}{Demo}'),
+                         'Flask & React https://a.io Demo')
+
+    def test_fts5_query_quotes_words(self):
+        """Test that user input cannot inject FTS5 syntax."""
+        self.assertEqual(fts5_query('python OR "go*'), '"python" "OR" "go"')
+        self.assertEqual(fts5_query('  ()  '), '')
+
+
+class TestFullTextSearch(unittest.TestCase):
+    """Database tests for FTS5 indexing and queries."""
+
+    def setUp(self):
+        """Set up an in-memory database with two users' resumes and some postings."""
+        self.app = create_app('testing')
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+        self.search = FullTextSearch()
+
+        self.owner = User(email='owner@example.com')
+        self.other = User(email='other@example.com')
+        for user in (self.owner, self.other):
+            user.set_password('testpassword')
+            db.session.add(user)
+        db.session.commit()
+
+        self.version = ResumeVersion(user_id=self.owner.id, name='Platform', latex_content=RESUME)
+        db.session.add(self.version)
+        db.session.add(ResumeVersion(user_id=self.other.id, name='Other', latex_content=RESUME))
+        db.session.commit()
+
+    def tearDown(self):
+        """Tear down the database."""
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def test_resume_search_is_scoped_to_user(self):
+        """Test that only the user's own versions are returned."""
+        results = self.search.search_resumes('kubernetes', self.owner.id)
+
+        self.assertEqual([result.id for result in results], [self.version.id])
+        self.assertIn('[Kubernetes]', results[0].snippet)
+
+    def test_latex_is_not_indexed(self):
+        """Test that command names and comments are not searchable."""
+        self.assertEqual(self.search.search_resumes('textbf', self.owner.id), [])
+        self.assertEqual(self.search.search_resumes('private', self.owner.id), [])
+        self.assertEqual(self.search.search_resumes('geometry', self.owner.id), [])
+
+    def test_updates_and_deletes_are_synced(self):
+        """Test that ORM changes keep the index current."""
+        self.version.latex_content = 'Terraform modules'
+        db.session.commit()
+        self.assertEqual(self.search.search_resumes('kubernetes', self.owner.id), [])
+        self.assertEqual(len(self.search.search_resumes('terraform', self.owner.id)), 1)
+
+        db.session.delete(self.version)
+        db.session.commit()
+        self.assertEqual(self.search.search_resumes('terraform', self.owner.id), [])
+
+    def test_job_postings_from_orm_and_ingest(self):
+        """Test that postings are searchable whether added by the ORM or by ingest."""
+        db.session.add(JobPosting(title='SRE', company='Acme', description='Operate Kubernetes clusters'))
+        db.session.commit()
+        JobPostingIngester(default_source='feed').ingest_records([
+            {'title': 'Platform Engineer', 'company': 'Globex', 'external_id': '1',
+             'description': 'Kubernetes, Kubernetes and more Kubernetes'}
+        ])
+
+        results = self.search.search_job_postings('kubernetes')
+
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[0].title, 'Platform Engineer Globex')
+        self.assertGreater(results[0].score, results[1].score)
+        self.assertEqual(len(self.search.search_job_postings('globex')), 1)
+
+    def test_stemming(self):
+        """Test that the porter tokenizer matches word forms."""
+        self.assertEqual(len(self.search.search_resumes('operators', self.owner.id)), 1)
+
+    def test_rebuild(self):
+        """Test that a rebuild re-creates the index from source rows."""
+        db.session.execute(db.text('DELETE FROM resume_search'))
+        db.session.commit()
+
+        self.search.rebuild()
+
+        self.assertEqual(len(self.search.search_resumes('kubernetes', self.owner.id)), 1)
+
+
+class TestSearchEndpoint(unittest.TestCase):
+    """Test cases for /api/search."""
+
+    def setUp(self):
+        """Set up a logged-in client with one resume version and one posting."""
+        self.app = app_module.app
+        with self.app.app_context():
+            db.create_all()
+            user = User(email='search@example.com')
+            user.set_password('testpassword')
+            db.session.add(user)
+            db.session.commit()
+            db.session.add(ResumeVersion(user_id=user.id, name='Platform', latex_content=RESUME))
+            db.session.add(JobPosting(title='SRE', company='Acme', description='Kubernetes on call'))
+            db.session.commit()
+
+        self.client = self.app.test_client()
+        self.client.post('/login', data={'email': 'search@example.com', 'password': 'testpassword'})
+
+    def tearDown(self):
+        """Tear down the database."""
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def test_search_all(self):
+        """Test searching resumes and postings together."""
+        response = self.client.get('/api/search?q=kubernetes')
+
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertEqual([r['title'] for r in data['resume_versions']], ['Platform'])
+        self.assertEqual([r['title'] for r in data['job_postings']], ['SRE Acme'])
+
+    def test_scope_and_validation(self):
+        """Test the scope parameter and missing queries."""
+        data = self.client.get('/api/search?q=kubernetes&scope=jobs').get_json()
+        self.assertNotIn('resume_versions', data)
+
+        self.assertEqual(self.client.get('/api/search').status_code, 400)
+        self.assertEqual(self.client.get('/api/search?q=x&scope=users').status_code, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+"""Unit tests for the tailoring response cache."""
+import unittest
+from unittest.mock import patch
+from database import create_app
+from models import db
+from services.tailoring_cache import (
+    TailoringCache, MemoryCacheBackend, DatabaseCacheBackend, make_tailoring_cache
+)
+
+
+class TestTailoringCacheKey(unittest.TestCase):
+    """Test cases for cache key derivation."""
+    
+    def test_key_depends_on_every_input(self):
+        """Test that changing any input changes the key."""
+        base = TailoringCache.make_key('model', '1', 'resume', 'job')
+        
+        self.assertEqual(base, TailoringCache.make_key('model', '1', 'resume', 'job'))
+        self.assertNotEqual(base, TailoringCache.make_key('other-model', '1', 'resume', 'job'))
+        self.assertNotEqual(base, TailoringCache.make_key('model', '2', 'resume', 'job'))
+        self.assertNotEqual(base, TailoringCache.make_key('model', '1', 'resume2', 'job'))
+        self.assertNotEqual(base, TailoringCache.make_key('model', '1', 'resume', 'job2'))
+    
+    def test_key_is_not_ambiguous(self):
+        """Test that moving text between inputs changes the key."""
+        self.assertNotEqual(
+            TailoringCache.make_key('model', '1', 'ab', 'c'),
+            TailoringCache.make_key('model', '1', 'a', 'bc')
+        )
+
+
+class TestMemoryCacheBackend(unittest.TestCase):
+    """Test cases for the in-memory LRU backend."""
+    
+    def test_hit_miss_counters(self):
+        """Test that lookups are counted."""
+        cache = TailoringCache(MemoryCacheBackend(), ttl=60)
+        cache.set('a', 'latex')
+        
+        self.assertEqual(cache.get('a'), 'latex')
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.stats(), {'hits': 1, 'misses': 1, 'hit_rate': 0.5})
+    
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted at the cap."""
+        backend = MemoryCacheBackend(max_entries=2)
+        backend.set('a', '1', 60)
+        backend.set('b', '2', 60)
+        backend.get('a')
+        backend.set('c', '3', 60)
+        
+        self.assertEqual(backend.get('a'), '1')
+        self.assertIsNone(backend.get('b'))
+        self.assertEqual(backend.get('c'), '3')
+    
+    def test_ttl_expiry(self):
+        """Test that expired entries are not returned."""
+        backend = MemoryCacheBackend()
+        with patch('services.tailoring_cache.time.monotonic', return_value=100.0):
+            backend.set('a', '1', 10)
+        with patch('services.tailoring_cache.time.monotonic', return_value=111.0):
+            self.assertIsNone(backend.get('a'))
+
+
+class TestDatabaseCacheBackend(unittest.TestCase):
+    """Test cases for the database backend."""
+    
+    def setUp(self):
+        """Set up an in-memory database."""
+        self.app = create_app('testing')
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+    
+    def tearDown(self):
+        """Tear down the database."""
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+    
+    def test_round_trip_and_size_cap(self):
+        """Test storing entries and evicting beyond the cap."""
+        backend = DatabaseCacheBackend(max_entries=2)
+        backend.set('a', 'one', 60)
+        backend.set('b', 'two', 60)
+        backend.set('c', 'three', 60)
+        
+        self.assertIsNone(backend.get('a'))
+        self.assertEqual(backend.get('b'), 'two')
+        self.assertEqual(backend.get('c'), 'three')
+    
+    def test_counters_are_shared(self):
+        """Test that lookups through one process's cache count in another's stats."""
+        worker = TailoringCache(DatabaseCacheBackend(), ttl=60)
+        web = TailoringCache(DatabaseCacheBackend(), ttl=60)
+        worker.set('a', 'latex')
+        
+        worker.get('a')
+        worker.get('b')
+        
+        self.assertEqual(web.stats(), {'hits': 1, 'misses': 1, 'hit_rate': 0.5})
+        web.clear()
+        self.assertEqual(worker.stats()['hits'], 0)
+    
+    def test_expired_entries_are_dropped(self):
+        """Test that expired entries are treated as misses."""
+        backend = DatabaseCacheBackend()
+        backend.set('a', 'one', -1)
+        
+        self.assertIsNone(backend.get('a'))
+
+
+class TestMakeTailoringCache(unittest.TestCase):
+    """Test cases for configuration-driven backend selection."""
+    
+    def test_backend_selection(self):
+        """Test that the configured backend is used."""
+        self.assertIsInstance(make_tailoring_cache({}).backend, MemoryCacheBackend)
+        self.assertIsInstance(
+            make_tailoring_cache({'TAILORING_CACHE_BACKEND': 'database'}).backend,
+            DatabaseCacheBackend
+        )
+        self.assertIsNone(make_tailoring_cache({'TAILORING_CACHE_BACKEND': 'none'}))
+        with self.assertRaises(ValueError):
+            make_tailoring_cache({'TAILORING_CACHE_BACKEND': 'memcached'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,235 @@
+"""Tests for background tailoring jobs."""
+import json
+import os
+import unittest
+from unittest.mock import Mock, patch
+
+# The app module reads these at import time
+os.environ.setdefault('FLASK_ENV', 'testing')
+os.environ.setdefault('GOOGLE_API_KEY', 'test-key')
+
+import app as app_module
+from models import db
+from models.user import User
+
+
+RESUME = """\\documentclass{article}
+\\begin{document}
+\\section{Experience}
+Python developer
+\\section{Projects}
+Old project description
+\\end{document}"""
+
+MODEL_OUTPUT = """```latex
+\\documentclass{article}
+\\begin{document}
+\\section{Experience}
+Python developer
+\\section{Projects}
+Engineered a Flask & React dashboard % added by model
+\\end{document}
+```"""
+
+
+class TestTailoringJobs(unittest.TestCase):
+    """Test cases for the asynchronous /tailor flow."""
+    
+    def setUp(self):
+        """Set up a logged-in test client with an eager Celery backend."""
+        self.app = app_module.app
+        with self.app.app_context():
+            db.create_all()
+        app_module.tailoring_cache.clear()
+        
+        self.client = self.login_client('jobs@example.com')
+    
+    def tearDown(self):
+        """Tear down the database."""
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+    
+    def login_client(self, email):
+        with self.app.app_context():
+            user = User(email=email)
+            user.set_password('testpassword')
+            db.session.add(user)
+            db.session.commit()
+        
+        client = self.app.test_client()
+        client.post('/login', data={'email': email, 'password': 'testpassword'})
+        return client
+    
+    def submit(self, **headers):
+        return self.client.post('/tailor', data={
+            'resume': RESUME,
+            'job_description': 'Python and React engineer'
+        }, headers=headers)
+    
+    @patch.object(app_module, 'client')
+    def test_tailor_returns_job_id(self, client):
+        """Test that /tailor enqueues a job and returns its id."""
+        client.models.generate_content.return_value = Mock(text=MODEL_OUTPUT)
+        
+        response = self.submit(Accept='application/json')
+        
+        self.assertEqual(response.status_code, 202)
+        self.assertIn('job_id', response.get_json())
+    
+    @patch.object(app_module, 'client')
+    def test_job_status_returns_tailored_latex(self, client):
+        """Test polling a finished job returns the spliced LaTeX."""
+        client.models.generate_content.return_value = Mock(text=MODEL_OUTPUT)
+        
+        job_id = self.submit(Accept='application/json').get_json()['job_id']
+        data = self.client.get(f'/tailor/jobs/{job_id}').get_json()
+        
+        self.assertEqual(data['status'], 'SUCCESS')
+        self.assertIn('Flask \\& React dashboard', data['latex_content'])
+        self.assertNotIn('added by model', data['latex_content'])
+        self.assertIn('\\section{Experience}\nPython developer', data['latex_content'])
+    
+    @patch.object(app_module, 'client')
+    def test_preview_page_polls_job(self, client):
+        """Test that the HTML flow renders the preview with a status URL."""
+        client.models.generate_content.return_value = Mock(text=MODEL_OUTPUT)
+        
+        response = self.submit()
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'data-status-url="/tailor/jobs/', response.data)
+    
+    @patch.object(app_module, 'client')
+    def test_job_failure_is_reported(self, client):
+        """Test that a failing Gemini call is surfaced by the status endpoint."""
+        client.models.generate_content.side_effect = RuntimeError('quota exceeded')
+        
+        job_id = self.submit(Accept='application/json').get_json()['job_id']
+        data = self.client.get(f'/tailor/jobs/{job_id}').get_json()
+        
+        self.assertEqual(data['status'], 'FAILURE')
+        self.assertIn('quota exceeded', data['error'])
+    
+    @patch.object(app_module, 'client')
+    def test_resubmission_is_served_from_cache(self, client):
+        """Test that an identical resubmission skips the Gemini call."""
+        client.models.generate_content.return_value = Mock(text=MODEL_OUTPUT)
+        
+        first = self.submit(Accept='application/json').get_json()['job_id']
+        second = self.submit(Accept='application/json').get_json()['job_id']
+        
+        self.assertEqual(client.models.generate_content.call_count, 1)
+        self.assertEqual(
+            self.client.get(f'/tailor/jobs/{first}').get_json()['latex_content'],
+            self.client.get(f'/tailor/jobs/{second}').get_json()['latex_content']
+        )
+        self.assertEqual(app_module.tailoring_cache.stats()['hits'], 1)
+    
+    @patch.object(app_module, 'client')
+    def test_section_mode_sends_only_projects(self, client):
+        """Test that section mode prompts with the Projects section alone."""
+        client.models.generate_content.return_value = Mock(
+            text='\\section{Projects}\nEngineered a Flask & React dashboard',
+            usage_metadata=Mock(prompt_token_count=120, candidates_token_count=40)
+        )
+        
+        with self.app.app_context():
+            latex = app_module.tailor_latex(RESUME, 'Python and React engineer', mode='section')
+        
+        prompt = client.models.generate_content.call_args.kwargs['contents']
+        self.assertIn('Old project description', prompt)
+        self.assertNotIn('Python developer', prompt)
+        self.assertIn('\\section{Projects}\nEngineered a Flask \\& React dashboard\n\\end{document}', latex)
+        self.assertIn('\\section{Experience}\nPython developer', latex)
+        with self.app.app_context():
+            self.assertEqual(app_module.tailoring_metrics.snapshot()['section']['output_tokens'], 40)
+    
+    @patch.object(app_module, 'client')
+    def test_section_mode_accepts_body_without_heading(self, client):
+        """Test that a reply missing the section heading is still spliced in."""
+        client.models.generate_content.return_value = Mock(text='Engineered a CLI in Go')
+        
+        with self.app.app_context():
+            latex = app_module.tailor_latex(RESUME, 'Go engineer', mode='section')
+        
+        self.assertIn('\\section{Projects}\nEngineered a CLI in Go', latex)
+    
+    @patch.object(app_module, 'client')
+    def test_document_mode_sends_whole_resume(self, client):
+        """Test that document mode still round-trips the full resume."""
+        client.models.generate_content.return_value = Mock(text=MODEL_OUTPUT)
+        
+        with self.app.app_context():
+            latex = app_module.tailor_latex(RESUME, 'Python and React engineer', mode='document')
+        
+        prompt = client.models.generate_content.call_args.kwargs['contents']
+        self.assertIn('Python developer', prompt)
+        self.assertIn('Flask \\& React dashboard', latex)
+    
+    def stream_events(self, response):
+        events = []
+        for block in response.get_data(as_text=True).strip().split('\n\n'):
+            event, data = block.split('\n')
+            events.append((event[len('event: '):], json.loads(data[len('data: '):])))
+        return events
+    
+    @patch.object(app_module, 'client')
+    def test_stream_emits_sanitized_lines_then_final_latex(self, client):
+        """Test the SSE endpoint streams complete lines and ends with the splice."""
+        client.models.generate_content_stream.return_value = iter([
+            Mock(text='```latex\n\\section{Proj'),
+            Mock(text='ects}\nBuilt R&D tools % note\nCut costs'),
+            Mock(text=' by 30%\n```', usage_metadata=Mock(prompt_token_count=50, candidates_token_count=20)),
+        ])
+        
+        response = self.client.post('/tailor/stream', data={
+            'resume': RESUME,
+            'job_description': 'Python engineer'
+        })
+        
+        self.assertEqual(response.mimetype, 'text/event-stream')
+        events = self.stream_events(response)
+        chunks = ''.join(data['latex'] for event, data in events if event == 'chunk')
+        self.assertEqual(chunks, '\\section{Projects}\nBuilt R\\&D tools\nCut costs by 30\\%')
+        self.assertEqual(events[-1][0], 'done')
+        self.assertIn('Built R\\&D tools\nCut costs by 30\\%\n\\end{document}', events[-1][1]['latex_content'])
+    
+    @patch.object(app_module, 'client')
+    def test_stream_reports_errors(self, client):
+        """Test that a failing stream ends with an error event."""
+        client.models.generate_content_stream.side_effect = RuntimeError('quota exceeded')
+        
+        response = self.client.post('/tailor/stream', data={
+            'resume': RESUME,
+            'job_description': 'Python engineer'
+        })
+        
+        self.assertEqual(self.stream_events(response), [('error', {'error': 'quota exceeded'})])
+    
+    @patch.object(app_module, 'client')
+    def test_job_status_is_private(self, client):
+        """Test that another user cannot read a finished job."""
+        client.models.generate_content.return_value = Mock(text=MODEL_OUTPUT)
+        job_id = self.submit(Accept='application/json').get_json()['job_id']
+        
+        other_client = self.login_client('other@example.com')
+        
+        self.assertEqual(other_client.get(f'/tailor/jobs/{job_id}').status_code, 404)
+    
+    @patch.object(app_module, 'client')
+    def test_failed_job_is_private(self, client):
+        """Test that another user cannot read a failed job's error."""
+        client.models.generate_content.side_effect = RuntimeError('quota exceeded')
+        job_id = self.submit(Accept='application/json').get_json()['job_id']
+        
+        other_client = self.login_client('other@example.com')
+        response = other_client.get(f'/tailor/jobs/{job_id}')
+        
+        self.assertEqual(response.status_code, 404)
+        self.assertNotIn('quota', response.get_data(as_text=True))
+        self.assertEqual(other_client.get('/tailor/jobs/unknown').status_code, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+"""Unit tests for tailoring token and latency metrics."""
+import unittest
+from unittest.mock import Mock
+from database import create_app
+from models import db
+from services.metric_counters import DatabaseCounters, MemoryCounters, make_counters
+from services.tailoring_metrics import TailoringMetrics
+
+
+class TestTailoringMetrics(unittest.TestCase):
+    """Test cases for per-mode totals."""
+    
+    def test_totals_and_averages(self):
+        """Test that calls are summed per mode."""
+        metrics = TailoringMetrics(MemoryCounters('tailoring'))
+        metrics.record('section', Mock(prompt_token_count=100, candidates_token_count=30), 1.0)
+        metrics.record('section', Mock(prompt_token_count=50, candidates_token_count=10), 2.0)
+        
+        self.assertEqual(metrics.snapshot(), {'section': {
+            'calls': 2, 'prompt_tokens': 150, 'output_tokens': 40, 'latency': 3.0,
+            'avg_prompt_tokens': 75.0, 'avg_output_tokens': 20.0, 'avg_latency': 1.5
+        }})
+    
+    def test_missing_usage_counts_as_zero(self):
+        """Test that a call without usage metadata is still counted."""
+        metrics = TailoringMetrics()
+        
+        self.assertEqual(metrics.record('document', None, 0.5),
+                         {'prompt_tokens': 0, 'output_tokens': 0, 'latency': 0.5})
+        self.assertEqual(metrics.snapshot()['document']['calls'], 1)
+
+
+class TestDatabaseCounters(unittest.TestCase):
+    """Test cases for counters shared through the database."""
+    
+    def setUp(self):
+        """Set up an in-memory database."""
+        self.app = create_app('testing')
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+    
+    def tearDown(self):
+        """Tear down the database."""
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+    
+    def test_worker_calls_are_visible_to_web_process(self):
+        """Test that totals recorded by one instance are read by another."""
+        worker = TailoringMetrics(DatabaseCounters('tailoring'))
+        web = TailoringMetrics(DatabaseCounters('tailoring'))
+        
+        worker.record('section', Mock(prompt_token_count=120, candidates_token_count=40), 2.5)
+        worker.record('section', Mock(prompt_token_count=80, candidates_token_count=20), 1.5)
+        
+        self.assertEqual(web.snapshot()['section']['prompt_tokens'], 200)
+        self.assertEqual(web.snapshot()['section']['avg_latency'], 2.0)
+    
+    def test_namespaces_are_separate(self):
+        """Test that resetting one namespace keeps the others."""
+        first = DatabaseCounters('first')
+        second = DatabaseCounters('second')
+        first.add({'hits': 1})
+        second.add({'hits': 2})
+        
+        first.reset()
+        
+        self.assertEqual(first.values(), {})
+        self.assertEqual(second.values(), {'hits': 2})
+
+
+class TestMakeCounters(unittest.TestCase):
+    """Test cases for configuration-driven counter selection."""
+    
+    def test_backend_selection(self):
+        """Test that the named store is built."""
+        self.assertIsInstance(make_counters('memory', 'tailoring'), MemoryCounters)
+        self.assertIsInstance(make_counters('database', 'tailoring'), DatabaseCounters)
+        with self.assertRaises(ValueError):
+            make_counters('statsd', 'tailoring')
+
+
+if __name__ == '__main__':
+    unittest.main()
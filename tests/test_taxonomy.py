@@ -0,0 +1,210 @@
+"""Tests for the skill taxonomy and its hot-reloading store."""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from config import Config
+from database import create_app
+from models import db
+from models.job_posting import JobPosting
+from models.resume_version import ResumeVersion
+from models.user import User
+from services.keyword_fingerprints import refresh_fingerprints
+from services.taxonomy import (DEFAULT_TAXONOMY_PATH, InvalidTaxonomy, Taxonomy, TaxonomyStore,
+                               load_taxonomy, skill_taxonomy)
+
+
+def taxonomy_data(version='1', **overrides):
+    data = {
+        'version': version,
+        'skills': {'languages': ['Python', 'Go'], 'tools': ['Kubernetes', 'Docker']},
+        'aliases': {'kubernetes': ['k8s'], 'go': ['golang'], 'statistics': ['stats']},
+        'categories': {
+            'Engineering': {'roles': ['developer'], 'keywords': ['python', 'docker']},
+            'Data Science': {'keywords': ['python', 'statistics']},
+        },
+        'profile_skills': ['Python', 'Go'],
+    }
+    data.update(overrides)
+    return data
+
+
+class TestTaxonomy(unittest.TestCase):
+    """Test cases for compiling a taxonomy."""
+
+    def test_compiles_matcher_and_classifier(self):
+        """Test that aliases resolve to canonical terms in fingerprints and categories."""
+        taxonomy = Taxonomy.from_dict(taxonomy_data())
+
+        self.assertEqual(taxonomy.fingerprint('Golang services on K8s', None), ['go', 'kubernetes'])
+        self.assertEqual(taxonomy.matcher.vocabulary, ('docker', 'go', 'kubernetes', 'python'))
+        self.assertEqual(taxonomy.classifier.classify('Python and stats'), 'Data Science')
+        self.assertEqual(taxonomy.category_rules, (('Engineering', ('developer',)),))
+        self.assertEqual(taxonomy.profile_skills, ('Python', 'Go'))
+        with self.assertRaises(TypeError):
+            taxonomy.skills['languages'] = ('cobol',)
+
+    def test_is_current(self):
+        """Test that only fingerprints tagged with this version are current."""
+        taxonomy = Taxonomy.from_dict(taxonomy_data(version=3))
+
+        self.assertTrue(taxonomy.is_current(['go'], '3'))
+        self.assertFalse(taxonomy.is_current(['go'], '2'))
+        self.assertFalse(taxonomy.is_current(['go'], None))
+        self.assertFalse(taxonomy.is_current(None, '3'))
+
+    def test_invalid_files(self):
+        """Test that inconsistent taxonomies are rejected."""
+        for data in (
+            taxonomy_data(version=None),
+            taxonomy_data(skills={}),
+            taxonomy_data(skills={'languages': 'python'}),
+            taxonomy_data(aliases={'rust': ['rs']}),
+            taxonomy_data(aliases={'go': ['python']}),
+            taxonomy_data(aliases={'go': ['g'], 'python': ['g']}),
+        ):
+            with self.subTest(data=data), self.assertRaises(InvalidTaxonomy):
+                Taxonomy.from_dict(data)
+
+    def test_default_file(self):
+        """Test that the shipped taxonomy loads and keeps the original vocabulary."""
+        taxonomy = load_taxonomy(DEFAULT_TAXONOMY_PATH)
+
+        self.assertIn('machine learning', taxonomy.matcher)
+        self.assertEqual(taxonomy.matcher.find('Postgres on k8s'), {'postgresql', 'kubernetes'})
+        self.assertEqual(list(taxonomy.categories), ['Engineering', 'Data Science', 'Product', 'Design'])
+
+
+class TestTaxonomyStore(unittest.TestCase):
+    """Test cases for loading and hot-reloading taxonomy files."""
+
+    def setUp(self):
+        """Set up a taxonomy file in a temporary directory."""
+        self.directory = tempfile.mkdtemp()
+        self.path = self.write('taxonomy.json', taxonomy_data())
+
+    def tearDown(self):
+        """Remove the files."""
+        shutil.rmtree(self.directory)
+
+    def write(self, name, data, mtime=None):
+        path = os.path.join(self.directory, name)
+        staged = path + '.tmp'
+        with open(staged, 'w', encoding='utf-8') as stream:
+            json.dump(data, stream)
+        os.replace(staged, path)
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+        return path
+
+    def test_reloads_changed_file(self):
+        """Test that a replaced file is picked up and earlier snapshots are unaffected."""
+        store = TaxonomyStore(self.path, refresh_seconds=0)
+        first = store.current()
+        self.assertIs(store.current(), first)
+
+        self.write('taxonomy.json', taxonomy_data(version='2', aliases={}), mtime=os.stat(self.path).st_mtime + 10)
+        second = store.current()
+
+        self.assertEqual(second.version, '2')
+        self.assertEqual(second.matcher.find('k8s'), set())
+        self.assertEqual(first.matcher.find('k8s'), {'kubernetes'})
+
+    def test_refresh_interval(self):
+        """Test that the file is not checked again within refresh_seconds."""
+        store = TaxonomyStore(self.path, refresh_seconds=3600)
+        store.current()
+        self.write('taxonomy.json', taxonomy_data(version='2'), mtime=os.stat(self.path).st_mtime + 10)
+
+        self.assertEqual(store.current().version, '1')
+        self.assertEqual(store.reload().version, '2')
+
+    def test_invalid_edit_keeps_previous(self):
+        """Test that a broken edit leaves the loaded taxonomy in place."""
+        store = TaxonomyStore(self.path, refresh_seconds=0)
+        store.current()
+        self.write('taxonomy.json', taxonomy_data(version='2', skills={}), mtime=os.stat(self.path).st_mtime + 10)
+
+        self.assertEqual(store.current().version, '1')
+        self.assertIn('skills', store.last_error)
+        with self.assertRaises(InvalidTaxonomy):
+            store.reload()
+
+    def test_yaml_file(self):
+        """Test loading a YAML taxonomy."""
+        path = os.path.join(self.directory, 'taxonomy.yaml')
+        with open(path, 'w', encoding='utf-8') as stream:
+            stream.write('version: 2024.1\n'
+                         'skills:\n  databases: [PostgreSQL]\n'
+                         'aliases:\n  postgresql: [postgres]\n')
+
+        taxonomy = load_taxonomy(path)
+
+        self.assertEqual(taxonomy.version, '2024.1')
+        self.assertEqual(taxonomy.fingerprint('Postgres'), ['postgresql'])
+
+
+class TestRefreshFingerprints(unittest.TestCase):
+    """Database tests for recomputing fingerprints after a taxonomy change."""
+
+    def setUp(self):
+        """Set up an in-memory database with fingerprints from an older taxonomy."""
+        self.app = create_app('testing')
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+        user = User(email='taxonomy@example.com')
+        user.set_password('testpassword')
+        db.session.add(user)
+        db.session.commit()
+        db.session.add_all([
+            ResumeVersion(user_id=user.id, name='Platform', latex_content='Go services on k8s',
+                          keyword_fingerprint=['go'], keyword_taxonomy_version='0'),
+            ResumeVersion(user_id=user.id, name='Backfill', latex_content='Postgres'),
+            JobPosting(title='SRE', company='Acme', description='K8s and Postgres', requirements=[],
+                       keyword_fingerprint=[], keyword_taxonomy_version='0'),
+        ])
+        db.session.commit()
+
+    def tearDown(self):
+        """Tear down the database and restore the shipped taxonomy."""
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+        skill_taxonomy.configure(DEFAULT_TAXONOMY_PATH, Config.SKILL_TAXONOMY_REFRESH)
+
+    def test_refreshes_stale_rows(self):
+        """Test that stale rows are recomputed once and tagged with the current version."""
+        version = skill_taxonomy.current().version
+
+        self.assertEqual(refresh_fingerprints(batch_size=1), (2, 1))
+        self.assertEqual(refresh_fingerprints(), (0, 0))
+
+        platform, backfill = ResumeVersion.query.order_by(ResumeVersion.id).all()
+        self.assertEqual(platform.keyword_fingerprint, ['go', 'kubernetes'])
+        self.assertEqual(backfill.keyword_fingerprint, ['postgresql'])
+        self.assertEqual({platform.keyword_taxonomy_version, backfill.keyword_taxonomy_version}, {version})
+        self.assertEqual(JobPosting.query.one().keyword_fingerprint, ['kubernetes', 'postgresql'])
+
+    def test_new_taxonomy_version_invalidates(self):
+        """Test that loading a new taxonomy version makes every fingerprint stale."""
+        refresh_fingerprints()
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'taxonomy.json')
+            with open(path, 'w', encoding='utf-8') as stream:
+                json.dump(taxonomy_data(version='next'), stream)
+            skill_taxonomy.configure(path)
+
+            self.assertEqual(refresh_fingerprints(), (2, 1))
+        finally:
+            shutil.rmtree(directory)
+
+        self.assertEqual(ResumeVersion.query.filter_by(keyword_taxonomy_version='next').count(), 2)
+        self.assertEqual(ResumeVersion.query.filter_by(name='Backfill').one().keyword_fingerprint, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+"""Tests for the visa sponsorship lookup."""
+import unittest
+
+from database import create_app
+from models import db
+from models.visa_sponsorship_data import VisaSponsorshipData
+from services.visa_sponsorship_service import (
+    Sponsor, SponsorDirectory, VisaSponsorshipLookup, normalize_company
+)
+
+
+class TestNormalizeCompany(unittest.TestCase):
+    """Test cases for normalize_company."""
+
+    def test_variants_share_a_key(self):
+        """Test that case, punctuation, accents and legal suffixes are ignored."""
+        for name in ('Google', 'google', 'Google LLC', 'GOOGLE, Inc.', ' Google  Corp '):
+            self.assertEqual(normalize_company(name), 'google')
+        self.assertEqual(normalize_company('Nestlé S.A.'), 'nestle s a')
+        self.assertEqual(normalize_company('Procter & Gamble Co.'), 'procter and gamble')
+        self.assertEqual(normalize_company('The Walt Disney Company'), 'walt disney')
+
+    def test_suffix_only_names(self):
+        """Test that a name made only of suffixes is kept."""
+        self.assertEqual(normalize_company('The Company'), 'the company')
+        self.assertEqual(normalize_company(''), '')
+
+
+class TestSponsorDirectory(unittest.TestCase):
+    """Test cases for exact and fuzzy resolution."""
+
+    def setUp(self):
+        """Set up a directory of a few sponsors."""
+        self.directory = SponsorDirectory([
+            Sponsor('Google', ('H1B',), 10, 0, 100.0),
+            Sponsor('Amazon', ('H1B', 'L1'), 9, 1, 90.0),
+            Sponsor('Microsoft Corporation', ('H1B',), 1, 1, 50.0),
+            Sponsor('Apple Inc.', ('H1B',), 5, 0, 100.0),
+        ])
+
+    def test_exact_and_fuzzy(self):
+        """Test normalized hits, near misses and unknown companies."""
+        self.assertEqual(self.directory.resolve('Google LLC').company_name, 'Google')
+        self.assertEqual(self.directory.resolve('Amazon.com, Inc.').company_name, 'Amazon')
+        self.assertEqual(self.directory.resolve('Microsof Corp').company_name, 'Microsoft Corporation')
+        self.assertIsNone(self.directory.resolve('Initech'))
+
+    def test_longer_names_do_not_match(self):
+        """Test that a different employer containing a sponsor's name is not resolved to it."""
+        self.assertIsNone(self.directory.resolve('Apple Bank'))
+        self.assertIsNone(self.directory.resolve('Amazon Web Services'))
+        self.assertEqual(self.directory.resolve('Aple Inc').company_name, 'Apple Inc.')
+
+    def test_resolutions_are_remembered(self):
+        """Test that a raw name is resolved once."""
+        self.directory.resolve('Amazon.com, Inc.')
+        self.assertIn('Amazon.com, Inc.', self.directory.resolved)
+
+
+class TestVisaSponsorshipLookup(unittest.TestCase):
+    """Database tests for loading and refreshing the lookup."""
+
+    def setUp(self):
+        """Set up an in-memory database with one sponsor."""
+        self.app = create_app('testing')
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        db.create_all()
+        db.session.add(VisaSponsorshipData(company_name='Google', visa_types_sponsored=['H1B', 'O1'],
+                                           h1b_approvals=1500, h1b_denials=100))
+        db.session.commit()
+        self.lookup = VisaSponsorshipLookup(refresh_seconds=0)
+
+    def tearDown(self):
+        """Tear down the database."""
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def test_lookup(self):
+        """Test that the approval rate is precomputed and matches the model."""
+        sponsor = self.lookup.lookup('Google LLC')
+
+        self.assertEqual(sponsor.h1b_approval_rate, VisaSponsorshipData.query.one().h1b_approval_rate)
+        self.assertEqual(sponsor.visa_types_sponsored, ('H1B', 'O1'))
+        self.assertTrue(sponsor.sponsors_visas)
+        self.assertIsNone(self.lookup.lookup(None))
+
+    def test_reloads_when_data_changes(self):
+        """Test that new and updated rows are picked up, and unchanged data is not reloaded."""
+        directory = self.lookup.directory()
+        self.assertIs(self.lookup.directory(), directory)
+
+        db.session.add(VisaSponsorshipData(company_name='Stripe', visa_types_sponsored=['H1B']))
+        db.session.commit()
+        self.assertEqual(self.lookup.lookup('Stripe, Inc.').company_name, 'Stripe')
+
+        VisaSponsorshipData.query.filter_by(company_name='Google').one().h1b_denials = 500
+        db.session.commit()
+        self.assertEqual(self.lookup.lookup('Google').h1b_approval_rate, 75.0)
+
+
+if __name__ == '__main__':
+    unittest.main()